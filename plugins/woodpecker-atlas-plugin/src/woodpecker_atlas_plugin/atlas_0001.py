@@ -86,6 +86,7 @@ class AtlasEncodingCleanup(FixFunction):
     priority = 20
     dataset = "ATLAS"
     labels = [Labels.RISK_ENCODING_METADATA]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         source = lower_source_name(dataset)
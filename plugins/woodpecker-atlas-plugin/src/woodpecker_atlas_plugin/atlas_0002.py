@@ -36,6 +36,7 @@ class AtlasProjectIdNormalization(FixFunction):
     priority = 21
     dataset = "ATLAS"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         source = lower_source_name(dataset)
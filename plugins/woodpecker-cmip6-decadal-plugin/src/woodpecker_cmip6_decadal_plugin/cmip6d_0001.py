@@ -30,6 +30,7 @@ class DecadalTimeMetadata(FixFunction):
     priority = 10
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
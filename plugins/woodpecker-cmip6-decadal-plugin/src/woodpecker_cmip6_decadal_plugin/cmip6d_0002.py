@@ -74,6 +74,7 @@ class DecadalCalendarNormalization(FixFunction):
     priority = 11
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
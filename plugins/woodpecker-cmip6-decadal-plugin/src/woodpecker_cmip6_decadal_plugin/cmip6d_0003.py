@@ -43,6 +43,7 @@ class DecadalRealizationVariable(FixFunction):
     priority = 12
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_VARIABLE_CREATION]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
@@ -34,6 +34,7 @@ class DecadalCoordinatesEncodingCleanup(FixFunction):
     priority = 13
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_ENCODING_METADATA]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
@@ -35,6 +35,7 @@ class DecadalRealizationDtypeNormalization(FixFunction):
     priority = 15
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_DTYPE_TRANSFORMATION]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
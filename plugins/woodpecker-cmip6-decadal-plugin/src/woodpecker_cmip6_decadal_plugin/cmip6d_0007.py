@@ -34,6 +34,7 @@ class DecadalFillValueEncodingCleanup(FixFunction):
     priority = 16
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_ENCODING_METADATA]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
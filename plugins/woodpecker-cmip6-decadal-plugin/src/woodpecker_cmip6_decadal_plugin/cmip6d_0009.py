@@ -45,6 +45,7 @@ class DecadalStartTokenNormalization(FixFunction):
     priority = 18
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
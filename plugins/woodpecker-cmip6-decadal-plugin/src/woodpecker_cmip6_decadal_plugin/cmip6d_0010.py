@@ -32,6 +32,7 @@ class DecadalRealizationLongNameNormalization(FixFunction):
     priority = 19
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
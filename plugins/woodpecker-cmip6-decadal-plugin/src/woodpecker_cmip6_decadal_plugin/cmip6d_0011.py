@@ -44,6 +44,7 @@ class DecadalRealizationIndexNormalization(FixFunction):
     priority = 20
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
@@ -73,6 +73,7 @@ class DecadalModelGlobalAttributes(FixFunction):
     priority = 22
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
@@ -104,6 +104,7 @@ class DecadalReftimeCoordinate(FixFunction):
     priority = 23
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_DERIVED_COORDINATE_CREATION]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
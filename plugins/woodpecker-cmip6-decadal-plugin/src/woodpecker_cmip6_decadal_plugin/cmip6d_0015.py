@@ -90,6 +90,7 @@ class DecadalLeadtimeCoordinate(FixFunction):
     priority = 24
     dataset = "CMIP6-decadal"
     labels = [Labels.RISK_COORDINATE_TRANSFORMATION]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return is_cmip6_decadal_netcdf(dataset)
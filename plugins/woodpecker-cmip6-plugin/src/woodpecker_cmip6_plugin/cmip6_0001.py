@@ -20,6 +20,7 @@ class Cmip6DummyPlaceholder(FixFunction):
     priority = 40
     dataset = "cmip6"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return _is_cmip6_non_decadal(dataset)
@@ -32,6 +32,7 @@ class EnsureProjectIdIsPresent(FixFunction):
     priority = 41
     dataset = "CMIP7"
     labels = [Labels.RISK_METADATA_ONLY]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return _needs_project_id(dataset)
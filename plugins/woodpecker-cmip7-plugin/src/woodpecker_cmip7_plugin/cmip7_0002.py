@@ -28,6 +28,7 @@ class RenameTempVariableToTas(FixFunction):
     priority = 42
     dataset = "CMIP7"
     labels = [Labels.RISK_REVERSIBLE_RENAME]
+    requires_data = False
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return _needs_temp_to_tas_rename(dataset)
@@ -79,6 +79,7 @@ class ConfigurableCmip7ReformatBridge(FixFunction):
     priority = 43
     dataset = "CMIP7"
     labels = [Labels.RISK_WORKFLOW_TRANSFORMATION]
+    requires_data = False
 
     def _config(self) -> dict[str, Any]:
         return getattr(self, "config", {}) or {}
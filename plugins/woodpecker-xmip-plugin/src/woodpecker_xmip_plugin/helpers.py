@@ -6,6 +6,24 @@ from collections.abc import Mapping
 import numpy as np
 import xarray as xr
 
+try:
+    from woodpecker.fixes.common.helpers import MemoizedTransform
+except ImportError:  # older core without woodpecker.fixes.common.helpers.MemoizedTransform
+
+    class MemoizedTransform:  # type: ignore[no-redef]
+        """Fallback that runs ``transform`` on every call."""
+
+        def transform(self, dataset: xr.Dataset) -> xr.Dataset:
+            return dataset
+
+        def _transform_result(self, dataset: xr.Dataset) -> tuple[xr.Dataset, bool]:
+            transformed = self.transform(dataset)
+            return transformed, not dataset.identical(transformed)
+
+        def _forget_transform(self) -> None:
+            pass
+
+
 DROP_COORDS = ("bnds", "vertex")
 DESIRED_UNITS = {"lev": "m"}
 UNIT_OVERRIDES = {"so": None}
@@ -423,7 +441,3 @@ def overwrite_dataset_in_place(target: xr.Dataset, source: xr.Dataset) -> None:
     target.attrs.update(source.attrs)
     target.encoding.clear()
     target.encoding.update(source.encoding)
-
-
-def dataset_changed(before: xr.Dataset, after: xr.Dataset) -> bool:
-    return not before.identical(after)
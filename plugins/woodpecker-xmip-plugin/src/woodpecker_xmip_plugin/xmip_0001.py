@@ -9,10 +9,10 @@ from woodpecker.fixes.registry import FixFunction, register_fix_function
 
 from .helpers import (
     DROP_COORDS,
+    MemoizedTransform,
     broadcast_lonlat,
     correct_coordinates,
     correct_units,
-    dataset_changed,
     fix_metadata,
     is_cmip6_dataset,
     maybe_convert_bounds_to_vertex,
@@ -25,19 +25,16 @@ from .helpers import (
 )
 
 
-class XmipCmip6Transform(FixFunction):
+class XmipCmip6Transform(MemoizedTransform, FixFunction):
     categories: ClassVar[list[str]] = ["structure"]
     priority = 42
     dataset = "CMIP6"
     message: ClassVar[str] = "dataset can be normalized"
 
-    def transform(self, dataset: xr.Dataset) -> xr.Dataset:
-        return dataset
-
     def matches(self, dataset: xr.Dataset) -> bool:
         if not is_cmip6_dataset(dataset):
             return False
-        return dataset_changed(dataset, self.transform(dataset))
+        return self._transform_result(dataset)[1]
 
     def check(self, dataset: xr.Dataset) -> list[str]:
         if not self.matches(dataset):
@@ -48,14 +45,15 @@ class XmipCmip6Transform(FixFunction):
         if not is_cmip6_dataset(dataset):
             return False
 
-        transformed = self.transform(dataset)
-        if not dataset_changed(dataset, transformed):
+        transformed, changed = self._transform_result(dataset)
+        if not changed:
             return False
 
         if dry_run:
             return True
 
         overwrite_dataset_in_place(dataset, transformed)
+        self._forget_transform()
         return True
 
 
@@ -8,6 +8,7 @@ The corresponding original implementation lives in:
 https://github.com/jbusecke/xMIP/blob/main/xmip/preprocessing.py
 """
 
+import importlib
 import itertools
 
 import numpy as np
@@ -471,3 +472,48 @@ def test_xmip_nominal_xy_plan_includes_nominal_coordinate_replacement():
     assert step_ids.index("xmip.replace_xy_with_nominal_lon_lat") > step_ids.index(
         "woodpecker.normalize_longitude_convention"
     )
+
+
+def test_xmip_transform_is_computed_once_per_dataset_state(monkeypatch):
+    dataset = _raw_cmip6_dataset()
+    fix = FixFunctionRegistry.instantiate("xmip.rename_cmip6_axes")
+    calls = []
+    original = type(fix).transform
+
+    def counting_transform(self, ds):
+        calls.append(ds)
+        return original(self, ds)
+
+    monkeypatch.setattr(type(fix), "transform", counting_transform)
+
+    assert fix.matches(dataset)
+    assert fix.check(dataset)
+    assert fix.apply(dataset, dry_run=True)
+    assert len(calls) == 1
+
+    assert fix.apply(dataset, dry_run=False)
+    assert not fix.matches(dataset)
+    assert len(calls) == 2
+
+
+def test_xmip_helpers_fall_back_without_core_transform_memo(monkeypatch):
+    from woodpecker_xmip_plugin import helpers
+
+    import woodpecker.fixes.common.helpers as core_helpers
+
+    monkeypatch.delattr(core_helpers, "MemoizedTransform")
+    try:
+        fallback = importlib.reload(helpers).MemoizedTransform
+        assert fallback.__module__ == helpers.__name__
+
+        class _Transform(fallback):
+            def transform(self, dataset: xr.Dataset) -> xr.Dataset:
+                return dataset.rename({"tas": "temp"})
+
+        dataset = make_cmip6()
+        transformed, changed = _Transform()._transform_result(dataset)
+        assert changed
+        assert "temp" in transformed
+    finally:
+        monkeypatch.undo()
+        importlib.reload(helpers)
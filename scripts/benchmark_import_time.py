@@ -0,0 +1,100 @@
+"""Measure ``import woodpecker`` and ``woodpecker --help`` startup latency.
+
+Each measurement runs in a fresh interpreter. ``import woodpecker`` is timed
+with ``python -X importtime`` (cumulative microseconds of the ``woodpecker``
+package), ``woodpecker --help`` by wall time of the whole process. Use the
+budgets as a regression guard, e.g. in CI:
+
+    python scripts/benchmark_import_time.py --max-import-ms 150 --max-help-ms 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+HEAVY_MODULES = ("xarray", "pandas", "pydantic", "prov", "duckdb", "yaml", "woodpecker.fixes")
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Return cumulative import microseconds per top-level-most occurrence of each module."""
+    totals: dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            totals.setdefault(match.group(4), int(match.group(2)))
+    return totals
+
+
+def measure_import(statement: str = "import woodpecker") -> tuple[float, dict[str, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals = parse_importtime(result.stderr)
+    return totals.get("woodpecker", 0) / 1000, totals
+
+
+def measure_help() -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "woodpecker.cli", "--help"],
+        capture_output=True,
+        check=True,
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement.")
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-help-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args(argv)
+
+    import_runs = [measure_import() for _ in range(args.repeat)]
+    help_runs = [measure_help() for _ in range(args.repeat)]
+    import_ms = statistics.median(run[0] for run in import_runs)
+    help_ms = statistics.median(help_runs)
+    _, totals = import_runs[-1]
+    _, help_totals = measure_import("import woodpecker.cli")
+    heavy = sorted(name for name in HEAVY_MODULES if name in {*totals, *help_totals})
+    slowest = sorted(totals.items(), key=lambda item: item[1], reverse=True)[: args.top]
+
+    report = {
+        "import_woodpecker_ms": round(import_ms, 1),
+        "woodpecker_help_ms": round(help_ms, 1),
+        "heavy_modules_at_startup": heavy,
+        "slowest_imports_ms": {name: round(value / 1000, 1) for name, value in slowest},
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import woodpecker: {import_ms:.1f} ms (median of {args.repeat})")
+        print(f"woodpecker --help: {help_ms:.1f} ms (median of {args.repeat})")
+        print(f"heavy modules at startup: {', '.join(heavy) or '-'}")
+        for name, value in slowest:
+            print(f"  {value / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"import woodpecker exceeds {args.max_import_ms} ms", file=sys.stderr)
+        failed = True
+    if args.max_help_ms is not None and help_ms > args.max_help_ms:
+        print(f"woodpecker --help exceeds {args.max_help_ms} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
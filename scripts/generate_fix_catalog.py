@@ -26,7 +26,7 @@ def _non_severity_titles(label_ids: list[str]) -> list[str]:
 
 
 def generate_catalog(md_path: str = "docs/FIXES.md", json_path: str = "docs/FIXES.json"):
-    fixes = FixFunctionRegistry.discover()
+    fixes = FixFunctionRegistry.describe()
 
     md_lines = [
         "# Generated Fixes Reference",
@@ -11,7 +11,7 @@ from woodpecker.fixes.registry import FixFunctionRegistry
 
 
 def main():
-    fixes = FixFunctionRegistry.discover()
+    fixes = FixFunctionRegistry.describe()
     fix_dicts = []
     core_count = 0
     plugin_count = 0
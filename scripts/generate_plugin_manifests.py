@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+# Import fixes to ensure registration
+import woodpecker.fixes  # noqa: F401
+from woodpecker.fixes.plugins import (
+    _entry_point_package,
+    _iter_plugin_entry_points,
+    write_plugin_manifest,
+)
+
+
+def generate_manifests() -> None:
+    for entry in _iter_plugin_entry_points():
+        package = _entry_point_package(entry)
+        if not package:
+            continue
+        path = write_plugin_manifest(package)
+        print(f"Generated {path}")
+
+
+if __name__ == "__main__":
+    generate_manifests()
@@ -4,11 +4,14 @@ from pathlib import Path
 from typing import Callable, Iterator, Tuple
 
 import pytest
+import xarray as xr
 from click.testing import CliRunner
 
 from woodpecker.fixes.identifiers import IdentifierResolver
 from woodpecker.fixes.registry import FixFunctionRegistry
 from woodpecker.identity import registry as identity_registry
+from woodpecker.io import NetCDFInput
+from woodpecker.testing import make_cmip6
 
 # Shared test-data fixtures for lightweight NetCDF-style tests.
 #
@@ -18,6 +21,7 @@ from woodpecker.identity import registry as identity_registry
 # - path fixtures (e.g. `cmip6_member_file`) for simple unit tests
 # - `make_placeholder_netcdf_path` for custom filenames
 # - `isolated_cli_workspace` for CLI tests that need a clean cwd
+# - `write_netcdf_inputs` for runner tests that need real NetCDF files
 
 
 PLACEHOLDER_NETCDF_CONTENT = "placeholder-netcdf-path\n"
@@ -92,3 +96,54 @@ def isolated_cli_workspace(
             return path
 
         yield cli_runner, _make
+
+
+class LoadCountingInput(NetCDFInput):
+    """NetCDF input that counts how often any instance opens its file."""
+
+    loads = 0
+
+    def _open(self, **kwargs) -> xr.Dataset:
+        type(self).loads += 1
+        return super()._open(**kwargs)
+
+
+class NetCDFInputWriter:
+    """Write small CMIP6 NetCDF files and return them as load-counting inputs."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.loads = 0
+
+    @property
+    def loads(self) -> int:
+        return LoadCountingInput.loads
+
+    @loads.setter
+    def loads(self, value: int) -> None:
+        LoadCountingInput.loads = value
+
+    def __call__(
+        self,
+        count: int,
+        directory: Path | None = None,
+        *,
+        degc: Callable[[int], bool] = lambda index: True,
+    ) -> list[LoadCountingInput]:
+        """Write *count* inputs; those selected by *degc* store ``tas`` in degC."""
+        directory = directory or self.directory
+        inputs = []
+        for index in range(count):
+            ds = make_cmip6(periods=1, nlat=2, nlon=3)
+            if degc(index):
+                ds["tas"].attrs["units"] = "degC"
+            path = directory / f"cmip6_{index}.nc"
+            ds.to_netcdf(path)
+            inputs.append(LoadCountingInput(source_path=path))
+        return inputs
+
+
+@pytest.fixture
+def write_netcdf_inputs(tmp_path: Path) -> NetCDFInputWriter:
+    """Return a writer for small NetCDF inputs; ``.loads`` counts their opens."""
+    return NetCDFInputWriter(tmp_path)
@@ -89,6 +89,23 @@ def test_output_adapter_target_paths_for_path_inputs():
     assert netcdf_adapter.target_path(zarr_input) == Path("example.nc")
 
 
+def test_output_dir_mirrors_source_tree(tmp_path: Path):
+    root = tmp_path / "archive"
+    out = tmp_path / "out"
+    nested = NetCDFInput(source_path=root / "CMIP6" / "tas.nc")
+    store = ZarrInput(source_path=root / "pr.zarr")
+    outside = NetCDFInput(source_path=tmp_path / "elsewhere" / "tas.nc")
+
+    zarr_adapter = get_output_adapter("zarr", output_dir=out, source_root=root)
+    auto_adapter = get_output_adapter("auto", output_dir=out, source_root=root)
+
+    assert get_output_adapter("auto") is None
+    assert zarr_adapter.target_path(nested) == out / "CMIP6" / "tas.zarr"
+    assert auto_adapter.target_path(nested) == out / "CMIP6" / "tas.nc"
+    assert auto_adapter.target_path(store) == out / "pr.zarr"
+    assert auto_adapter.target_path(outside) == out / outside.source_path.relative_to("/")
+
+
 def test_io_availability_report_has_expected_keys():
     report = get_io_availability()
 
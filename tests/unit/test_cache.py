@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from woodpecker.cache import CACHE_DIR_ENV, ResultCache, resolve_result_cache
+from woodpecker.fixes.common import EnsureLatitudeIsIncreasing, NormalizeTasUnitsToKelvin
+from woodpecker.io.backends.nc import netcdf_backend_available
+from woodpecker.runner import run_check, run_fix
+
+pytestmark = [
+    pytest.mark.io_backend,
+    pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed"),
+]
+
+
+def test_run_check_serves_unchanged_inputs_from_cache(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(2)
+    cache = ResultCache(tmp_path / "cache")
+    fixes = [NormalizeTasUnitsToKelvin(), EnsureLatitudeIsIncreasing()]
+
+    first = run_check(inputs, fixes, cache=cache)
+    second = run_check(inputs, fixes, cache=cache)
+
+    assert first and second == first
+    assert write_netcdf_inputs.loads == 2
+    assert cache.stats() == {"cache_hits": 2, "cache_misses": 2}
+
+
+def test_run_check_cache_is_invalidated_by_file_and_config_changes(
+    tmp_path: Path, write_netcdf_inputs
+):
+    inputs = write_netcdf_inputs(2)
+    cache = ResultCache(tmp_path / "cache")
+    fixes = [NormalizeTasUnitsToKelvin()]
+    run_check(inputs, fixes, cache=cache)
+
+    path = inputs[0].source_path
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    run_check(inputs, fixes, cache=cache)
+    assert cache.stats() == {"cache_hits": 1, "cache_misses": 3}
+
+    run_check(inputs, [NormalizeTasUnitsToKelvin().configure({"x": 1})], cache=cache)
+    assert cache.misses == 5
+
+
+def test_content_hash_cache_ignores_touched_files(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(2)
+    cache = ResultCache(tmp_path / "cache", hash_content=True)
+    fixes = [NormalizeTasUnitsToKelvin()]
+    run_check(inputs, fixes, cache=cache)
+
+    path = inputs[0].source_path
+    os.utime(path, ns=(0, 0))
+    run_check(inputs, fixes, cache=cache)
+
+    assert cache.stats() == {"cache_hits": 2, "cache_misses": 2}
+
+
+def test_run_fix_dry_run_uses_cache_and_reports_counters(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(2)
+    cache = ResultCache(tmp_path / "cache")
+    fixes = [NormalizeTasUnitsToKelvin()]
+
+    first = run_fix(inputs, fixes, dry_run=True, cache=cache)
+    second = run_fix(inputs, fixes, dry_run=True, cache=cache)
+
+    assert (first["cache_hits"], first["cache_misses"]) == (0, 2)
+    assert (second["cache_hits"], second["cache_misses"]) == (2, 0)
+    assert second["preview"] == first["preview"]
+    assert write_netcdf_inputs.loads == 2
+
+
+def test_run_fix_write_bypasses_cache(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(2)
+    cache = ResultCache(tmp_path / "cache")
+    fixes = [NormalizeTasUnitsToKelvin()]
+    run_fix(inputs, fixes, dry_run=True, cache=cache)
+
+    stats = run_fix(inputs, fixes, dry_run=False, cache=cache)
+
+    assert (stats["cache_hits"], stats["cache_misses"]) == (0, 0)
+    assert stats["persisted"] == 2
+
+
+def test_resolve_result_cache_uses_env_and_can_be_disabled(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    assert resolve_result_cache() is None
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    cache = resolve_result_cache()
+    assert cache is not None and cache.directory == tmp_path
+    assert resolve_result_cache(enabled=False) is None
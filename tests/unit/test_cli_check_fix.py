@@ -6,6 +6,7 @@ import pytest
 from click.testing import CliRunner
 
 from woodpecker.cli import cli
+from woodpecker.io import EncodingPolicy
 
 pytestmark = pytest.mark.filterwarnings("ignore:.*Failed to read NetCDF input.*")
 
@@ -262,3 +263,455 @@ def test_fix_strict_io_flag_is_forwarded(
 
     assert result.exit_code == 0
     assert captured.get("strict_io") is True
+
+
+def test_check_and_fix_jobs_option_is_forwarded(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_check(*args, **kwargs):
+        captured["check"] = kwargs
+        return []
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    check_result = runner.invoke(cli, ["check", ".", *select, "--jobs", "4"])
+    fix_result = runner.invoke(cli, ["fix", ".", *select, "-j", "2", "--format", "json"])
+    invalid_result = runner.invoke(cli, ["check", ".", *select, "--jobs", "0"])
+
+    assert check_result.exit_code == 0
+    assert fix_result.exit_code == 0
+    assert captured["check"]["jobs"] == 4
+    assert captured["fix"]["jobs"] == 2
+    assert invalid_result.exit_code != 0
+
+
+def test_check_and_fix_schedule_options_are_forwarded(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_check(*args, **kwargs):
+        captured["check"] = kwargs
+        return []
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    schedule = ["--schedule", "largest-first", "--max-inflight-memory", "2G", "--chunks", "time=12"]
+    runner.invoke(cli, ["check", ".", *select, "-j", "2", *schedule])
+    runner.invoke(cli, ["fix", ".", *select, "--dry-run", "--no-provenance", *schedule])
+    invalid_result = runner.invoke(cli, ["check", ".", *select, "--max-inflight-memory", "lots"])
+
+    for command in ("check", "fix"):
+        assert captured[command]["schedule"] == "largest-first"
+        assert captured[command]["max_inflight_memory"] == 2 * 2**30
+        assert captured[command]["chunks"] == {"time": 12}
+    assert invalid_result.exit_code != 0
+    assert "Invalid byte size" in invalid_result.output
+
+
+def test_check_and_fix_cache_options_are_forwarded(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+    monkeypatch.delenv("WOODPECKER_CACHE_DIR", raising=False)
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_check(*args, **kwargs):
+        captured["check"] = kwargs
+        return []
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    runner.invoke(cli, ["check", ".", *select, "--cache-dir", "cache"])
+    runner.invoke(cli, ["fix", ".", *select, "--dry-run", "--no-provenance", "--no-cache"])
+
+    assert captured["check"]["cache"].directory == Path("cache")
+    assert captured["fix"]["cache"] is None
+
+
+def test_fix_journal_options_are_forwarded(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    base = ["fix", ".", *select, "--dry-run", "--no-provenance"]
+    result = runner.invoke(cli, [*base, "--journal", "run.jsonl", "--resume"])
+    invalid_result = runner.invoke(cli, [*base, "--resume"])
+
+    assert result.exit_code == 0
+    assert captured["fix"]["journal"].path == Path("run.jsonl")
+    assert captured["fix"]["journal"].resume is True
+    assert invalid_result.exit_code != 0
+    assert "--resume requires --journal" in invalid_result.output
+
+
+def test_check_and_fix_walk_options_filter_directory_inputs(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+    make_placeholder_netcdf_path("other.nc")
+    Path("nested").mkdir()
+    make_placeholder_netcdf_path("nested/deep.nc")
+
+    captured: dict[str, list[str]] = {}
+
+    def _fake_run_check(context, **kwargs):
+        captured["check"] = [item.source_name for item in context.inputs]
+        return []
+
+    def _fake_run_fix(context, **kwargs):
+        captured["fix"] = [item.source_name for item in context.inputs]
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    walk = ["--exclude", "other.nc", "--max-depth", "1"]
+    runner.invoke(cli, ["check", ".", *select, *walk])
+    runner.invoke(cli, ["fix", ".", *select, "--dry-run", "--no-provenance", "--include", "*deep*"])
+
+    assert captured["check"] == ["cmip6_case.nc"]
+    assert captured["fix"] == ["deep.nc"]
+
+
+def test_check_streams_inputs_and_counts_them_during_the_run(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_a.nc")
+    make_placeholder_netcdf_path("cmip6_b.nc")
+
+    def _fake_run_check(context, **kwargs):
+        inputs = iter(context.inputs)
+        assert context.inputs.count == 0
+        next(inputs)
+        assert context.inputs.count == 1
+        list(inputs)
+        return []
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+
+    result = runner.invoke(
+        cli, ["check", ".", "--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "No issues found (2 NetCDF files scanned, 1 fixes selected)." in result.output
+
+
+def test_check_and_fix_read_inputs_from_manifests(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("direct.nc")
+    Path("inputs.txt").write_text("listed.nc\n", encoding="utf-8")
+    Path("inputs.jsonl").write_text('{"path": "typed.nc", "dataset_type": "cmip6"}\n')
+
+    captured: dict[str, list[tuple[str, dict]]] = {}
+
+    def _fake_run_check(context, **kwargs):
+        captured["check"] = [(item.source_name, item.metadata) for item in context.inputs]
+        return []
+
+    def _fake_run_fix(context, **kwargs):
+        captured["fix"] = [(item.source_name, item.metadata) for item in context.inputs]
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    runner.invoke(cli, ["check", "direct.nc", "@inputs.txt", *select])
+    runner.invoke(
+        cli,
+        ["fix", "--from-manifest", "inputs.jsonl", *select, "--dry-run", "--no-provenance"],
+    )
+    missing = runner.invoke(cli, ["check", "@missing.txt", *select])
+
+    assert captured["check"] == [("direct.nc", {}), ("listed.nc", {})]
+    assert captured["fix"] == [("typed.nc", {"dataset_type": "cmip6"})]
+    assert missing.exit_code == 2
+    assert "Path '@missing.txt' does not exist." in missing.output
+
+
+def test_check_group_shards_combines_split_files(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("tas_day_gn_2000-2004.nc")
+    make_placeholder_netcdf_path("tas_day_gn_2005-2009.nc")
+    make_placeholder_netcdf_path("single.nc")
+
+    captured: dict[str, list[str]] = {}
+
+    def _fake_run_check(context, **kwargs):
+        captured["check"] = [type(item).__name__ for item in context.inputs]
+        return []
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    runner.invoke(cli, ["check", ".", *select, "--group-shards", "time-range"])
+    invalid = runner.invoke(cli, ["check", ".", *select, "--group-shards", "("])
+
+    assert captured["check"] == ["NetCDFInput", "MultiFileInput"]
+    assert "Invalid shard grouping" in invalid.output
+
+
+def test_check_and_fix_share_a_dataset_cache_for_the_run(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    from woodpecker.io.dataset_cache import active_dataset_cache
+
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, object] = {}
+
+    def _fake_run_check(context, **kwargs):
+        captured["check"] = active_dataset_cache()
+        return []
+
+    def _fake_run_fix(context, **kwargs):
+        captured["fix"] = active_dataset_cache()
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    runner.invoke(cli, ["check", ".", *select, "--dataset-cache", "64M"])
+    assert captured["check"].max_bytes == 64 * 2**20
+    runner.invoke(cli, ["fix", ".", *select, "--dry-run", "--no-provenance"])
+    assert captured["fix"].max_bytes == 256 * 2**20
+    runner.invoke(cli, ["check", ".", *select, "--dataset-cache", "0"])
+    invalid = runner.invoke(cli, ["check", ".", *select, "--dataset-cache", "lots"])
+
+    assert captured["check"] is None
+    assert active_dataset_cache() is None
+    assert "Invalid byte size" in invalid.output
+
+
+def test_fix_keep_backup_is_forwarded(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    result = runner.invoke(cli, ["fix", ".", *select, "--no-provenance", "--keep-backup"])
+
+    assert result.exit_code == 0
+    assert captured["fix"]["keep_backup"] is True
+
+
+def test_fix_output_dir_and_writers_are_forwarded(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    options = ["--output-dir", "fixed", "--writers", "2"]
+    result = runner.invoke(cli, ["fix", ".", *select, "--no-provenance", *options])
+
+    assert result.exit_code == 0
+    assert captured["fix"]["output_dir"] == Path("fixed")
+    assert captured["fix"]["writers"] == 2
+    assert captured["fix"]["encoding"] is None
+
+
+def test_fix_encoding_options_build_an_encoding_policy(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    captured: dict[str, dict] = {}
+
+    def _fake_run_fix(*args, **kwargs):
+        captured["fix"] = kwargs
+        return _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.execute_fix_context", _fake_run_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    options = ["--compression", "zstd", "--no-shuffle", "--output-chunk-size", "4M"]
+    result = runner.invoke(cli, ["fix", ".", *select, "--no-provenance", *options])
+
+    assert result.exit_code == 0
+    assert captured["fix"]["encoding"] == EncodingPolicy(
+        compressor="zstd", shuffle=False, chunk_bytes=4 * 2**20
+    )
+
+    result = runner.invoke(
+        cli, ["fix", ".", *select, "--compression", "zlib", "--compression-level", "12"]
+    )
+    assert result.exit_code != 0
+    assert "Compression level must be between 0 and 9" in result.output
+
+
+def test_check_profile_prints_summary_and_exports_events(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    def _fake_run_check(context, *, profile, **kwargs):
+        profile.record(
+            [
+                {
+                    "input": "cmip6_case.nc",
+                    "phase": "load",
+                    "fix_id": None,
+                    "wall": 0.5,
+                    "cpu": 0.25,
+                    "peak_rss_delta": 0,
+                }
+            ]
+        )
+        return []
+
+    monkeypatch.setattr("woodpecker.cli.execute_check_context", _fake_run_check)
+
+    result = runner.invoke(
+        cli,
+        ["check", ".", "--select", "woodpecker.normalize_tas_units_to_kelvin"]
+        + ["--profile-output", "events.json"],
+    )
+
+    assert result.exit_code == 0
+    assert "Profile:" in result.stderr
+    assert json.loads(Path("events.json").read_text())[0]["phase"] == "load"
+
+
+def test_check_and_fix_jsonl_stream_one_record_per_line(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+
+    def _fake_iter_check(*args, **kwargs):
+        yield _finding("first")
+        yield _finding("second")
+
+    def _fake_iter_fix(*args, **kwargs):
+        yield _fix_stats()
+        yield _fix_stats()
+
+    monkeypatch.setattr("woodpecker.cli.iter_check_context", _fake_iter_check)
+    monkeypatch.setattr("woodpecker.cli.iter_fix_context", _fake_iter_fix)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    check_result = runner.invoke(cli, ["check", ".", *select, "--format", "jsonl"])
+    fix_result = runner.invoke(
+        cli, ["fix", ".", *select, "--dry-run", "--no-provenance", "--format", "jsonl"]
+    )
+
+    assert check_result.exit_code == 1
+    check_records = [json.loads(line) for line in check_result.output.splitlines()]
+    assert [record["record"] for record in check_records] == ["finding", "finding"]
+    assert [record["message"] for record in check_records] == ["first", "second"]
+
+    assert fix_result.exit_code == 0
+    fix_records = [json.loads(line) for line in fix_result.output.splitlines()]
+    assert [record["record"] for record in fix_records] == ["preview", "preview", "summary"]
+    assert fix_records[-1]["attempted"] == 2
+    assert "preview" not in fix_records[-1]
+
+
+def test_fix_jsonl_provenance_records_the_streamed_preview(
+    isolated_cli_workspace: tuple[CliRunner, Callable[[str], Path]],
+    monkeypatch,
+):
+    runner, make_placeholder_netcdf_path = isolated_cli_workspace
+    make_placeholder_netcdf_path("cmip6_case.nc")
+    captured = {}
+
+    def _fake_iter_fix(*args, **kwargs):
+        yield _fix_stats()
+        yield _fix_stats()
+
+    def _fake_provenance(context, stats, **kwargs):
+        captured["stats"] = stats
+
+    monkeypatch.setattr("woodpecker.cli.iter_fix_context", _fake_iter_fix)
+    monkeypatch.setattr("woodpecker.provenance.write_fix_provenance", _fake_provenance)
+
+    select = ["--select", "woodpecker.normalize_tas_units_to_kelvin"]
+    result = runner.invoke(cli, ["fix", ".", *select, "--dry-run", "--format", "jsonl"])
+
+    assert result.exit_code == 0
+    streamed = [json.loads(line) for line in result.output.splitlines()]
+    previews = [record for record in streamed if record["record"] == "preview"]
+    assert len(captured["stats"]["preview"]) == len(previews) == 2
@@ -1,3 +1,5 @@
+import gc
+
 import numpy as np
 import xarray as xr
 
@@ -11,6 +13,7 @@ from woodpecker.fixes.common import (
     RenameVariables,
     SetCoordinateVariables,
 )
+from woodpecker.fixes.common.helpers import dataset_changed
 
 
 def test_common01_apply_write_converts_temperature_units_to_kelvin():
@@ -177,3 +180,87 @@ def test_common05_drop_variables_uses_configured_names():
 
     assert changed is True
     assert "helper" not in dataset.variables
+
+
+def test_common05_transform_runs_once_per_dataset_state(monkeypatch):
+    dataset = xr.Dataset(
+        data_vars={"tas": ("time", np.ones(2)), "helper": ("time", np.zeros(2))},
+        coords={"time": [0, 1]},
+    )
+    fix = DropVariables().configure({"variables": ["helper"]})
+    calls = []
+    original = DropVariables.transform
+
+    def counting_transform(self, ds):
+        calls.append(ds)
+        return original(self, ds)
+
+    monkeypatch.setattr(DropVariables, "transform", counting_transform)
+
+    assert fix.matches(dataset)
+    assert fix.check(dataset)
+    assert fix.apply(dataset, dry_run=True)
+    assert len(calls) == 1
+
+    dataset.attrs["title"] = "mutated"
+    assert fix.matches(dataset)
+    fix.configure({"variables": ["tas"]})
+    assert fix.matches(dataset)
+    assert len(calls) == 3
+
+    assert fix.apply(dataset, dry_run=False)
+    assert "tas" not in dataset.variables
+    assert not fix.matches(dataset)
+    assert len(calls) == 4
+
+
+def test_dataset_changed_matches_identical_and_skips_shared_buffers(monkeypatch):
+    dataset = xr.Dataset(
+        data_vars={"tas": ("time", np.array([1.0, np.nan]), {"units": "K"})},
+        coords={"time": [0, 1]},
+        attrs={"flags": np.array([1, 2])},
+    )
+    renamed = dataset.rename({"tas": "temp"})
+    new_attrs = dataset.copy()
+    new_attrs["tas"].attrs["units"] = "degC"
+    new_values = dataset.copy(deep=True)
+    new_values["tas"].values[0] = 2.0
+
+    for after in (dataset.copy(deep=True), renamed, new_attrs, new_values):
+        assert dataset_changed(dataset, after) is not dataset.identical(after)
+
+    def fail_equals(self, other, equiv=None):
+        raise AssertionError("values should not be compared")
+
+    monkeypatch.setattr(xr.Variable, "equals", fail_equals)
+    assert dataset_changed(dataset, dataset.copy()) is False
+
+
+def test_dataset_changed_treats_nan_attrs_and_values_as_equal():
+    dataset = xr.Dataset(
+        data_vars={"tas": ("lat", np.array([1.0, np.nan]), {"valid_max": np.nan})},
+        coords={"lat": [0.0, 1.0]},
+        attrs={"fill": np.nan, "bounds": np.array([np.nan, 1.0]), "names": np.array(["a"])},
+    )
+
+    assert dataset_changed(dataset, dataset.copy()) is False
+    assert dataset_changed(dataset, dataset.copy(deep=True)) is False
+
+    fix = RenameVariables().configure({"mapping": {"lat": ["latitude"]}})
+    assert not fix.matches(dataset)
+    assert fix.apply(dataset, dry_run=True) is False
+
+
+def test_transform_memo_is_released_with_its_dataset():
+    dataset = xr.Dataset(
+        data_vars={"tas": ("time", np.ones(2)), "helper": ("time", np.zeros(2))},
+        coords={"time": [0, 1]},
+    )
+    fix = DropVariables().configure({"variables": ["helper"]})
+
+    assert fix.apply(dataset, dry_run=True)
+    assert fix._transform_memo._entry is not None
+
+    del dataset
+    gc.collect()
+    assert fix._transform_memo._entry is None
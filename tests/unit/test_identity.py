@@ -1,10 +1,14 @@
+import pandas as pd
 import pytest
 import xarray as xr
 
 from woodpecker.identity import (
+    AttrsIdentityResolver,
     DatasetIdentity,
     DatasetIdentityResolver,
+    NormalizedAttrs,
     register_dataset_identity,
+    resolve_dataset_identities,
     resolve_dataset_identity,
 )
 from woodpecker.testing import make_atlas, make_cmip6, make_cmip6_decadal, make_cordex
@@ -100,3 +104,105 @@ def test_fallback_identity_keeps_dataset_type_none_for_unknown_datasets():
     assert identity.project_id == "custom"
     assert identity.confidence == 0.0
     assert isinstance(identity.evidence, tuple)
+
+
+def test_attrs_only_resolution_is_memoized_per_attrs_fingerprint():
+    calls = []
+
+    @register_dataset_identity("memo-type", override=True)
+    class _Resolver(AttrsIdentityResolver):
+        priority = 3
+
+        def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
+            calls.append(attrs.first(("dataset_id",)))
+            if attrs.token(("project_id",)) != "memo":
+                return None
+            return DatasetIdentity(
+                dataset_type=None, dataset_id=attrs.first(("dataset_id",)), project_id="memo"
+            )
+
+    attrs = {"dataset_id": "memo.a", "project_id": " MEMO "}
+    first = resolve_dataset_identity(xr.Dataset(attrs=attrs))
+    second = resolve_dataset_identity(xr.Dataset(attrs=dict(attrs), coords={"x": [1, 2]}))
+    other = resolve_dataset_identity(xr.Dataset(attrs={**attrs, "dataset_id": "memo.b"}))
+
+    assert first is second
+    assert first.dataset_type == "memo-type"
+    assert other.dataset_id == "memo.b"
+    assert calls == ["memo.a", "memo.b"]
+
+
+def test_dataset_level_resolver_disables_memoization_and_registration_resets_it():
+    ds = xr.Dataset(attrs={"dataset_id": "plain.ds"}, coords={"lat": [0.0]})
+    assert resolve_dataset_identity(ds) is resolve_dataset_identity(ds)
+
+    calls = []
+
+    @register_dataset_identity("coords-type", override=True)
+    class _Resolver(DatasetIdentityResolver):
+        priority = 3
+
+        def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
+            calls.append(dataset)
+            if "lat" not in dataset.coords:
+                return None
+            return DatasetIdentity(dataset_type=None, dataset_id="coords.ds", project_id="coords")
+
+    first = resolve_dataset_identity(ds)
+    second = resolve_dataset_identity(ds)
+
+    assert first.dataset_type == "coords-type"
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_batch_resolution_matches_per_dataset_resolution():
+    datasets = [make_atlas(), make_cmip6(), make_cmip6_decadal(), make_cordex()]
+    records = [dict(ds.attrs) for ds in datasets]
+    records += [
+        {"mip_era": " CMIP6 ", "sub_experiment_id": "s1960", "project_id": 6},
+        {"source_name": "cmip6_decadal.nc"},
+        {"domain_id": "EUR-11", "rcm_model_id": "RCA4", "project_id": "  "},
+        {"dataset_id": "custom.foo"},
+    ]
+
+    table = resolve_dataset_identities(pd.DataFrame(records))
+
+    assert list(table.columns) == ["dataset_type", "confidence", "evidence"]
+    for row, attrs in zip(table.itertuples(), records):
+        identity = resolve_dataset_identity(xr.Dataset(attrs=attrs))
+        dataset_type = None if pd.isna(row.dataset_type) else row.dataset_type
+        assert (dataset_type, row.confidence, row.evidence) == (
+            identity.dataset_type,
+            identity.confidence,
+            identity.evidence,
+        )
+
+
+def test_batch_resolution_runs_resolvers_without_column_support_row_by_row():
+    @register_dataset_identity("rowwise-type", override=True)
+    class _Resolver(AttrsIdentityResolver):
+        priority = 3
+
+        def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
+            if attrs.token(("project_id",)) != "rowwise":
+                return None
+            return DatasetIdentity(
+                dataset_type=None, dataset_id="", project_id="rowwise", evidence=("rowwise",)
+            )
+
+    table = resolve_dataset_identities([{"project_id": "RowWise"}, {"mip_era": "CMIP6"}])
+
+    assert table["dataset_type"].tolist() == ["rowwise-type", "cmip6"]
+    assert table["confidence"].tolist() == [1.0, 0.95]
+    assert table["evidence"].iloc[0] == ("rowwise",)
+
+
+def test_batch_resolution_rejects_dataset_level_resolvers():
+    @register_dataset_identity("dataset-level-type", override=True)
+    class _Resolver(DatasetIdentityResolver):
+        def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
+            return None
+
+    with pytest.raises(TypeError, match="dataset-level-type"):
+        resolve_dataset_identities([{"project_id": "CMIP6"}])
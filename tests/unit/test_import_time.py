@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only the commands that need them may import.
+HEAVY_MODULES = ("xarray", "pydantic", "prov", "duckdb", "yaml", "woodpecker.fixes")
+
+_LOADED_MODULES = """
+import json, sys
+{statement}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _LOADED_MODULES.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import woodpecker",
+        "from woodpecker.cli import cli; cli.main(['--help'], standalone_mode=False)",
+        "from woodpecker.cli import cli; cli.main(['io-status'], standalone_mode=False)",
+    ],
+)
+def test_startup_does_not_import_heavy_dependencies(statement):
+    loaded = _loaded_modules(statement)
+
+    assert sorted(loaded.intersection(HEAVY_MODULES)) == []
+
+
+def test_public_names_still_load_on_access():
+    loaded = _loaded_modules("import woodpecker; woodpecker.check; woodpecker.recipe.get")
+
+    assert {"woodpecker.api", "woodpecker.fixes", "xarray"} <= loaded
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+import xarray as xr
+
+from woodpecker.io import NetCDFInput
+from woodpecker.io.atomic import replace_directory, replace_file
+from woodpecker.io.runtime import backup_mode, module_available
+
+
+def test_replace_file_swaps_in_new_content(tmp_path: Path):
+    target = tmp_path / "out.nc"
+    target.write_text("old")
+    target.chmod(0o640)
+
+    replace_file(target, lambda path: path.write_text("new"))
+
+    assert target.read_text() == "new"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert [path.name for path in tmp_path.iterdir()] == ["out.nc"]
+
+
+def test_replace_file_keeps_target_when_write_fails(tmp_path: Path):
+    target = tmp_path / "out.nc"
+    target.write_text("old")
+
+    def failing_write(path: Path) -> None:
+        path.write_text("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        replace_file(target, failing_write)
+
+    assert target.read_text() == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["out.nc"]
+
+
+def test_replace_file_keeps_backup_in_backup_mode(tmp_path: Path):
+    target = tmp_path / "out.nc"
+    target.write_text("old")
+
+    with backup_mode(True):
+        replace_file(target, lambda path: path.write_text("new"))
+
+    assert target.read_text() == "new"
+    assert (tmp_path / "out.nc.bak").read_text() == "old"
+
+
+def test_replace_directory_swaps_store_and_keeps_backup(tmp_path: Path):
+    target = tmp_path / "out.zarr"
+    target.mkdir()
+    (target / "old").write_text("old")
+
+    def write_store(path: Path) -> None:
+        path.mkdir()
+        (path / "new").write_text("new")
+
+    replace_directory(target, write_store)
+    assert [path.name for path in target.iterdir()] == ["new"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["out.zarr"]
+
+    with backup_mode(True):
+        replace_directory(target, write_store)
+    assert [path.name for path in (tmp_path / "out.zarr.bak").iterdir()] == ["new"]
+
+
+@pytest.mark.skipif(not module_available("netCDF4"), reason="netCDF4 not installed")
+def test_netcdf_save_with_backup_replaces_and_keeps_original(tmp_path: Path):
+    source = tmp_path / "sample.nc"
+    xr.Dataset({"value": ("time", [1.0, 2.0])}, attrs={"title": "old"}).to_netcdf(source)
+    inode = source.stat().st_ino
+
+    data_input = NetCDFInput(source_path=source)
+    loaded = data_input.load()
+    loaded.attrs["title"] = "new"
+    with backup_mode(True):
+        assert data_input.save(loaded, dry_run=False) is True
+
+    assert source.stat().st_ino != inode
+    with xr.open_dataset(source) as written, xr.open_dataset(f"{source}.bak") as backup:
+        assert written.attrs["title"] == "new"
+        assert backup.attrs["title"] == "old"
@@ -1,11 +1,14 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
 import xarray as xr
 
 from woodpecker.io import NetCDFInput, ZarrInput, ZarrOutputAdapter
+from woodpecker.io.backends import nc_patch, zarr_patch
 from woodpecker.io.backends.nc import netcdf_backend_available
 from woodpecker.io.backends.zarr import zarr_backend_available
+from woodpecker.io.runtime import chunked_io_mode, module_available, normalize_chunks
 
 pytestmark = [
     pytest.mark.io_backend,
@@ -56,3 +59,271 @@ def test_zarr_output_adapter_roundtrip(tmp_path: Path):
 
     assert "value" in loaded
     loaded.close()
+
+
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+def test_netcdf_load_header_keeps_data_variables_lazy(tmp_path: Path):
+    source = tmp_path / "sample.nc"
+    xr.Dataset({"value": ("time", [1.0, 2.0])}, coords={"time": [0, 1]}).to_netcdf(source)
+
+    header = NetCDFInput(source_path=source).load_header()
+    try:
+        assert header.attrs["source_name"] == "sample.nc"
+        assert not header["value"].variable._in_memory
+        assert NetCDFInput(source_path=source).load()["value"].variable._in_memory
+    finally:
+        header.close()
+
+
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+def test_netcdf_load_subset_keeps_selected_variables_and_coords(tmp_path: Path):
+    source = tmp_path / "sample.nc"
+    xr.Dataset(
+        {"tas": ("time", [1.0, 2.0]), "pr": ("time", [3.0, 4.0])},
+        coords={"time": [0, 1]},
+        attrs={"title": "sample"},
+    ).to_netcdf(source)
+
+    subset = NetCDFInput(source_path=source).load_subset(["tas"])
+
+    assert list(subset.data_vars) == ["tas"]
+    assert list(subset.coords) == ["time"]
+    assert subset.attrs["title"] == "sample"
+    assert subset["tas"].variable._in_memory
+
+
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+@pytest.mark.skipif(not module_available("dask"), reason="dask not installed")
+def test_netcdf_chunked_load_stays_lazy_and_save_replaces_source(tmp_path: Path):
+    source = tmp_path / "sample.nc"
+    xr.Dataset({"value": ("time", [1.0, 2.0, 3.0])}, coords={"time": [0, 1, 2]}).to_netcdf(source)
+
+    data_input = NetCDFInput(source_path=source)
+    with chunked_io_mode({"time": 1}):
+        loaded = data_input.load()
+    loaded["value"] = loaded["value"] + 1
+
+    assert loaded["value"].chunks == ((1, 1, 1),)
+    assert data_input.save(loaded, dry_run=False) is True
+    loaded.close()
+    with xr.open_dataset(source) as written:
+        assert written["value"].values.tolist() == [2.0, 3.0, 4.0]
+    assert [path.name for path in tmp_path.iterdir()] == ["sample.nc"]
+
+
+def _decadal_sample(source: Path) -> None:
+    dataset = xr.Dataset(
+        {"tas": (("time", "lat"), [[1.0, 2.0], [3.0, 4.0]], {"units": "K"})},
+        coords={
+            "time": np.array(["2000-01-01", "2000-02-01"], dtype="datetime64[ns]"),
+            "lat": [10.0, 20.0],
+            "reftime": np.datetime64("2000-01-01", "ns"),
+        },
+        attrs={"title": "sample", "obsolete": "yes"},
+    )
+    dataset["tas"].encoding.update(zlib=True, complevel=4)
+    dataset.to_netcdf(source)
+
+
+@pytest.mark.skipif(not module_available("netCDF4"), reason="netCDF4 not installed")
+def test_netcdf_metadata_change_is_patched_without_a_rewrite(tmp_path: Path, monkeypatch):
+    source = tmp_path / "sample.nc"
+    _decadal_sample(source)
+
+    data_input = NetCDFInput(source_path=source)
+    loaded = data_input.load()
+    loaded.attrs["title"] = "patched"
+    del loaded.attrs["obsolete"]
+    loaded["tas"].attrs["long_name"] = "Near-surface air temperature"
+    loaded["reftime"] = loaded["reftime"] + np.timedelta64(1, "D")
+
+    def full_rewrite(*args, **kwargs):
+        raise AssertionError("metadata-only change rewrote the file")
+
+    monkeypatch.setattr(xr.Dataset, "to_netcdf", full_rewrite)
+    assert data_input.save(loaded, dry_run=False) is True
+    monkeypatch.undo()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["sample.nc"]
+    with xr.open_dataset(source) as written:
+        assert written.attrs == {"title": "patched", "source_name": "sample.nc"}
+        assert written["tas"].attrs["long_name"] == "Near-surface air temperature"
+        assert written["tas"].encoding["complevel"] == 4
+        assert written["tas"].values.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+        assert written["reftime"].values == np.datetime64("2000-01-02", "ns")
+
+
+@pytest.mark.skipif(not module_available("netCDF4"), reason="netCDF4 not installed")
+def test_netcdf_failed_patch_leaves_the_source_untouched(tmp_path: Path, monkeypatch):
+    import netCDF4
+
+    source = tmp_path / "sample.nc"
+    _decadal_sample(source)
+    original = source.read_bytes()
+    loaded = NetCDFInput(source_path=source).load()
+    loaded.attrs["title"] = "patched"
+
+    def crash(path, patch):
+        with netCDF4.Dataset(path, "a") as handle:
+            handle.title = "half-written"
+        raise OSError("disk full")
+
+    monkeypatch.setattr(nc_patch, "_write_patch_netcdf4", crash)
+    with pytest.raises(OSError, match="disk full"):
+        nc_patch.patch_netcdf(loaded, source)
+
+    assert source.read_bytes() == original
+    assert [path.name for path in tmp_path.iterdir()] == ["sample.nc"]
+
+
+@pytest.mark.skipif(not module_available("netCDF4"), reason="netCDF4 not installed")
+def test_netcdf_structural_change_falls_back_to_full_rewrite(tmp_path: Path, monkeypatch):
+    source = tmp_path / "sample.nc"
+    _decadal_sample(source)
+    data_input = NetCDFInput(source_path=source)
+    loaded = data_input.load()
+    loaded["tas"].encoding["complevel"] = 1
+
+    calls = []
+    to_netcdf = xr.Dataset.to_netcdf
+
+    def recording_to_netcdf(self, *args, **kwargs):
+        calls.append(args)
+        return to_netcdf(self, *args, **kwargs)
+
+    monkeypatch.setattr(xr.Dataset, "to_netcdf", recording_to_netcdf)
+    assert data_input.save(loaded, dry_run=False) is True
+
+    assert len(calls) == 1
+    with xr.open_dataset(source) as written:
+        assert written["tas"].encoding["complevel"] == 1
+
+
+@pytest.mark.skipif(not zarr_backend_available(), reason="No Zarr backend installed")
+@pytest.mark.skipif(not module_available("dask"), reason="dask not installed")
+def test_zarr_chunked_save_rewrites_store_it_reads_from(tmp_path: Path):
+    source = tmp_path / "sample.zarr"
+    xr.Dataset({"value": ("time", [1.0, 2.0, 3.0])}, coords={"time": [0, 1, 2]}).to_zarr(source)
+
+    data_input = ZarrInput(source_path=source)
+    with chunked_io_mode("auto"):
+        loaded = data_input.load()
+    loaded["value"] = loaded["value"] * 2
+
+    assert data_input.save(loaded, dry_run=False) is True
+    with xr.open_zarr(source) as written:
+        assert written["value"].values.tolist() == [2.0, 4.0, 6.0]
+    assert [path.name for path in tmp_path.iterdir()] == ["sample.zarr"]
+
+
+def _zarr_sample(source: Path) -> None:
+    xr.Dataset(
+        {
+            "tas": (("time", "lat"), [[1.0, 2.0], [3.0, 4.0]]),
+            "pr": (("time", "lat"), [[0.0] * 2] * 2),
+        },
+        coords={"time": [0, 1], "lat": [10.0, 20.0]},
+        attrs={"title": "sample"},
+    ).to_zarr(source)
+
+
+@pytest.mark.skipif(not zarr_backend_available(), reason="No Zarr backend installed")
+def test_zarr_metadata_change_updates_store_in_place(tmp_path: Path, monkeypatch):
+    source = tmp_path / "sample.zarr"
+    _zarr_sample(source)
+    chunk = source / "tas" / "0.0"
+    written_at = chunk.stat().st_mtime_ns
+
+    data_input = ZarrInput(source_path=source)
+    loaded = data_input.load()
+    loaded.attrs["title"] = "patched"
+    loaded["tas"].attrs["units"] = "K"
+    renamed = loaded.rename({"lat": "latitude"}).drop_vars("pr")
+    loaded._replace(
+        variables=renamed._variables,
+        coord_names=renamed._coord_names,
+        dims=renamed._dims,
+        indexes=renamed._indexes,
+        inplace=True,
+    )
+
+    def full_rewrite(*args, **kwargs):
+        raise AssertionError("metadata-only change rewrote the store")
+
+    monkeypatch.setattr(xr.Dataset, "to_zarr", full_rewrite)
+    assert data_input.save(loaded, dry_run=False) is True
+    monkeypatch.undo()
+
+    assert chunk.stat().st_mtime_ns == written_at
+    assert sorted(path.name for path in source.iterdir() if not path.name.startswith(".")) == [
+        "latitude",
+        "tas",
+        "time",
+    ]
+    with xr.open_zarr(source) as written:
+        assert written.attrs["title"] == "patched"
+        assert written["tas"].dims == ("time", "latitude")
+        assert written["tas"].attrs == {"units": "K"}
+        assert written["tas"].values.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+@pytest.mark.skipif(not zarr_backend_available(), reason="No Zarr backend installed")
+def test_zarr_failed_update_leaves_the_source_store_untouched(tmp_path: Path, monkeypatch):
+    source = tmp_path / "sample.zarr"
+    _zarr_sample(source)
+    loaded = ZarrInput(source_path=source).load()
+    loaded.attrs["title"] = "patched"
+    del loaded["pr"]
+    write_patch = zarr_patch._write_patch
+
+    def crash(target, patch):
+        write_patch(target, patch)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(zarr_patch, "_write_patch", crash)
+    with pytest.raises(OSError, match="disk full"):
+        zarr_patch.patch_zarr(loaded, source)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["sample.zarr"]
+    with xr.open_zarr(source) as unchanged:
+        assert unchanged.attrs["title"] == "sample"
+        assert sorted(unchanged.data_vars) == ["pr", "tas"]
+
+
+@pytest.mark.skipif(not zarr_backend_available(), reason="No Zarr backend installed")
+def test_zarr_value_change_writes_only_changed_variable(tmp_path: Path):
+    source = tmp_path / "sample.zarr"
+    _zarr_sample(source)
+    untouched = source / "pr" / "0.0"
+    written_at = untouched.stat().st_mtime_ns
+
+    data_input = ZarrInput(source_path=source)
+    loaded = data_input.load()
+    loaded["tas"] = loaded["tas"] * 2
+
+    assert data_input.save(loaded, dry_run=False) is True
+
+    assert untouched.stat().st_mtime_ns == written_at
+    with xr.open_zarr(source) as written:
+        assert written["tas"].values.tolist() == [[2.0, 4.0], [6.0, 8.0]]
+        assert written.attrs == {"title": "sample", "source_name": "sample.zarr"}
+    assert not [path for path in source.iterdir() if "staged" in path.name]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("auto", "auto"),
+        ("100", 100),
+        ("time=12,lat=auto", {"time": 12, "lat": "auto"}),
+    ],
+)
+def test_normalize_chunks_parses_cli_values(value, expected):
+    assert normalize_chunks(value) == expected
+
+
+@pytest.mark.parametrize("value", ["lots", "time=", "=3", True])
+def test_normalize_chunks_rejects_invalid_values(value):
+    with pytest.raises(ValueError, match="Invalid chunks"):
+        normalize_chunks(value)
@@ -0,0 +1,135 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from woodpecker.io import DatasetCache, NetCDFInput, dataset_cache_mode
+from woodpecker.io.backends.nc import netcdf_backend_available
+from woodpecker.io.dataset_cache import active_dataset_cache
+from woodpecker.recipes.models import DatasetMatcher, Recipe
+from woodpecker.recipes.resolver import select_matching_store_recipes
+from woodpecker.runner import run_check, run_fix
+from woodpecker.stores.static_store import StaticRecipeStore
+
+pytestmark = [
+    pytest.mark.io_backend,
+    pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed"),
+    pytest.mark.filterwarnings("ignore:.*numpy.ndarray size changed.*"),
+]
+
+
+def _write(path: Path, title: str = "sample") -> NetCDFInput:
+    xr.Dataset(
+        {"tas": (("lat",), np.array([1.0, 2.0]), {"units": "K"})},
+        coords={"lat": [10.0, -10.0]},
+        attrs={"title": title, "project_id": "CMIP6"},
+    ).to_netcdf(path)
+    return NetCDFInput(source_path=path)
+
+
+def _count_header_loads(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    original = NetCDFInput.load_header
+
+    def load_header(self):
+        calls.append(self.reference)
+        return original(self)
+
+    monkeypatch.setattr(NetCDFInput, "load_header", load_header)
+    return calls
+
+
+class HeaderFix:
+    id = "test.header"
+    name = "Header fix"
+    dataset = None
+    requires_data = False
+
+    def matches(self, dataset: xr.Dataset) -> bool:
+        return True
+
+    def check(self, dataset: xr.Dataset) -> list[str]:
+        return [dataset.attrs["title"]]
+
+    def apply(self, dataset: xr.Dataset, dry_run: bool = True) -> bool:
+        if not dry_run:
+            dataset.attrs["title"] = "fixed"
+        return True
+
+
+def test_cache_hands_out_independent_copies_of_one_open_dataset(tmp_path: Path, monkeypatch):
+    data_input = _write(tmp_path / "a.nc")
+    calls = _count_header_loads(monkeypatch)
+    cache = DatasetCache(max_bytes=2**20)
+
+    first = cache.load_header(data_input)
+    first.attrs["title"] = "changed"
+    first["tas"].attrs["units"] = "degC"
+    first.close()
+    second = cache.load_header(data_input)
+
+    assert calls == [data_input.reference]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.attrs["title"] == "sample"
+    assert second["tas"].attrs["units"] == "K"
+    assert second["tas"].values.tolist() == [1.0, 2.0]
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_cache_reopens_changed_files_and_evicts_least_recently_used(tmp_path: Path):
+    first = _write(tmp_path / "a.nc")
+    second = _write(tmp_path / "b.nc")
+    cache = DatasetCache(max_bytes=2**20, max_entries=1)
+
+    cache.load_header(first)
+    cache.load_header(second)
+    assert len(cache) == 1 and cache.evictions == 1
+
+    # Outputs are swapped in atomically, so the cached handle still reads the old file.
+    _write(tmp_path / "new.nc", title="rewritten")
+    os.replace(tmp_path / "new.nc", tmp_path / "b.nc")
+    assert cache.load_header(second).attrs["title"] == "rewritten"
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    tiny = DatasetCache(max_bytes=1)
+    assert tiny.load_header(first).attrs["title"] == "sample"
+    assert len(tiny) == 0
+
+
+def test_recipe_matching_and_header_checks_share_one_open(tmp_path: Path, monkeypatch):
+    data_input = _write(tmp_path / "a.nc")
+    calls = _count_header_loads(monkeypatch)
+    store = StaticRecipeStore(
+        [Recipe(id="test.cmip6", match=DatasetMatcher(attrs={"project_id": "CMIP6"}), steps=[])]
+    )
+
+    with dataset_cache_mode(2**20) as cache:
+        recipes = select_matching_store_recipes(store=store, inputs=[data_input], recipe_id=None)
+        findings = run_check([data_input], [HeaderFix()])
+        assert active_dataset_cache() is cache
+
+    assert [recipe.id for recipe in recipes] == ["test.cmip6"]
+    assert [finding["message"] for finding in findings] == ["sample"]
+    assert calls == [data_input.reference]
+    assert active_dataset_cache() is None
+
+
+def test_applied_fixes_bypass_and_invalidate_cached_headers(tmp_path: Path):
+    data_input = _write(tmp_path / "a.nc")
+
+    with dataset_cache_mode(2**20) as cache:
+        run_check([data_input], [HeaderFix()])
+        assert len(cache) == 1
+        stats = run_fix([data_input], [HeaderFix()], dry_run=False)
+        assert len(cache) == 0
+        assert stats["persisted"] == 1
+        assert run_check([data_input], [HeaderFix()])[0]["message"] == "fixed"
+
+
+def test_dataset_cache_mode_without_budget_disables_caching():
+    with dataset_cache_mode(None) as cache:
+        assert cache is None
+        assert active_dataset_cache() is None
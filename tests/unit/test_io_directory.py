@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from woodpecker.io import NetCDFInput, ZarrInput, iter_inputs, normalize_inputs
+from woodpecker.io.directory import DirectoryInput, walk_directory
+
+
+def _tree(root: Path) -> None:
+    for relative in (
+        "b.nc",
+        "a/x.nc",
+        "a/notes.txt",
+        "a/deep/y.nc",
+        "a-b.nc",
+        "scratch/tmp.nc",
+        "store.zarr/.zgroup",
+        "store.zarr/tas/0.0",
+        "store.zarr/nested/inner.nc",
+    ):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+
+def _relative(paths, root: Path) -> list[str]:
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+def test_walk_directory_yields_sorted_leaves_and_prunes_stores(tmp_path: Path):
+    _tree(tmp_path)
+
+    walked = _relative(walk_directory(tmp_path, workers=4), tmp_path)
+
+    assert walked == [
+        "a/deep/y.nc",
+        "a/notes.txt",
+        "a/x.nc",
+        "a-b.nc",
+        "b.nc",
+        "scratch/tmp.nc",
+        "store.zarr",
+    ]
+    leaves = [path for path in sorted(tmp_path.rglob("*")) if path.is_file()]
+    expected = [path for path in leaves if "store.zarr" not in path.parts]
+    assert [path for path in walked if path != "store.zarr"] == _relative(expected, tmp_path)
+
+
+def test_walk_directory_applies_include_exclude_and_max_depth(tmp_path: Path):
+    _tree(tmp_path)
+
+    included = walk_directory(tmp_path, include=("*.nc",), exclude=("scratch", "a/deep"))
+    shallow = walk_directory(tmp_path, max_depth=1)
+
+    assert _relative(included, tmp_path) == ["a/x.nc", "a-b.nc", "b.nc"]
+    assert _relative(shallow, tmp_path) == ["a-b.nc", "b.nc", "store.zarr"]
+    with pytest.raises(ValueError, match="max_depth"):
+        list(walk_directory(tmp_path, max_depth=0))
+
+
+def test_walk_directory_warns_about_unreadable_directories(tmp_path: Path, monkeypatch):
+    _tree(tmp_path)
+    scandir = os.scandir
+
+    def _scandir(path):
+        if Path(path).name == "a":
+            raise PermissionError("permission denied")
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+
+    with pytest.warns(UserWarning, match=r"Failed to list directory '.*a': permission denied"):
+        found = _relative(walk_directory(tmp_path), tmp_path)
+
+    assert found == ["a-b.nc", "b.nc", "scratch/tmp.nc", "store.zarr"]
+
+
+def test_directory_input_streams_detected_inputs(tmp_path: Path):
+    _tree(tmp_path)
+
+    inputs = DirectoryInput(source_path=tmp_path, exclude=("scratch",)).iter_expand()
+    first = next(inputs)
+
+    assert isinstance(first, NetCDFInput)
+    assert first.source_path == tmp_path / "a" / "deep" / "y.nc"
+    rest = list(inputs)
+    assert [type(item) for item in rest] == [NetCDFInput, NetCDFInput, NetCDFInput, ZarrInput]
+
+
+def test_normalize_inputs_forwards_walk_options(tmp_path: Path):
+    _tree(tmp_path)
+
+    streamed = iter_inputs([tmp_path], include=("b.nc", "*.zarr"), max_depth=1)
+    listed = normalize_inputs(tmp_path, exclude=("a",))
+
+    assert [item.source_name for item in streamed] == ["b.nc", "store.zarr"]
+    assert [item.source_name for item in listed] == ["a-b.nc", "b.nc", "tmp.nc", "store.zarr"]
@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+from pydantic import ValidationError
+
+from woodpecker.io import EncodingPolicy, NetCDFInput, ZarrInput
+from woodpecker.io.backends.nc import netcdf_backend_available
+from woodpecker.io.backends.zarr import zarr_backend_available
+from woodpecker.io.encoding import merge_encoding, target_chunks
+from woodpecker.io.runtime import module_available
+from woodpecker.recipes import recipe
+from woodpecker.recipes.models import Recipe
+from woodpecker.runner import run_fix
+
+pytestmark = pytest.mark.filterwarnings("ignore:.*numpy.ndarray size changed.*")
+
+
+class TitleFix:
+    id = "test.title"
+    name = "Title fix"
+    dataset = None
+
+    def matches(self, dataset: xr.Dataset) -> bool:
+        return True
+
+    def apply(self, dataset: xr.Dataset, dry_run: bool = True) -> bool:
+        if not dry_run:
+            dataset.attrs["title"] = "fixed"
+        return True
+
+
+def _sample() -> xr.Dataset:
+    return xr.Dataset(
+        {"tas": (("time", "lat", "lon"), np.ones((8, 4, 4), dtype="float32"))},
+        coords={"time": np.arange(8), "lat": np.arange(4.0), "lon": np.arange(4.0)},
+        attrs={"title": "sample"},
+    )
+
+
+def test_target_chunks_split_leading_dimensions_first():
+    assert target_chunks((8, 4, 4), 4, 10**6) == (8, 4, 4)
+    assert target_chunks((8, 4, 4), 4, 128) == (2, 4, 4)
+    assert target_chunks((8, 4, 4), 4, 32) == (1, 2, 4)
+    assert target_chunks((8, 4, 4), 4, 1) == (1, 1, 1)
+
+
+def test_policy_validation_mapping_form_and_merge():
+    policy = EncodingPolicy.from_mapping({"compressor": "zstd", "level": 19, "chunk-bytes": "1K"})
+    assert policy == EncodingPolicy(compressor="zstd", level=19, chunk_bytes=1024)
+
+    with pytest.raises(ValueError, match="between 0 and 9"):
+        EncodingPolicy(compressor="zlib", level=19)
+    with pytest.raises(ValueError, match="Unknown compressor"):
+        EncodingPolicy(compressor="lzma")
+    with pytest.raises(ValueError, match="Unknown encoding settings: speed"):
+        EncodingPolicy.from_mapping({"speed": "fast"})
+
+    merged = merge_encoding(policy, {"level": 1, "shuffle": False})
+    assert merged == EncodingPolicy(compressor="zstd", level=1, shuffle=False, chunk_bytes=1024)
+    assert merge_encoding(None, None) is None
+
+
+def test_level_without_compressor_is_validated_after_merging():
+    override = EncodingPolicy(level=15)
+
+    assert merge_encoding({"compressor": "zstd"}, override) == EncodingPolicy(
+        compressor="zstd", level=15
+    )
+    with pytest.raises(ValueError, match="between 0 and 9"):
+        merge_encoding({"compressor": "zlib"}, override)
+    with pytest.raises(ValueError, match="between 0 and 22"):
+        EncodingPolicy(level=23)
+
+
+def test_recipe_encoding_is_validated():
+    encoded = Recipe(id="test.encoded", encoding={"compressor": "zlib", "chunk_bytes": "2K"})
+
+    assert encoded.encoding == {"compressor": "zlib", "chunk_bytes": 2048}
+    assert encoded.encoding_policy() == EncodingPolicy(compressor="zlib", chunk_bytes=2048)
+    assert Recipe(id="test.plain").encoding_policy() is None
+    built = recipe("test.built").encoding(compressor="zstd", level=5).to_payload()
+    assert built["encoding"] == {"compressor": "zstd", "level": 5}
+    with pytest.raises(ValidationError, match="Unknown compressor"):
+        Recipe(id="test.bad", encoding={"compressor": "lzma"})
+
+
+@pytest.mark.skipif(not module_available("netCDF4"), reason="netCDF4 not installed")
+def test_netcdf_rewrite_follows_encoding_policy(tmp_path: Path):
+    path = tmp_path / "sample.nc"
+    _sample().to_netcdf(path, encoding={"tas": {"zlib": True, "complevel": 9}})
+    policy = EncodingPolicy(compressor="zlib", level=1, chunk_bytes=128)
+
+    stats = run_fix([NetCDFInput(source_path=path)], [TitleFix()], dry_run=False, encoding=policy)
+
+    assert stats["persisted"] == 1
+    with xr.open_dataset(path) as written:
+        encoding = written["tas"].encoding
+        assert written.attrs["title"] == "fixed"
+        assert (encoding["zlib"], encoding["complevel"], encoding["shuffle"]) == (True, 1, True)
+        assert tuple(encoding["chunksizes"]) == (2, 4, 4)
+
+
+@pytest.mark.skipif(not module_available("netCDF4"), reason="netCDF4 not installed")
+def test_netcdf_substitutes_zlib_with_a_level_in_its_range(tmp_path: Path):
+    path = tmp_path / "sample.nc"
+    _sample().to_netcdf(path)
+    policy = EncodingPolicy(compressor="zstd", level=15)
+
+    with pytest.warns(UserWarning, match="level 15 exceeds the zlib maximum"):
+        stats = run_fix(
+            [NetCDFInput(source_path=path)], [TitleFix()], dry_run=False, encoding=policy
+        )
+
+    assert stats["persisted"] == 1
+    with xr.open_dataset(path) as written:
+        assert (written["tas"].encoding["zlib"], written["tas"].encoding["complevel"]) == (True, 9)
+
+
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+def test_metadata_changes_are_still_patched_without_a_policy(tmp_path: Path, monkeypatch):
+    path = tmp_path / "sample.nc"
+    _sample().to_netcdf(path)
+
+    def full_rewrite(*args, **kwargs):
+        raise AssertionError("metadata-only change rewrote the file")
+
+    monkeypatch.setattr(xr.Dataset, "to_netcdf", full_rewrite)
+    stats = run_fix([NetCDFInput(source_path=path)], [TitleFix()], dry_run=False)
+
+    assert stats["persisted"] == 1
+
+
+@pytest.mark.skipif(not zarr_backend_available(), reason="No Zarr backend installed")
+@pytest.mark.parametrize("chunks", [None, "auto"])
+def test_zarr_rewrite_follows_encoding_policy(tmp_path: Path, chunks):
+    import numcodecs
+
+    if chunks is not None and not module_available("dask"):
+        pytest.skip("dask not installed")
+    path = tmp_path / "sample.zarr"
+    _sample().to_zarr(path)
+    policy = EncodingPolicy(compressor="zstd", shuffle=True, chunk_bytes=64)
+
+    stats = run_fix(
+        [ZarrInput(source_path=path)], [TitleFix()], dry_run=False, chunks=chunks, encoding=policy
+    )
+
+    assert stats["persisted"] == 1
+    with xr.open_zarr(path) as written:
+        encoding = written["tas"].encoding
+        assert written.attrs["title"] == "fixed"
+        assert encoding["compressor"] == numcodecs.Zstd(level=3)
+        assert encoding["filters"] == [numcodecs.Shuffle(elementsize=4)]
+        assert tuple(encoding["chunks"]) == (1, 4, 4)
+        assert written["tas"].values.tolist() == _sample()["tas"].values.tolist()
@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from woodpecker.cache import ResultCache
+from woodpecker.io import ManifestInput, NetCDFInput, ZarrInput, iter_inputs, normalize_inputs
+from woodpecker.io.manifest import manifest_format
+from woodpecker.recipes.resolver import select_matching_store_recipes
+from woodpecker.scheduling import input_size
+
+
+def test_text_manifest_resolves_paths_and_skips_comments(tmp_path: Path):
+    absolute = tmp_path / "elsewhere" / "b.nc"
+    manifest = tmp_path / "inputs.txt"
+    manifest.write_text(f"# run 42\na.nc\n\n{absolute}\nstore.zarr\n", encoding="utf-8")
+
+    inputs = normalize_inputs(f"@{manifest}")
+
+    assert [type(item) for item in inputs] == [NetCDFInput, NetCDFInput, ZarrInput]
+    assert [item.source_path for item in inputs] == [
+        tmp_path / "a.nc",
+        absolute,
+        tmp_path / "store.zarr",
+    ]
+    assert all(item.metadata == {} for item in inputs)
+
+
+def test_jsonl_manifest_attaches_entry_metadata(tmp_path: Path):
+    manifest = tmp_path / "inputs.jsonl"
+    records = [
+        {"path": "a.nc", "size": "2048", "checksum": "abc", "dataset_type": "cmip6"},
+        "b.nc",
+        {"path": "c.nc", "recipe_id": "cmip6.core_units", "dataset_id": None},
+    ]
+    manifest.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+    inputs = ManifestInput(source_path=manifest).expand()
+
+    assert [item.source_name for item in inputs] == ["a.nc", "b.nc", "c.nc"]
+    assert inputs[0].metadata == {"size": 2048, "checksum": "abc", "dataset_type": "cmip6"}
+    assert inputs[1].metadata == {}
+    assert inputs[2].metadata == {"recipe_id": "cmip6.core_units"}
+    assert input_size(inputs[0]) == 2048
+
+
+def test_manifest_entries_stream_as_they_are_read(tmp_path: Path):
+    manifest = tmp_path / "inputs.jsonl"
+    manifest.write_text('{"path": "a.nc"}\n"notes.txt"\n', encoding="utf-8")
+    unnamed = tmp_path / "unnamed.jsonl"
+    unnamed.write_text('{"size": 1}\n', encoding="utf-8")
+
+    entries = iter_inputs([ManifestInput(source_path=manifest)])
+
+    assert next(entries).source_name == "a.nc"
+    with pytest.raises(ValueError, match=r"inputs.jsonl:2: Unsupported path input"):
+        next(entries)
+    with pytest.raises(ValueError, match=r"unnamed.jsonl:1: manifest entry has no 'path'"):
+        normalize_inputs(f"@{unnamed}")
+
+
+def test_manifest_reports_invalid_size_with_its_line(tmp_path: Path):
+    manifest = tmp_path / "inputs.jsonl"
+    manifest.write_text('{"path": "a.nc", "size": 1}\n{"path": "b.nc", "size": "2 GB"}\n')
+
+    with pytest.raises(ValueError, match=r"inputs.jsonl:2: invalid 'size' in manifest: '2 GB'"):
+        normalize_inputs(f"@{manifest}")
+
+
+def test_manifest_format_follows_suffix():
+    assert manifest_format(Path("run.jsonl")) == "jsonl"
+    assert manifest_format(Path("run.NDJSON")) == "jsonl"
+    assert manifest_format(Path("run.parquet")) == "parquet"
+    assert manifest_format(Path("run.lst")) == "text"
+    with pytest.raises(ValueError, match="Unsupported manifest format"):
+        ManifestInput(source_path=Path("run.txt"), format="csv")
+
+
+def test_parquet_manifest_is_read_in_batches(tmp_path: Path):
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    manifest = tmp_path / "inputs.parquet"
+    table = pyarrow.table({"path": ["a.nc", "b.zarr"], "dataset_type": ["cmip6", None]})
+    parquet.write_table(table, manifest)
+
+    inputs = normalize_inputs(f"@{manifest}")
+
+    assert [item.source_name for item in inputs] == ["a.nc", "b.zarr"]
+    assert [item.metadata for item in inputs] == [{"dataset_type": "cmip6"}, {}]
+
+
+def test_declared_checksum_replaces_content_hash(tmp_path: Path, monkeypatch):
+    path = tmp_path / "a.nc"
+    path.write_bytes(b"data")
+    declared = NetCDFInput(source_path=path, metadata={"checksum": "sha256:feed"})
+    monkeypatch.setattr(
+        "woodpecker.cache._hash_file", lambda *args: pytest.fail("content was hashed")
+    )
+
+    fingerprint = ResultCache(tmp_path / "cache", hash_content=True).fingerprint(declared)
+
+    assert fingerprint["checksum"] == "sha256:feed"
+
+
+def test_declared_recipe_id_skips_opening_inputs_for_recipe_lookup(tmp_path: Path):
+    class Store:
+        def get_recipe(self, identifier):
+            return _Recipe(identifier)
+
+        def lookup(self, dataset, path=None):
+            raise AssertionError("input was opened")
+
+    inputs = [
+        NetCDFInput(source_path=tmp_path / name, metadata={"recipe_id": "cmip6.core_units"})
+        for name in ("a.nc", "b.nc")
+    ]
+
+    recipes = select_matching_store_recipes(store=Store(), inputs=inputs, recipe_id=None)
+
+    assert [recipe.id for recipe in recipes] == ["cmip6.core_units"]
+
+
+class _Recipe:
+    def __init__(self, identifier: str):
+        self.id = identifier
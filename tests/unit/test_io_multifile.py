@@ -0,0 +1,124 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from woodpecker.fixes.common import EnsureLatitudeIsIncreasing
+from woodpecker.io import MultiFileInput, NetCDFInput, ZarrInput, group_shards
+from woodpecker.io.backends.nc import netcdf_backend_available
+from woodpecker.runner import run_check, run_fix
+from woodpecker.scheduling import input_size
+
+pytestmark = [
+    pytest.mark.io_backend,
+    pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed"),
+    pytest.mark.filterwarnings("ignore:.*numpy.ndarray size changed.*"),
+]
+
+
+def _write_shards(directory: Path) -> list[Path]:
+    dataset = xr.Dataset(
+        {"tas": (("time", "lat"), np.arange(12.0).reshape(6, 2), {"units": "K"})},
+        coords={"time": pd.date_range("2000-01-01", periods=6, freq="D"), "lat": [10.0, -10.0]},
+        attrs={"dataset_id": "CMIP6.DCPP.sample", "project_id": "CMIP6"},
+    )
+    paths = []
+    for index in range(3):
+        shard = dataset.isel(time=slice(2 * index, 2 * index + 2))
+        shard.attrs["tracking_id"] = f"shard-{index}"
+        shard.time.encoding["units"] = f"days since 200{index}-01-01"
+        path = directory / f"tas_day_gn_2000010{index}-2000010{index}.nc"
+        shard.to_netcdf(path)
+        paths.append(path)
+    return paths
+
+
+class CountingFix:
+    id = "test.counting"
+    name = "Counting fix"
+    dataset = None
+
+    def __init__(self):
+        self.checked = 0
+
+    def matches(self, dataset: xr.Dataset) -> bool:
+        return True
+
+    def check(self, dataset: xr.Dataset) -> list[str]:
+        self.checked += 1
+        return [f"{dataset.sizes['time']} steps"]
+
+    def apply(self, dataset: xr.Dataset, dry_run: bool = True) -> bool:
+        dataset.attrs["fixed"] = "yes"
+        dataset["tas"].attrs["long_name"] = "air temperature"
+        return True
+
+
+def test_group_shards_by_file_name_or_dataset_id(tmp_path: Path, monkeypatch):
+    paths = _write_shards(tmp_path)
+    other = ZarrInput(source_path=tmp_path / "other.zarr")
+    inputs = [NetCDFInput(source_path=path) for path in reversed(paths)] + [other]
+
+    by_name = group_shards(inputs, by="time-range")
+    by_id = group_shards(inputs)
+    monkeypatch.setattr(NetCDFInput, "load_header", lambda self: pytest.fail("opened"))
+    declared = group_shards(
+        [NetCDFInput(source_path=path, metadata={"dataset_id": "x"}) for path in paths]
+    )
+
+    assert [type(item) for item in by_name] == [MultiFileInput, ZarrInput]
+    assert by_name[0].shards == tuple(paths)
+    assert by_name[0].reference == str(tmp_path / "tas_day_gn")
+    assert by_id[0].shards == tuple(paths)
+    assert by_id[0].reference == str(tmp_path / "CMIP6.DCPP.sample")
+    assert declared[0].name == "x"
+    with pytest.raises(ValueError, match="Invalid shard grouping"):
+        group_shards(inputs, by="(")
+
+
+def test_multifile_input_checks_the_combined_dataset_once(tmp_path: Path):
+    shards = MultiFileInput(shards=_write_shards(tmp_path))
+    fix = CountingFix()
+
+    findings = run_check([shards], [fix])
+
+    assert fix.checked == 1
+    assert [finding["message"] for finding in findings] == ["6 steps"]
+    assert input_size(shards) == sum(path.stat().st_size for path in shards.shards)
+    assert pickle.loads(pickle.dumps(shards)).shards == shards.shards
+
+
+def test_multifile_metadata_fix_is_written_back_to_every_shard(tmp_path: Path, monkeypatch):
+    paths = _write_shards(tmp_path)
+
+    def full_rewrite(*args, **kwargs):
+        raise AssertionError("metadata-only change rewrote a shard")
+
+    monkeypatch.setattr(xr.Dataset, "to_netcdf", full_rewrite)
+    stats = run_fix([MultiFileInput(shards=paths)], [CountingFix()], dry_run=False)
+    monkeypatch.undo()
+
+    assert stats["persisted"] == 1
+    for index, path in enumerate(paths):
+        with xr.open_dataset(path) as shard:
+            assert shard.attrs["fixed"] == "yes"
+            assert shard.attrs["tracking_id"] == f"shard-{index}"
+            assert "source_name" not in shard.attrs
+            assert shard["tas"].attrs == {"units": "K", "long_name": "air temperature"}
+
+
+def test_multifile_value_fix_keeps_each_shard_encoding(tmp_path: Path):
+    paths = _write_shards(tmp_path)
+
+    run_fix([MultiFileInput(shards=paths)], [EnsureLatitudeIsIncreasing()], dry_run=False)
+
+    for index, path in enumerate(paths):
+        with xr.open_dataset(path) as shard:
+            assert shard["lat"].values.tolist() == [-10.0, 10.0]
+            start = 4 * index
+            assert shard["tas"].values.tolist() == [[start + 1, start], [start + 3, start + 2]]
+            assert shard["time"].encoding["units"] == f"days since 200{index}-01-01"
+            assert str(shard["time"].values[0])[:10] == f"2000-01-0{2 * index + 1}"
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from woodpecker.fixes.common import NormalizeTasUnitsToKelvin
+from woodpecker.io.backends.nc import netcdf_backend_available
+from woodpecker.journal import RunJournal, run_journal_for
+from woodpecker.runner import run_fix
+
+pytestmark = [
+    pytest.mark.io_backend,
+    pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed"),
+]
+
+
+def _entries(path: Path) -> list[dict]:
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    return [record for record in records if record["record"] == "input"]
+
+
+def test_run_fix_records_each_input_in_journal(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(3)
+    journal_path = tmp_path / "run.jsonl"
+
+    run_fix(
+        inputs,
+        [NormalizeTasUnitsToKelvin()],
+        dry_run=False,
+        journal=RunJournal(journal_path),
+    )
+
+    entries = _entries(journal_path)
+    assert [entry["input"] for entry in entries] == [item.reference for item in inputs]
+    assert {entry["status"] for entry in entries} == {"completed"}
+    assert entries[0]["applied_fix_ids"] == ["woodpecker.normalize_tas_units_to_kelvin"]
+    assert entries[0]["output"] == inputs[0].reference
+
+
+def test_resume_skips_completed_inputs_and_merges_stats(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(3)
+    journal_path = tmp_path / "run.jsonl"
+    fixes = [NormalizeTasUnitsToKelvin()]
+    run_fix(inputs[:2], fixes, dry_run=False, journal=RunJournal(journal_path))
+    write_netcdf_inputs.loads = 0
+
+    stats = run_fix(inputs, fixes, dry_run=False, journal=RunJournal(journal_path, resume=True))
+
+    assert write_netcdf_inputs.loads == 1
+    assert (stats["attempted"], stats["changed"], stats["persisted"]) == (3, 3, 3)
+    assert [item["path"] for item in stats["preview"]] == [item.reference for item in inputs]
+    assert len(_entries(journal_path)) == 3
+
+
+def test_resume_ignores_truncated_last_line(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(3)
+    journal_path = tmp_path / "run.jsonl"
+    fixes = [NormalizeTasUnitsToKelvin()]
+    run_fix(inputs[:1], fixes, dry_run=True, journal=RunJournal(journal_path))
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"record": "input", "input": ')
+    write_netcdf_inputs.loads = 0
+
+    run_fix(inputs, fixes, dry_run=True, journal=RunJournal(journal_path, resume=True))
+
+    assert write_netcdf_inputs.loads == 2
+
+
+def test_resume_rejects_journal_from_a_different_run(tmp_path: Path, write_netcdf_inputs):
+    inputs = write_netcdf_inputs(3)
+    journal_path = tmp_path / "run.jsonl"
+    run_fix(inputs[:1], [NormalizeTasUnitsToKelvin()], journal=RunJournal(journal_path))
+
+    with pytest.raises(ValueError, match="different run"):
+        run_fix(
+            inputs,
+            [NormalizeTasUnitsToKelvin().configure({"x": 1})],
+            journal=RunJournal(journal_path, resume=True),
+        )
+
+
+def test_run_journal_for_requires_path_to_resume(tmp_path: Path):
+    assert run_journal_for(None) is None
+    assert run_journal_for(tmp_path / "run.jsonl").path == tmp_path / "run.jsonl"
+    with pytest.raises(ValueError, match="journal path"):
+        run_journal_for(None, resume=True)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"output_dir": "other"},
+        {"encoding": {"compressor": "zlib", "level": 4}},
+        {"chunks": "time=1"},
+    ],
+)
+def test_resume_rejects_journal_written_to_other_outputs(
+    tmp_path: Path, write_netcdf_inputs, options
+):
+    inputs = write_netcdf_inputs(3)
+    journal_path = tmp_path / "run.jsonl"
+    fixes = [NormalizeTasUnitsToKelvin()]
+    run_fix(inputs[:1], fixes, journal=RunJournal(journal_path))
+    if "output_dir" in options:
+        options = {"output_dir": tmp_path / options["output_dir"]}
+
+    with pytest.raises(ValueError, match="different run"):
+        run_fix(inputs, fixes, journal=RunJournal(journal_path, resume=True), **options)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import json
+import sys
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
 from woodpecker.fixes import plugins
+from woodpecker.fixes.labels import Labels
+from woodpecker.fixes.registry import FixFunctionRegistry, ManifestFix
+from woodpecker.recipes import RecipeLoader
 
 
 def test_load_plugins_imports_module_entrypoint(monkeypatch):
@@ -79,3 +85,171 @@ def test_load_plugins_runs_once(monkeypatch):
     plugins.load_plugins()
 
     assert calls == ["loaded-once"]
+
+
+_LAZY_FIX_MODULE = """
+from woodpecker.fixes.labels import Labels
+from woodpecker.fixes.registry import FixFunction, FixFunctionRegistry
+
+
+@FixFunctionRegistry.register
+class LazyTitle(FixFunction):
+    prefix = "lazy"
+    suffix = "title"
+    name = "Lazy title"
+    categories = ["metadata"]
+    labels = [Labels.RISK_METADATA_ONLY]
+"""
+
+
+def _write_lazy_plugin(root: Path, package: str) -> None:
+    package_dir = root / package
+    (package_dir / "recipes").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("from . import fixes  # noqa: F401\n")
+    (package_dir / "fixes.py").write_text(_LAZY_FIX_MODULE)
+    (package_dir / "recipes" / "lazy.json").write_text(
+        json.dumps({"recipes": [{"id": "lazy.recipe", "steps": [{"id": "lazy.title"}]}]})
+    )
+    manifest = {
+        "schema_version": 1,
+        "package": package,
+        "fixes": [
+            {
+                "id": "lazy.title",
+                "object": f"{package}.fixes:LazyTitle",
+                "name": "Lazy title",
+                "aliases": ["lazy_title"],
+                "categories": ["metadata"],
+                "labels": [Labels.RISK_METADATA_ONLY],
+            }
+        ],
+        "recipes": ["recipes/lazy.json"],
+    }
+    (package_dir / plugins.MANIFEST_FILENAME).write_text(json.dumps(manifest))
+
+
+def test_manifest_plugins_load_their_modules_on_first_instantiation(monkeypatch, tmp_path):
+    package = "woodpecker_lazy_manifest_plugin"
+    _write_lazy_plugin(tmp_path, package)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def fail_load():
+        raise AssertionError("manifest plugins are not imported on load")
+
+    monkeypatch.setattr(
+        plugins,
+        "_iter_plugin_entry_points",
+        lambda: [SimpleNamespace(name="lazy", value=package, load=fail_load)],
+    )
+    monkeypatch.setattr(plugins, "_PLUGINS_LOADED", False)
+    try:
+        plugins.load_plugins()
+
+        [listed] = FixFunctionRegistry.describe({"prefix": "lazy"})
+        assert isinstance(listed, ManifestFix)
+        assert listed.metadata()["label_titles"] == ["safe: metadata only"]
+        assert FixFunctionRegistry.resolve_identifier("lazy.lazy_title") == "lazy.title"
+        catalog = RecipeLoader(
+            user_dirs=[tmp_path], system_dirs=[tmp_path], plugin_packages=[package]
+        ).catalog()
+        assert catalog.get_recipe("lazy.recipe").steps[0].id == "lazy.title"
+        assert package not in sys.modules
+
+        fix = FixFunctionRegistry.instantiate("lazy.title")
+        assert type(fix).__module__ == f"{package}.fixes"
+        assert FixFunctionRegistry.get_fix_function("lazy.title") is type(fix)
+    finally:
+        for name in [name for name in sys.modules if name.startswith(package)]:
+            del sys.modules[name]
+
+
+def test_bundled_plugin_manifests_are_current():
+    packages = [
+        plugins._entry_point_package(entry) for entry in plugins._iter_plugin_entry_points()
+    ]
+    manifests = {package: plugins.read_plugin_manifest(package) for package in packages}
+    if not any(manifests.values()):
+        pytest.skip("No plugin with a manifest installed")
+
+    for package, manifest in manifests.items():
+        if manifest is None:
+            continue
+        shipped = json.loads((manifest.root / plugins.MANIFEST_FILENAME).read_text())
+        assert shipped == plugins.build_plugin_manifest(package), (
+            f"Outdated manifest for {package}; run scripts/generate_plugin_manifests.py"
+        )
+
+
+def _write_recipe_plugin(root: Path, package: str, manifest: dict) -> None:
+    package_dir = root / package
+    (package_dir / "recipes").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "recipes" / "scanned.json").write_text(
+        json.dumps({"recipes": [{"id": "scanned.recipe", "steps": []}]})
+    )
+    (package_dir / plugins.MANIFEST_FILENAME).write_text(json.dumps(manifest))
+
+
+def _catalog_recipe_ids(monkeypatch, tmp_path: Path, package: str, version: str) -> set[str]:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr("woodpecker.recipes.loaders.plugin_versions", lambda: {package: version})
+    try:
+        loader = RecipeLoader(
+            user_dirs=[tmp_path],
+            system_dirs=[tmp_path],
+            core_packages=(),
+            plugin_packages=[package],
+        )
+        return {recipe.id for recipe in loader.catalog().list_recipes()}
+    finally:
+        for name in [name for name in sys.modules if name.startswith(package)]:
+            del sys.modules[name]
+
+
+@pytest.mark.parametrize(("installed", "expected"), [("1.0", set()), ("1.1", {"scanned.recipe"})])
+def test_manifest_for_another_version_falls_back_to_the_recipe_directory(
+    monkeypatch, tmp_path, installed, expected
+):
+    package = "woodpecker_versioned_manifest_plugin"
+    manifest = {"schema_version": 1, "package": package, "version": "1.0", "fixes": []}
+    _write_recipe_plugin(tmp_path, package, manifest)
+
+    assert _catalog_recipe_ids(monkeypatch, tmp_path, package, installed) == expected
+    assert (plugins.read_plugin_manifest(package, installed) is None) == (installed != "1.0")
+
+
+def test_unreadable_manifest_warns_and_scans_the_recipe_directory(monkeypatch, tmp_path):
+    package = "woodpecker_broken_manifest_plugin"
+    _write_recipe_plugin(tmp_path, package, {"schema_version": 99, "package": package})
+
+    with pytest.warns(
+        RuntimeWarning, match=f"Failed to load woodpecker plugin '{package}'.*schema_version: 99"
+    ):
+        recipe_ids = _catalog_recipe_ids(monkeypatch, tmp_path, package, "1.0")
+
+    assert recipe_ids == {"scanned.recipe"}
+
+
+def test_load_plugins_imports_plugins_whose_manifest_is_unreadable(monkeypatch, tmp_path):
+    package = "woodpecker_corrupt_manifest_plugin"
+    (tmp_path / package).mkdir()
+    (tmp_path / package / "__init__.py").write_text("")
+    (tmp_path / package / plugins.MANIFEST_FILENAME).write_text("{not json")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    calls: list[str] = []
+
+    def fake_load():
+        calls.append("imported")
+        return object()
+
+    monkeypatch.setattr(
+        plugins,
+        "_iter_plugin_entry_points",
+        lambda: [SimpleNamespace(name="corrupt", value=package, load=fake_load)],
+    )
+    monkeypatch.setattr(plugins, "_PLUGINS_LOADED", False)
+
+    with pytest.warns(RuntimeWarning, match="plugin 'corrupt': .*Importing it instead"):
+        plugins.load_plugins()
+
+    assert calls == ["imported"]
@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+from woodpecker.api import check, fix, iter_check
+from woodpecker.profiling import PhaseTimer, RunProfile, summarize_timings, write_timing_events
+from woodpecker.testing import make_cmip6
+
+TAS_FIX = "woodpecker.normalize_tas_units_to_kelvin"
+
+
+def test_phase_timer_records_wall_and_cpu_time():
+    timer = PhaseTimer("case.nc")
+    with timer.phase("load"):
+        sum(range(1000))
+    with timer.phase("apply", fix_id="tests.fix"):
+        pass
+
+    assert [event["phase"] for event in timer.events] == ["load", "apply"]
+    assert timer.events[1]["fix_id"] == "tests.fix"
+    assert all(event["wall"] >= 0 and event["cpu"] >= 0 for event in timer.events)
+    assert all(event["input"] == "case.nc" for event in timer.events)
+
+
+def test_per_thread_phase_timer_ignores_cpu_time_of_other_threads():
+    def spin():
+        while time.thread_time() < 0.1:
+            pass
+
+    timers = {"process": PhaseTimer("case.nc"), "thread": PhaseTimer("case.nc", per_thread=True)}
+    worker = threading.Thread(target=spin)
+    with timers["process"].phase("save"), timers["thread"].phase("save"):
+        worker.start()
+        worker.join()
+
+    assert timers["process"].events[0]["cpu"] >= 0.1
+    assert timers["thread"].events[0]["cpu"] < 0.05
+
+
+def test_summarize_timings_groups_by_phase_fix_and_input():
+    events = [
+        {
+            "input": "a.nc",
+            "phase": "apply",
+            "fix_id": "f",
+            "wall": 1.0,
+            "cpu": 0.5,
+            "peak_rss_delta": 8,
+        },
+        {
+            "input": "a.nc",
+            "phase": "load",
+            "fix_id": None,
+            "wall": 2.0,
+            "cpu": 1.0,
+            "peak_rss_delta": 0,
+        },
+        {
+            "input": "b.nc",
+            "phase": "apply",
+            "fix_id": "f",
+            "wall": 3.0,
+            "cpu": 1.5,
+            "peak_rss_delta": 4,
+        },
+    ]
+
+    summary = summarize_timings(events)
+
+    assert list(summary["phases"]) == ["load", "apply"]
+    assert summary["phases"]["apply"] == {"count": 2, "wall": 4.0, "cpu": 2.0, "peak_rss_delta": 12}
+    assert summary["fixes"]["f"]["count"] == 2
+    assert summary["inputs"]["a.nc"]["wall"] == 3.0
+    assert summary["events"] == events
+
+
+def test_fix_profile_reports_phase_timings_per_fix():
+    ds = make_cmip6(overrides={"units": "degC"})
+
+    result = fix(ds, fixes=TAS_FIX, dry_run=False, profile=True)
+
+    assert set(result.timings["phases"]) >= {"load", "identity", "matches", "apply", "close"}
+    assert result.timings["fixes"][TAS_FIX]["count"] == 2
+    assert fix(make_cmip6(), fixes=TAS_FIX).timings == {}
+
+
+def test_check_profile_collects_timings_in_stats():
+    ds = make_cmip6(overrides={"units": "degC"})
+
+    result = check(ds, fixes=TAS_FIX, profile=True)
+
+    assert set(result.timings["phases"]) >= {"load", "identity", "matches", "check", "close"}
+    assert check(ds, fixes=TAS_FIX).timings == {}
+
+
+def test_iter_check_records_timings_into_a_given_profile():
+    profile = RunProfile()
+
+    findings = list(iter_check(make_cmip6(overrides={"units": "degC"}), TAS_FIX, profile=profile))
+
+    assert findings
+    assert set(profile.summary()["phases"]) >= {"load", "identity", "matches", "check", "close"}
+
+
+def test_write_timing_events_exports_raw_events(tmp_path: Path):
+    profile = RunProfile()
+    timer = PhaseTimer("case.nc")
+    with timer.phase("load"):
+        pass
+    profile.record(timer.events)
+
+    target = write_timing_events(tmp_path / "profile" / "events.json", profile.events)
+
+    assert json.loads(target.read_text(encoding="utf-8")) == profile.events
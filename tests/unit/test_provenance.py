@@ -92,7 +92,8 @@ def test_write_fix_provenance_warns_and_falls_back_on_invalid_target_reference(
             raise ValueError("bad output target")
 
     monkeypatch.setattr(
-        "woodpecker.provenance.get_output_adapter", lambda output_format: BadAdapter()
+        "woodpecker.provenance.get_output_adapter",
+        lambda output_format, output_dir=None: BadAdapter(),
     )
 
     fix = SimpleNamespace(id="woodpecker.example")
@@ -1,5 +1,5 @@
 def test_public_import_surfaces_are_available():
-    from woodpecker import CheckResult, FixResult, check, fix, recipe
+    from woodpecker import CheckResult, FixResult, check, fix, iter_check, iter_fix, recipe
     from woodpecker.fixes import (
         UNPRIORITIZED,
         FixFunction,
@@ -22,6 +22,8 @@ def test_public_import_surfaces_are_available():
     assert callable(apply_recipe)
     assert callable(check)
     assert callable(fix)
+    assert callable(iter_check)
+    assert callable(iter_fix)
     assert callable(recipe.auto)
     assert callable(recipe.check)
     assert callable(recipe.fix)
@@ -1,7 +1,12 @@
 import pytest
 
 from woodpecker.fixes.labels import Labels
-from woodpecker.fixes.registry import FixFunction, FixFunctionRegistry, register_fix_function
+from woodpecker.fixes.registry import (
+    DataAccess,
+    FixFunction,
+    FixFunctionRegistry,
+    register_fix_function,
+)
 
 
 def test_registry_discovers_builtins():
@@ -73,6 +78,25 @@ def test_registry_rejects_priority_below_unprioritized_sentinel():
         FixFunctionRegistry.register(_InvalidPriority)
 
 
+def test_registry_rejects_invalid_data_access_declarations():
+    with pytest.raises(ValueError, match="'reads' as a DataAccess"):
+
+        class _InvalidReads(FixFunction):
+            prefix = "test"
+            suffix = "invalid_reads"
+            name = "Invalid reads"
+            categories = ["metadata"]
+            labels = [Labels.RISK_METADATA_ONLY]
+            reads = ["tas"]
+
+        FixFunctionRegistry.register(_InvalidReads)
+
+    with pytest.raises(ValueError, match="sequence of names"):
+        DataAccess(variables="tas")
+
+    assert DataAccess(variables=["tas"]).variables == ("tas",)
+
+
 def test_register_fix_function_decorator_registers_class():
     class _Alias(FixFunction):
         prefix = "test"
@@ -254,6 +278,44 @@ def test_registry_discovers_prioritized_before_unprioritized_then_by_id():
     ]
 
 
+def test_registry_index_is_reused_until_the_next_registration():
+    created: list[str] = []
+
+    class _Indexed(FixFunction):
+        prefix = "indexed"
+        suffix = "grid"
+        name = "Indexed grid"
+        categories = ["grid", "metadata"]
+        labels = [Labels.RISK_METADATA_ONLY, "topic-grid"]
+        dataset = "CMIP6"
+
+        def __init__(self):
+            created.append(self.id)
+
+    index = FixFunctionRegistry.index()
+    register_fix_function(_Indexed)
+    updated = FixFunctionRegistry.index()
+
+    assert updated is not index
+    assert updated.version > index.version
+    assert FixFunctionRegistry.index() is updated
+    assert "indexed.grid" not in index.order and "indexed.grid" in updated.order
+
+    created.clear()
+    assert FixFunctionRegistry.discover_ids({"prefix": "indexed"}) == ("indexed.grid",)
+    assert FixFunctionRegistry.discover_ids({"labels": "topic-grid", "dataset": "CMIP6"}) == (
+        "indexed.grid",
+    )
+    assert "indexed.grid" in FixFunctionRegistry.discover_ids({"categories": ["grid", "time"]})
+    assert FixFunctionRegistry.discover_ids({"dataset": "ATLAS", "prefix": "indexed"}) == ()
+    assert updated.select({"prefix": "indexed"}) is updated.select({"prefix": "indexed"})
+    assert created == []
+
+    selected = FixFunctionRegistry.discover({"categories": "grid", "prefix": "indexed"})
+    assert [fix.id for fix in selected] == ["indexed.grid"]
+    assert created == ["indexed.grid"]
+
+
 def test_registry_resolves_ids_and_aliases_for_known_fixes():
     assert (
         FixFunctionRegistry.resolve_identifier("woodpecker.normalize_tas_units_to_kelvin")
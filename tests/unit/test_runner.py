@@ -1,10 +1,22 @@
+from pathlib import Path
+
 import pytest
 import xarray as xr
 
+from woodpecker.fixes import DataAccess
+from woodpecker.fixes.common import (
+    ConvertUnits,
+    EnsureLatitudeIsIncreasing,
+    NormalizeLongitudeConvention,
+    NormalizeTasUnitsToKelvin,
+)
 from woodpecker.fixes.labels import Labels
-from woodpecker.io import DataInput
-from woodpecker.runner import run_fix
-from woodpecker.testing import make_atlas
+from woodpecker.io import DataInput, NetCDFInput
+from woodpecker.io.backends.nc import netcdf_backend_available
+from woodpecker.io.encoding import EncodingPolicy, apply_encoding_policy
+from woodpecker.io.runtime import keeps_backup, module_available, output_encoding
+from woodpecker.runner import iter_check, iter_fix, merge_fix_stats, run_check, run_fix
+from woodpecker.testing import make_atlas, make_cmip6
 
 
 class DummyInput(DataInput):
@@ -164,3 +176,242 @@ def test_run_fix_preview_omits_nonmatching_fixes():
     )
 
     assert stats["preview"] == []
+
+
+@pytest.mark.io_backend
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+def test_run_check_and_fix_results_do_not_depend_on_jobs(write_netcdf_inputs):
+    inputs = write_netcdf_inputs(5, degc=lambda index: index % 2 == 0)
+    fixes = [NormalizeTasUnitsToKelvin(), EnsureLatitudeIsIncreasing()]
+
+    sequential_findings = run_check(inputs, fixes)
+    parallel_findings = run_check(inputs, fixes, jobs=3)
+    sequential_stats = run_fix(inputs, fixes, dry_run=True)
+    parallel_stats = run_fix(inputs, fixes, dry_run=True, jobs=3)
+
+    assert [item["path"] for item in sequential_findings] == [
+        str(inputs[index].source_path) for index in (0, 2, 4)
+    ]
+    assert parallel_findings == sequential_findings
+    assert parallel_stats == sequential_stats
+    assert run_check(inputs, fixes, jobs=3, schedule="largest-first") == sequential_findings
+    assert run_fix(inputs, fixes, jobs=3, max_inflight_memory="1M") == sequential_stats
+    assert parallel_stats["changed"] == 3
+
+
+@pytest.mark.io_backend
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+def test_run_fix_writes_mirrored_outputs_through_writer_pool(
+    tmp_path: Path, monkeypatch, write_netcdf_inputs
+):
+    source_dir = tmp_path / "archive"
+    source_dir.mkdir()
+    inputs = write_netcdf_inputs(4, source_dir, degc=lambda index: index % 2 == 0)
+    originals = [data_input.source_path.read_bytes() for data_input in inputs]
+    monkeypatch.chdir(tmp_path)
+
+    parts = list(
+        iter_fix(
+            inputs,
+            [NormalizeTasUnitsToKelvin()],
+            dry_run=False,
+            output_dir=tmp_path / "out",
+            writers=2,
+        )
+    )
+
+    assert [part["persisted"] for part in parts] == [1, 0, 1, 0]
+    assert sorted(path.name for path in (tmp_path / "out" / "archive").iterdir()) == [
+        "cmip6_0.nc",
+        "cmip6_2.nc",
+    ]
+    with xr.open_dataset(tmp_path / "out" / "archive" / "cmip6_2.nc") as written:
+        assert written["tas"].attrs["units"] == "K"
+    assert [data_input.source_path.read_bytes() for data_input in inputs] == originals
+    with pytest.raises(ValueError, match="writers must be a non-negative integer"):
+        run_fix(inputs, [], writers=-1)
+
+
+@pytest.mark.io_backend
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+def test_run_fix_writer_threads_keep_their_own_backup_and_encoding_modes(
+    tmp_path: Path, monkeypatch, write_netcdf_inputs
+):
+    inputs = write_netcdf_inputs(12, tmp_path)
+    policy = EncodingPolicy(compressor="zlib", level=4)
+    seen = []
+
+    def record(dataset, active, output_format):
+        seen.append((keeps_backup(), active))
+        return apply_encoding_policy(dataset, active, output_format)
+
+    monkeypatch.setattr("woodpecker.io.backends.nc.apply_encoding_policy", record)
+
+    stats = run_fix(
+        inputs,
+        [NormalizeTasUnitsToKelvin()],
+        dry_run=False,
+        keep_backup=True,
+        encoding=policy,
+        writers=3,
+    )
+
+    assert stats["persisted"] == 12
+    assert seen == [(True, policy)] * 12
+    assert sorted(path.name for path in tmp_path.glob("*.bak")) == sorted(
+        f"{data_input.source_path.name}.bak" for data_input in inputs
+    )
+    assert not keeps_backup()
+    assert output_encoding() is None
+
+
+def test_run_fix_parallel_keeps_in_memory_inputs_in_process():
+    ds = xr.Dataset(attrs={"source_name": "dummy.nc"})
+    data_input = DummyInput(dataset=ds, save_ok=True)
+
+    stats = run_fix([data_input], [DummyFunction()], dry_run=False, jobs=2)
+
+    assert stats["persisted"] == 1
+    assert data_input.saved_attrs == {"source_name": "dummy.nc"}
+
+
+@pytest.mark.parametrize("jobs", [0, -1])
+def test_run_check_rejects_invalid_jobs(jobs):
+    with pytest.raises(ValueError, match="jobs must be a positive integer"):
+        run_check([], [], jobs=jobs)
+
+
+def test_iter_check_and_iter_fix_stream_per_input_results():
+    loaded: list[str] = []
+
+    class TrackingInput(DummyInput):
+        def load(self) -> xr.Dataset:
+            loaded.append(self.name)
+            return super().load()
+
+    inputs = [
+        TrackingInput(dataset=xr.Dataset(attrs={"source_name": f"{name}.nc"}), save_ok=True)
+        for name in ("first", "second")
+    ]
+    for data_input, name in zip(inputs, ("first", "second")):
+        data_input.name = name
+
+    class AlwaysReports(DummyFunction):
+        def check(self, dataset: xr.Dataset) -> list[str]:
+            return [dataset.attrs["source_name"]]
+
+    findings = iter_check(inputs, [AlwaysReports()])
+    assert loaded == []
+    assert next(findings)["message"] == "first.nc"
+    assert loaded == ["first"]
+
+    parts = list(iter_fix(inputs, [AlwaysReports()], dry_run=True))
+    assert [part["preview"][0]["path"] for part in parts] == ["first", "second"]
+    assert merge_fix_stats(parts) == run_fix(inputs, [AlwaysReports()], dry_run=True)
+    assert merge_fix_stats(parts, keep_preview=False)["preview"] == []
+
+
+def test_run_check_opens_header_only_when_no_fix_requires_data():
+    calls: list[str] = []
+
+    class HeaderTrackingInput(DummyInput):
+        def load(self) -> xr.Dataset:
+            calls.append("load")
+            return super().load()
+
+        def load_header(self) -> xr.Dataset:
+            calls.append("header")
+            return super().load()
+
+    class MetadataOnlyFunction(DummyFunction):
+        requires_data = False
+
+    data_input = HeaderTrackingInput(dataset=xr.Dataset(), save_ok=True)
+
+    run_check([data_input], [MetadataOnlyFunction()])
+    run_fix([data_input], [MetadataOnlyFunction()], dry_run=True)
+    run_check([data_input], [MetadataOnlyFunction(), DummyFunction()])
+    run_fix([data_input], [MetadataOnlyFunction()], dry_run=False)
+
+    assert calls == ["header", "header", "load", "load"]
+
+
+def test_declared_dataset_type_skips_loading_inputs_no_fix_applies_to():
+    calls: list[str] = []
+
+    class TrackingInput(DummyInput):
+        def load(self) -> xr.Dataset:
+            calls.append(self.metadata.get("dataset_type", ""))
+            return super().load()
+
+    atlas = TrackingInput(dataset=make_cmip6(), save_ok=True)
+    atlas.metadata["dataset_type"] = "atlas"
+    cmip6 = TrackingInput(dataset=make_atlas(), save_ok=True)
+    cmip6.metadata["dataset_type"] = "CMIP6"
+
+    findings = run_check([atlas, cmip6], [DeclaredCmipFunction()])
+    stats = run_fix([atlas, cmip6], [DeclaredCmipFunction()], dry_run=True)
+
+    # The declared type wins over what the dataset attrs would resolve to.
+    assert [finding["message"] for finding in findings] == ["should not run for atlas"]
+    assert stats["attempted"] == 1
+    assert calls == ["CMIP6", "CMIP6"]
+
+
+def test_run_check_loads_only_variables_declared_by_fixes():
+    requested: list[object] = []
+
+    class SubsetTrackingInput(DummyInput):
+        def load_subset(self, variables, *, header_only: bool = False) -> xr.Dataset:
+            requested.append((sorted(variables), header_only))
+            return super().load_subset(variables, header_only=header_only)
+
+    class ReadsTas(DummyFunction):
+        reads = DataAccess(variables=("tas",))
+
+    class ReadsTasValues(DummyFunction):
+        reads = DataAccess(variables=("tas", "pr"), data=True)
+
+    ds = make_cmip6(periods=1, nlat=2, nlon=3)
+    data_input = SubsetTrackingInput(dataset=ds, save_ok=True)
+
+    run_check([data_input], [ReadsTas(), ReadsTasValues()])
+    run_check([data_input], [ReadsTas(), DummyFunction()])
+    run_fix([data_input], [ReadsTas()], dry_run=False)
+
+    assert requested == [(["pr", "tas"], False)]
+
+
+@pytest.mark.io_backend
+@pytest.mark.skipif(not netcdf_backend_available(), reason="No NetCDF backend installed")
+@pytest.mark.skipif(not module_available("dask"), reason="dask not installed")
+def test_run_fix_with_chunks_keeps_value_transforms_lazy(tmp_path: Path):
+    ds = make_cmip6(periods=2, nlat=2, nlon=3)
+    ds["tas"].attrs["units"] = "degC"
+    ds["orog"] = ds["tas"].isel(time=0, drop=True).assign_attrs(units="cm")
+    ds["lon_bnds"] = ds["lon"].expand_dims(bnds=2).transpose() - 180
+    path = tmp_path / "chunked.nc"
+    ds.to_netcdf(path)
+    chunked: list[bool] = []
+
+    class LazyProbe(DummyFunction):
+        def apply(self, dataset: xr.Dataset, dry_run: bool = True) -> bool:
+            chunked.append(
+                all(dataset[name].chunks is not None for name in ("tas", "orog", "lon_bnds"))
+            )
+            return False
+
+    fixes = [
+        NormalizeTasUnitsToKelvin(),
+        ConvertUnits().configure({"units": {"orog": "m"}}),
+        NormalizeLongitudeConvention().configure({"target": "-180_180", "bounds": ["lon_bnds"]}),
+        LazyProbe(),
+    ]
+
+    stats = run_fix([NetCDFInput(source_path=path)], fixes, dry_run=False, chunks={"time": 1})
+
+    assert (stats["changed"], stats["persisted"]) == (3, 1)
+    assert chunked == [True]
+    with xr.open_dataset(path) as written:
+        assert written["tas"].attrs["units"] == "K"
+        assert float(written["orog"].max()) == pytest.approx(float(ds["orog"].max()) / 100)
@@ -0,0 +1,89 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from woodpecker.io import NetCDFInput
+from woodpecker.runner import _map_inputs
+from woodpecker.scheduling import input_size, parse_byte_size
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    submitted: list[str] = []
+
+    def submit(self, fn, data_input, /):
+        type(self).submitted.append(data_input.source_path.name)
+        return super().submit(fn, data_input)
+
+
+@pytest.fixture
+def sized_inputs(tmp_path: Path, monkeypatch) -> list[NetCDFInput]:
+    RecordingExecutor.submitted = []
+    monkeypatch.setattr("woodpecker.runner.ProcessPoolExecutor", RecordingExecutor)
+    inputs = []
+    for name, size in (("small.nc", 10), ("huge.nc", 400), ("medium.nc", 100), ("large.nc", 200)):
+        path = tmp_path / name
+        path.write_bytes(b"\0" * size)
+        inputs.append(NetCDFInput(source_path=path))
+    return inputs
+
+
+def _name(data_input: NetCDFInput) -> str:
+    return data_input.source_path.name
+
+
+def test_largest_first_schedule_submits_big_inputs_first(sized_inputs):
+    results = list(_map_inputs(_name, sized_inputs, jobs=2, schedule="largest-first"))
+
+    assert RecordingExecutor.submitted == ["huge.nc", "large.nc", "medium.nc", "small.nc"]
+    assert results == ["small.nc", "huge.nc", "medium.nc", "large.nc"]
+
+
+def test_max_inflight_memory_caps_concurrent_input_bytes(sized_inputs):
+    lock = threading.Lock()
+    inflight = [0, 0]
+
+    def worker(data_input: NetCDFInput) -> str:
+        size = input_size(data_input)
+        with lock:
+            inflight[0] += size
+            inflight[1] = max(inflight[1], inflight[0])
+        time.sleep(0.01)
+        with lock:
+            inflight[0] -= size
+        return _name(data_input)
+
+    results = list(
+        _map_inputs(worker, sized_inputs, jobs=4, schedule="largest-first", max_inflight_memory=300)
+    )
+
+    assert results == [_name(item) for item in sized_inputs]
+    # huge.nc exceeds the cap on its own and must still run, alone.
+    assert inflight[1] <= 400
+    assert RecordingExecutor.submitted[0] == "huge.nc"
+
+
+def test_input_size_sums_directory_stores(tmp_path: Path):
+    store = tmp_path / "case.zarr"
+    (store / "tas").mkdir(parents=True)
+    (store / ".zmetadata").write_bytes(b"\0" * 5)
+    (store / "tas" / "0.0").write_bytes(b"\0" * 7)
+
+    assert input_size(NetCDFInput(source_path=store)) == 12
+    assert input_size(NetCDFInput(source_path=tmp_path / "missing.nc")) == 0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), (1024, 1024), ("512", 512), ("2K", 2048), ("1.5G", 3 * 2**29), ("8GiB", 2**33)],
+)
+def test_parse_byte_size_accepts_binary_units(value, expected):
+    assert parse_byte_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "lots", "0", -1, True])
+def test_parse_byte_size_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_byte_size(value)
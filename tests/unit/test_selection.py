@@ -31,8 +31,12 @@ def test_select_fixes_uses_configure_return_value(monkeypatch):
             return ReplacementFunction()
 
     monkeypatch.setattr(
-        "woodpecker.selection.FixFunctionRegistry.discover",
-        lambda filters=None: [ConfigurableFunction()],
+        "woodpecker.selection.FixFunctionRegistry.discover_ids",
+        lambda filters=None: ("woodpecker.test",),
+    )
+    monkeypatch.setattr(
+        "woodpecker.selection.FixFunctionRegistry.instantiate",
+        lambda identifier: ConfigurableFunction(),
     )
     monkeypatch.setattr(
         "woodpecker.selection.FixFunctionRegistry.resolve_identifier", lambda identifier: identifier
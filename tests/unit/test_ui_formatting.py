@@ -9,6 +9,7 @@ from woodpecker.ui.formatting import (
     format_fix_stats,
     format_fixes,
     format_recipes,
+    format_timings,
 )
 
 
@@ -109,6 +110,32 @@ def test_format_fix_stats_json_includes_execution_context():
     assert payload["provenance"] == "woodpecker.prov.json"
 
 
+def test_format_fix_stats_jsonl_renders_single_summary_record():
+    output = format_fix_stats(
+        {
+            "attempted": 2,
+            "changed": 1,
+            "persist_attempted": 0,
+            "persisted": 0,
+            "persist_failed": 0,
+            "preview": [{"path": "a.nc", "fix_id": "tests.fix", "changed": True}],
+        },
+        fmt="jsonl",
+        dry_run=True,
+        force_apply=False,
+        resolved_output_format="auto",
+        provenance=False,
+        provenance_path=Path("woodpecker.prov.json"),
+    )
+
+    assert "\n" not in output
+    payload = json.loads(output)
+    assert payload["record"] == "summary"
+    assert payload["mode"] == "dry-run"
+    assert payload["attempted"] == 2
+    assert "preview" not in payload
+
+
 def test_format_fix_stats_json_includes_preview_entries():
     payload = json.loads(
         format_fix_stats(
@@ -192,3 +219,45 @@ def test_format_fix_stats_text_includes_dry_run_preview():
     assert "cmip6_bad.nc: woodpecker.normalize_tas_units_to_kelvin" in output
     assert "careful: value transformation" in output
     assert "would change" in output
+
+
+def test_format_timings_lists_phases_and_slowest_fixes():
+    totals = {"count": 1, "wall": 0.5, "cpu": 0.25, "peak_rss_delta": 2**20}
+    output = format_timings(
+        {
+            "phases": {"load": totals, "apply": totals},
+            "fixes": {"tests.slow": {**totals, "wall": 2.0}, "tests.fast": totals},
+            "inputs": {"a.nc": totals},
+        },
+        top=1,
+    )
+
+    lines = output.splitlines()
+    assert lines[0] == "Profile:"
+    assert lines[2].startswith("load") and lines[2].endswith("1.0")
+    assert any(line.startswith("tests.slow") for line in lines)
+    assert not any(line.startswith("tests.fast") for line in lines)
+    assert format_timings({}) == ""
+
+
+def test_format_fix_stats_json_omits_raw_timing_events():
+    payload = json.loads(
+        format_fix_stats(
+            {
+                "attempted": 0,
+                "changed": 0,
+                "persist_attempted": 0,
+                "persisted": 0,
+                "persist_failed": 0,
+                "timings": {"phases": {}, "fixes": {}, "inputs": {}, "events": [{}]},
+            },
+            fmt="json",
+            dry_run=True,
+            force_apply=False,
+            resolved_output_format="auto",
+            provenance=False,
+            provenance_path=Path("woodpecker.prov.json"),
+        )
+    )
+
+    assert payload["timings"] == {"phases": {}, "fixes": {}, "inputs": {}}
@@ -1,14 +1,50 @@
 """Woodpecker: lightweight fix catalog + scaffolding for climate dataset fixes."""
 
-from . import recipe as recipe
-from .api import check, fix
-from .results import CheckResult, FixResult
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import fixes as fixes
+    from . import recipe as recipe
+    from .api import check, fix, iter_check, iter_fix
+    from .results import CheckResult, FixResult
+
+# Public names load on first access, so ``import woodpecker`` (and the CLI
+# startup) does not import xarray, pydantic or the fix registry.
+_EXPORTS = {
+    "fixes": ".fixes",
+    "recipe": ".recipe",
+    "check": ".api",
+    "fix": ".api",
+    "iter_check": ".api",
+    "iter_fix": ".api",
+    "CheckResult": ".results",
+    "FixResult": ".results",
+}
 
 __all__ = [
     "fixes",
     "recipe",
     "check",
     "fix",
+    "iter_check",
+    "iter_fix",
     "CheckResult",
     "FixResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    target = import_module(module, __name__)
+    value = target if module == f".{name}" else getattr(target, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
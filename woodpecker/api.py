@@ -1,9 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Sequence
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Sequence
 
 import woodpecker.fixes  # noqa: F401  # registers built-in fixes
-from woodpecker.commands import execute_check, execute_fix
+from woodpecker.cache import result_cache_for
+from woodpecker.commands import (
+    check_run_stats,
+    execute_check,
+    execute_fix,
+    iter_execute_check,
+    iter_execute_fix,
+)
+from woodpecker.io.encoding import EncodingPolicy
+from woodpecker.journal import run_journal_for
+from woodpecker.profiling import RunProfile
 from woodpecker.results import CheckResult, FixResult
 
 
@@ -22,22 +33,35 @@ def check(
     categories: Sequence[str] = (),
     options: dict[str, dict[str, Any]] | None = None,
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool = False,
 ) -> CheckResult:
     """Check inputs using directly selected fixes."""
     identifiers = _normalize_fixes(fixes)
-    return CheckResult(
-        findings=tuple(
-            execute_check(
-                inputs,
-                dataset=dataset,
-                categories=categories,
-                identifiers=identifiers,
-                fix_options=options,
-                ordered_identifiers=identifiers,
-                strict_io=strict_io,
-            )
+    cache = result_cache_for(cache_dir)
+    run_profile = RunProfile() if profile else None
+    findings = tuple(
+        execute_check(
+            inputs,
+            dataset=dataset,
+            categories=categories,
+            identifiers=identifiers,
+            fix_options=options,
+            ordered_identifiers=identifiers,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            cache=cache,
+            profile=run_profile,
         )
     )
+    return CheckResult(findings=findings, stats=check_run_stats(cache, run_profile))
 
 
 def fix(
@@ -49,9 +73,24 @@ def fix(
     output_format: str = "auto",
     options: dict[str, dict[str, Any]] | None = None,
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool = False,
+    journal: str | Path | None = None,
+    resume: bool = False,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
 ) -> FixResult:
     """Apply directly selected fixes and return structured stats."""
     identifiers = _normalize_fixes(fixes)
+    cache = result_cache_for(cache_dir)
+    run_profile = RunProfile() if profile else None
+    run_journal = run_journal_for(journal, resume=resume)
     return FixResult(
         stats=execute_fix(
             inputs,
@@ -63,5 +102,107 @@ def fix(
             fix_options=options,
             ordered_identifiers=identifiers,
             strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            cache=cache,
+            profile=run_profile,
+            journal=run_journal,
+            keep_backup=keep_backup,
+            output_dir=output_dir,
+            writers=writers,
+            encoding=encoding,
         )
     )
+
+
+def iter_check(
+    inputs: Any,
+    fixes: str | Sequence[str] | None = None,
+    dataset: str | None = None,
+    categories: Sequence[str] = (),
+    options: dict[str, dict[str, Any]] | None = None,
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool | RunProfile = False,
+) -> Iterator[Mapping[str, str]]:
+    """Yield findings input by input instead of collecting them in a CheckResult.
+
+    Findings carry no timings; pass a ``RunProfile`` as *profile* and read
+    ``profile.summary()`` once the findings are consumed.
+    """
+    identifiers = _normalize_fixes(fixes)
+    cache = result_cache_for(cache_dir)
+    run_profile = profile if isinstance(profile, RunProfile) else RunProfile() if profile else None
+    return iter_execute_check(
+        inputs,
+        dataset=dataset,
+        categories=categories,
+        identifiers=identifiers,
+        fix_options=options,
+        ordered_identifiers=identifiers,
+        strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
+        cache=cache,
+        profile=run_profile,
+    )
+
+
+def iter_fix(
+    inputs: Any,
+    fixes: str | Sequence[str] | None = None,
+    dataset: str | None = None,
+    categories: Sequence[str] = (),
+    dry_run: bool = True,
+    output_format: str = "auto",
+    options: dict[str, dict[str, Any]] | None = None,
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool = False,
+    journal: str | Path | None = None,
+    resume: bool = False,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+) -> Iterator[FixResult]:
+    """Yield one FixResult per input as soon as that input is processed."""
+    identifiers = _normalize_fixes(fixes)
+    cache = result_cache_for(cache_dir)
+    run_profile = RunProfile() if profile else None
+    run_journal = run_journal_for(journal, resume=resume)
+    stats = iter_execute_fix(
+        inputs,
+        dataset=dataset,
+        categories=categories,
+        identifiers=identifiers,
+        dry_run=dry_run,
+        output_format=output_format,
+        fix_options=options,
+        ordered_identifiers=identifiers,
+        strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
+        cache=cache,
+        profile=run_profile,
+        journal=run_journal,
+        keep_backup=keep_backup,
+        output_dir=output_dir,
+        writers=writers,
+        encoding=encoding,
+    )
+    return (FixResult(stats=input_stats) for input_stats in stats)
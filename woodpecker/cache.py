@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from woodpecker.io import DataInput
+
+
+CACHE_DIR_ENV = "WOODPECKER_CACHE_DIR"
+CACHE_SCHEMA_VERSION = 1
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=None)
+def _package_version(package: str) -> str:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _fix_versions(fix: Any) -> dict[str, str]:
+    versions = {"woodpecker": _package_version("woodpecker")}
+    package = getattr(type(fix), "__module__", "").split(".", 1)[0]
+    if package and package != "woodpecker":
+        versions[package] = _package_version(package.replace("_", "-"))
+    return versions
+
+
+def _hash_file(path: Path, digest: Any) -> None:
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+
+
+def _iter_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return sorted(item for item in path.rglob("*") if item.is_file())
+    return [path]
+
+
+class ResultCache:
+    """Persistent per-input, per-fix result cache for check and dry-run fix runs.
+
+    Entries are keyed on the input path, its size and mtime (or content hash),
+    the fix id and config, and the woodpecker/plugin versions. Only path-based
+    inputs are cached. Hit/miss counters count inputs, not fixes: a hit means
+    the input was answered without calling ``DataInput.load()``.
+    """
+
+    def __init__(self, directory: str | Path, *, hash_content: bool = False):
+        self.directory = Path(directory).expanduser()
+        self.hash_content = hash_content
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, data_input: DataInput) -> dict[str, Any] | None:
+        """Return the on-disk state of *data_input*, or None when it cannot be cached."""
+        paths = data_input.source_files()
+        if not paths or not all(path.exists() for path in paths):
+            return None
+        files = [(path, item) for path in paths for item in _iter_files(path)]
+        resolved = [str(path.resolve()) for path in paths]
+        payload: dict[str, Any] = {
+            "path": resolved[0] if len(resolved) == 1 else resolved,
+            "size": sum(item.stat().st_size for _, item in files),
+        }
+        checksum = data_input.metadata.get("checksum")
+        if self.hash_content and checksum:
+            # A checksum declared by a manifest stands in for reading the content.
+            payload["checksum"] = str(checksum)
+        elif self.hash_content:
+            digest = hashlib.sha256()
+            for path, item in files:
+                digest.update(str(item.relative_to(path) if item != path else "").encode())
+                _hash_file(item, digest)
+            payload["sha256"] = digest.hexdigest()
+        else:
+            payload["mtime_ns"] = max((item.stat().st_mtime_ns for _, item in files), default=0)
+        return payload
+
+    def key(self, fingerprint: dict[str, Any], kind: str, fix: Any) -> str:
+        payload = {
+            "schema": CACHE_SCHEMA_VERSION,
+            "input": fingerprint,
+            "kind": kind,
+            "fix_id": getattr(fix, "id", "") or type(fix).__qualname__,
+            "config": getattr(fix, "config", {}) or {},
+            "versions": _fix_versions(fix),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        try:
+            return json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        target = self._entry_path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(value, handle)
+            os.replace(tmp_name, target)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def record(self, *, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+
+def result_cache_for(cache_dir: str | Path | None) -> ResultCache | None:
+    """Return a ResultCache for *cache_dir*, or None when caching is not requested."""
+    return ResultCache(cache_dir) if cache_dir is not None else None
+
+
+def resolve_result_cache(
+    cache_dir: str | Path | None = None,
+    *,
+    enabled: bool = True,
+) -> ResultCache | None:
+    """Return a ResultCache for *cache_dir* or ``$WOODPECKER_CACHE_DIR``, if any."""
+    if not enabled:
+        return None
+    location = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not location:
+        return None
+    return ResultCache(location)
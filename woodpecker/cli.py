@@ -2,28 +2,54 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
 
 import click
 
-import woodpecker.fixes  # noqa: F401  # registers built-in fixes
-from woodpecker.commands import (
-    execute_check_context,
-    execute_fix_context,
-    execute_load_recipes,
-)
-from woodpecker.fixes.registry import FixFunctionRegistry
-from woodpecker.io import get_io_availability
-from woodpecker.provenance import write_fix_provenance
-from woodpecker.recipes.resolver import RunContext, resolve_run_context
-from woodpecker.stores.helpers import create_recipe_store
-from woodpecker.ui.formatting import format_findings, format_fix_stats, format_fixes, format_recipes
+from woodpecker.cache import CACHE_DIR_ENV
+from woodpecker.io.encoding import COMPRESSORS
+from woodpecker.io.runtime import get_io_availability, normalize_chunks
+from woodpecker.scheduling import SCHEDULES, parse_byte_size
+
+# Only light modules are imported above; fixes, recipes, stores, runner,
+# provenance and formatting (and with them xarray, pydantic and prov) are
+# imported inside the commands that use them, keeping ``--help`` fast.
+if TYPE_CHECKING:
+    from woodpecker.cache import ResultCache
+    from woodpecker.profiling import RunProfile
+    from woodpecker.recipes.resolver import RunContext
+    from woodpecker.runner import FixRunStats
 
 T = TypeVar("T")
 STORE_CHOICES = ["catalog", "json", "duckdb", "auto"]
+RUN_FORMAT_CHOICES = ["text", "json", "jsonl"]
 WRITABLE_STORE_CHOICES = ["json", "duckdb"]
 
 
+def execute_check_context(context: RunContext, **kwargs: Any) -> list[dict[str, str]]:
+    from woodpecker.commands import execute_check_context
+
+    return execute_check_context(context, **kwargs)
+
+
+def iter_check_context(context: RunContext, **kwargs: Any) -> Iterator[dict[str, str]]:
+    from woodpecker.commands import iter_check_context
+
+    return iter_check_context(context, **kwargs)
+
+
+def execute_fix_context(context: RunContext, **kwargs: Any) -> dict[str, Any]:
+    from woodpecker.commands import execute_fix_context
+
+    return execute_fix_context(context, **kwargs)
+
+
+def iter_fix_context(context: RunContext, **kwargs: Any) -> Iterator[FixRunStats]:
+    from woodpecker.commands import iter_fix_context
+
+    return iter_fix_context(context, **kwargs)
+
+
 def _with_click_errors(func: Callable[[], T]) -> T:
     """Run a callable and normalize common argument/config errors for CLI output."""
 
@@ -35,6 +61,94 @@ def _with_click_errors(func: Callable[[], T]) -> T:
         raise click.ClickException(str(exc)) from exc
 
 
+def _byte_size_option(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
+    try:
+        return parse_byte_size(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
+def _dataset_cache_option(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> int | None:
+    if value is not None and value.strip() == "0":
+        return None
+    return _byte_size_option(ctx, param, value)
+
+
+def _chunks_option(ctx: click.Context, param: click.Parameter, value: str | None) -> object:
+    try:
+        return normalize_chunks(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
+def _paths_argument(
+    ctx: click.Context, param: click.Parameter, value: tuple[Path, ...]
+) -> tuple[Path, ...]:
+    """Check that PATHS exist; ``@file`` names a manifest file that must exist."""
+    from woodpecker.io.manifest import is_manifest_reference
+
+    for path in value:
+        text = str(path)
+        target = Path(text[1:]) if is_manifest_reference(text) else path
+        if not target.exists():
+            raise click.BadParameter(f"Path '{text}' does not exist.", ctx=ctx, param=param)
+    return value
+
+
+def _split_manifests(
+    paths: tuple[Path, ...], from_manifest: tuple[Path, ...]
+) -> tuple[tuple[Path, ...], tuple[Path, ...]]:
+    """Separate ``@file`` manifest references from plain PATHS."""
+    from woodpecker.io.manifest import is_manifest_reference
+
+    plain = tuple(path for path in paths if not is_manifest_reference(str(path)))
+    referenced = tuple(Path(str(path)[1:]) for path in paths if is_manifest_reference(str(path)))
+    return plain, (*referenced, *from_manifest)
+
+
+def _use_dataset_cache(max_bytes: int | None) -> None:
+    """Share opened dataset headers between recipe matching and the run until the command ends."""
+    from woodpecker.io.dataset_cache import dataset_cache_mode
+
+    click.get_current_context().with_resource(dataset_cache_mode(max_bytes))
+
+
+def _echo_cache_stats(cache: ResultCache | None) -> None:
+    """Report result-cache counters on stderr so stdout stays machine-readable."""
+    from woodpecker.ui.formatting import format_cache_stats
+
+    if cache is not None:
+        line = format_cache_stats(cache.stats())
+        if line:
+            click.echo(line, err=True)
+
+
+def _report_profile(profile: RunProfile | None, output: Path | None) -> None:
+    """Print the timing summary to stderr and export raw events when requested."""
+    from woodpecker.profiling import write_timing_events
+    from woodpecker.ui.formatting import format_timings
+
+    if profile is None:
+        return
+    summary = format_timings(profile.summary())
+    if summary:
+        click.echo(summary, err=True)
+    if output is not None:
+        write_timing_events(output, profile.events)
+
+
+def _echo_jsonl_previews(parts: Iterable[FixRunStats]) -> Iterator[FixRunStats]:
+    """Echo each preview as a JSON line while passing per-input stats through."""
+    from woodpecker.ui.formatting import format_jsonl_record
+
+    for part in parts:
+        for item in part["preview"]:
+            click.echo(format_jsonl_record("preview", item))
+        yield part
+
+
 @click.group()
 def cli():
     """Woodpecker CLI."""
@@ -47,13 +161,16 @@ def cli():
 @click.option("--format", "fmt", type=click.Choice(["text", "json", "md"]), default="text")
 def list_fixes(dataset: str | None, categories: tuple[str, ...], fmt: str):
     """List registered fixes (discoverable identifiers)."""
+    from woodpecker.fixes.registry import FixFunctionRegistry
+    from woodpecker.ui.formatting import format_fixes
+
     filters = {}
     if dataset:
         filters["dataset"] = dataset
     if categories:
         filters["categories"] = list(categories) if len(categories) > 1 else categories[0]
 
-    fixes = FixFunctionRegistry.discover(filters=filters or None)
+    fixes = FixFunctionRegistry.describe(filters=filters or None)
     click.echo(format_fixes(fixes, fmt))
 
 
@@ -79,6 +196,8 @@ def list_fixes(dataset: str | None, categories: tuple[str, ...], fmt: str):
 @click.option("--format", "fmt", type=click.Choice(["text", "json"]), default="text")
 def list_recipes(store_type: str, recipe_location: Path | None, fmt: str):
     """List recipes from a configured store backend."""
+    from woodpecker.stores.helpers import create_recipe_store
+    from woodpecker.ui.formatting import format_recipes
 
     store = _with_click_errors(lambda: create_recipe_store(store_type, recipe_location))
     recipes = _with_click_errors(store.list_recipes)
@@ -136,6 +255,8 @@ def load_recipes(
     fmt: str,
 ):
     """Load recipes into a target store from a source store location."""
+    from woodpecker.commands import execute_load_recipes
+
     result = _with_click_errors(
         lambda: execute_load_recipes(
             store_type=store_type,
@@ -155,7 +276,7 @@ def load_recipes(
 
 
 @cli.command("check")
-@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.argument("paths", nargs=-1, type=click.Path(path_type=Path), callback=_paths_argument)
 @click.option(
     "--store",
     "store_type",
@@ -185,13 +306,114 @@ def load_recipes(
     multiple=True,
     help="Run only selected fix identifiers (repeatable)",
 )
+@click.option(
+    "--from-manifest",
+    "from_manifest",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Read inputs from a text, JSONL or Parquet file list; same as passing @FILE (repeatable).",
+)
+@click.option(
+    "--include",
+    "include",
+    multiple=True,
+    help="When walking directories, only process files matching this glob, e.g. '*.nc' (repeatable).",
+)
+@click.option(
+    "--exclude",
+    "exclude",
+    multiple=True,
+    help="When walking directories, skip files and subdirectories matching this glob (repeatable).",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Descend at most this many directory levels (1: only files directly in PATHS).",
+)
+@click.option(
+    "--group-shards",
+    "shard_grouping",
+    default=None,
+    help=(
+        "Treat NetCDF files split along time as one dataset: dataset_id, time-range "
+        "(CMOR file names), or a regex whose first group names the dataset."
+    ),
+)
 @click.option(
     "--strict-io/--no-strict-io",
     default=False,
     show_default=True,
     help="Fail if dataset loading falls back due to unavailable/failed I/O backend.",
 )
-@click.option("--format", "fmt", type=click.Choice(["text", "json"]), default="text")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to process inputs in parallel.",
+)
+@click.option(
+    "--schedule",
+    type=click.Choice(SCHEDULES),
+    default="input",
+    show_default=True,
+    help="Order in which parallel workers pick up inputs; largest-first starts big files early.",
+)
+@click.option(
+    "--max-inflight-memory",
+    default=None,
+    callback=_byte_size_option,
+    help="Cap the summed on-disk size of inputs in flight across workers, e.g. 8G.",
+)
+@click.option(
+    "--chunks",
+    default=None,
+    callback=_chunks_option,
+    help="Open inputs as dask arrays with these chunks, e.g. auto or time=12,lat=90.",
+)
+@click.option(
+    "--dataset-cache",
+    default="256M",
+    show_default=True,
+    callback=_dataset_cache_option,
+    help=(
+        "Keep opened dataset headers up to this size for reuse between recipe matching "
+        "and the run; 0 disables."
+    ),
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help=f"Directory for cached check/dry-run results (default: ${CACHE_DIR_ENV}, if set).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore the result cache for this run.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Time each phase per input and fix and print a summary table to stderr.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write raw timing events as JSON to this file (implies --profile).",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(RUN_FORMAT_CHOICES),
+    default="text",
+    help="Output format; jsonl streams one finding per line as it is produced.",
+)
 def check_cmd(
     paths: tuple[Path, ...],
     store_type: str,
@@ -200,10 +422,31 @@ def check_cmd(
     dataset: str | None,
     categories: tuple[str, ...],
     identifiers: tuple[str, ...],
+    from_manifest: tuple[Path, ...],
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+    max_depth: int | None,
+    shard_grouping: str | None,
     strict_io: bool,
+    jobs: int,
+    schedule: str,
+    max_inflight_memory: int | None,
+    chunks: object,
+    dataset_cache: int | None,
+    cache_dir: Path | None,
+    no_cache: bool,
+    profile: bool,
+    profile_output: Path | None,
     fmt: str,
 ):
     """Check NetCDF files and report findings grouped by fix identifier."""
+    from woodpecker.cache import resolve_result_cache
+    from woodpecker.profiling import RunProfile
+    from woodpecker.recipes.resolver import resolve_run_context
+    from woodpecker.ui.formatting import format_findings, format_jsonl_record
+
+    paths, manifests = _split_manifests(paths, from_manifest)
+    _use_dataset_cache(dataset_cache)
     context = _with_click_errors(
         lambda: resolve_run_context(
             paths=paths,
@@ -214,17 +457,49 @@ def check_cmd(
             categories=categories,
             identifiers=identifiers,
             output_format="auto",
+            include=include,
+            exclude=exclude,
+            max_depth=max_depth,
+            manifests=manifests,
+            shard_grouping=shard_grouping,
         )
     )
 
-    findings = _with_click_errors(lambda: execute_check_context(context, strict_io=strict_io))
+    cache = resolve_result_cache(cache_dir, enabled=not no_cache)
+    run_profile = RunProfile() if profile or profile_output else None
+    run_kwargs = {
+        "strict_io": strict_io,
+        "jobs": jobs,
+        "schedule": schedule,
+        "max_inflight_memory": max_inflight_memory,
+        "chunks": chunks,
+        "cache": cache,
+        "profile": run_profile,
+    }
+    if fmt == "jsonl":
+
+        def stream_findings() -> int:
+            count = 0
+            for finding in iter_check_context(context, **run_kwargs):
+                click.echo(format_jsonl_record("finding", finding))
+                count += 1
+            return count
+
+        count = _with_click_errors(stream_findings)
+        _echo_cache_stats(cache)
+        _report_profile(run_profile, profile_output)
+        raise SystemExit(1 if count else 0)
+
+    findings = _with_click_errors(lambda: execute_check_context(context, **run_kwargs))
+    _echo_cache_stats(cache)
+    _report_profile(run_profile, profile_output)
     output = format_findings(findings, fmt)
     if output:
         click.echo(output)
 
     if not findings and fmt == "text":
         click.echo(
-            f"No issues found ({len(context.inputs)} NetCDF files scanned, {len(context.fixes)} fixes selected)."
+            f"No issues found ({context.inputs.count} NetCDF files scanned, {len(context.fixes)} fixes selected)."
         )
 
     raise SystemExit(1 if findings else 0)
@@ -244,7 +519,7 @@ def io_status(fmt: str):
 
 
 @cli.command("fix")
-@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.argument("paths", nargs=-1, type=click.Path(path_type=Path), callback=_paths_argument)
 @click.option(
     "--store",
     "store_type",
@@ -274,12 +549,120 @@ def io_status(fmt: str):
     multiple=True,
     help="Run only selected fix identifiers (repeatable)",
 )
+@click.option(
+    "--from-manifest",
+    "from_manifest",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Read inputs from a text, JSONL or Parquet file list; same as passing @FILE (repeatable).",
+)
+@click.option(
+    "--include",
+    "include",
+    multiple=True,
+    help="When walking directories, only process files matching this glob, e.g. '*.nc' (repeatable).",
+)
+@click.option(
+    "--exclude",
+    "exclude",
+    multiple=True,
+    help="When walking directories, skip files and subdirectories matching this glob (repeatable).",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Descend at most this many directory levels (1: only files directly in PATHS).",
+)
+@click.option(
+    "--group-shards",
+    "shard_grouping",
+    default=None,
+    help=(
+        "Treat NetCDF files split along time as one dataset: dataset_id, time-range "
+        "(CMOR file names), or a regex whose first group names the dataset."
+    ),
+)
 @click.option(
     "--strict-io/--no-strict-io",
     default=False,
     show_default=True,
     help="Fail if dataset loading falls back due to unavailable/failed I/O backend.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to process inputs in parallel.",
+)
+@click.option(
+    "--schedule",
+    type=click.Choice(SCHEDULES),
+    default="input",
+    show_default=True,
+    help="Order in which parallel workers pick up inputs; largest-first starts big files early.",
+)
+@click.option(
+    "--max-inflight-memory",
+    default=None,
+    callback=_byte_size_option,
+    help="Cap the summed on-disk size of inputs in flight across workers, e.g. 8G.",
+)
+@click.option(
+    "--chunks",
+    default=None,
+    callback=_chunks_option,
+    help="Open inputs as dask arrays with these chunks, e.g. auto or time=12,lat=90.",
+)
+@click.option(
+    "--dataset-cache",
+    default="256M",
+    show_default=True,
+    callback=_dataset_cache_option,
+    help=(
+        "Keep opened dataset headers up to this size for reuse between recipe matching "
+        "and the run; 0 disables."
+    ),
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help=f"Directory for cached check/dry-run results (default: ${CACHE_DIR_ENV}, if set).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore the result cache for this run.",
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Record per-input progress in this JSON-lines checkpoint journal.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Skip inputs already completed in --journal and merge their stats.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Time each phase per input and fix and print a summary table to stderr.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write raw timing events as JSON to this file (implies --profile).",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -299,6 +682,48 @@ def io_status(fmt: str):
     show_default=True,
     help="Output format for writes.",
 )
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Write fixed files below this directory, mirroring their paths relative to the working directory.",
+)
+@click.option(
+    "--writers",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Background threads writing fixed files while the next inputs are fixed (with --jobs 1).",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(COMPRESSORS),
+    default=None,
+    help="Compressor for rewritten outputs' data variables (NetCDF supports zlib only).",
+)
+@click.option(
+    "--compression-level",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Compression level (default: 1 for zlib, 5 for blosc, 3 for zstd).",
+)
+@click.option(
+    "--shuffle/--no-shuffle",
+    default=None,
+    help="Byte-shuffle data variables before compressing them.",
+)
+@click.option(
+    "--output-chunk-size",
+    default=None,
+    callback=_byte_size_option,
+    help="Target size of one output chunk, e.g. 16M; chunks keep trailing dimensions whole.",
+)
+@click.option(
+    "--keep-backup",
+    is_flag=True,
+    default=False,
+    help="Keep each replaced file or store next to it with a .bak suffix.",
+)
 @click.option(
     "--provenance/--no-provenance",
     default=True,
@@ -318,7 +743,13 @@ def io_status(fmt: str):
     default=False,
     help="Embed per-dataset provenance metadata into output dataset attrs on write.",
 )
-@click.option("--format", "fmt", type=click.Choice(["text", "json"]), default="text")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(RUN_FORMAT_CHOICES),
+    default="text",
+    help="Output format; jsonl streams one preview per line followed by a summary record.",
+)
 def fix_cmd(
     paths: tuple[Path, ...],
     store_type: str,
@@ -327,16 +758,62 @@ def fix_cmd(
     dataset: str | None,
     categories: tuple[str, ...],
     identifiers: tuple[str, ...],
+    from_manifest: tuple[Path, ...],
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+    max_depth: int | None,
+    shard_grouping: str | None,
     strict_io: bool,
+    jobs: int,
+    schedule: str,
+    max_inflight_memory: int | None,
+    chunks: object,
+    dataset_cache: int | None,
+    cache_dir: Path | None,
+    no_cache: bool,
+    journal_path: Path | None,
+    resume: bool,
+    profile: bool,
+    profile_output: Path | None,
     dry_run: bool,
     force_apply: bool,
     output_format: str,
+    output_dir: Path | None,
+    writers: int,
+    compression: str | None,
+    compression_level: int | None,
+    shuffle: bool | None,
+    output_chunk_size: int | None,
+    keep_backup: bool,
     provenance: bool,
     provenance_path: Path,
     embed_provenance_metadata: bool,
     fmt: str,
 ):
     """Apply selected fixes to NetCDF files."""
+    from woodpecker.cache import resolve_result_cache
+    from woodpecker.io.encoding import EncodingPolicy
+    from woodpecker.journal import run_journal_for
+    from woodpecker.profiling import RunProfile
+    from woodpecker.provenance import write_fix_provenance
+    from woodpecker.recipes.resolver import resolve_run_context
+    from woodpecker.runner import merge_fix_stats
+    from woodpecker.ui.formatting import format_fix_stats
+
+    paths, manifests = _split_manifests(paths, from_manifest)
+    _use_dataset_cache(dataset_cache)
+    if resume and journal_path is None:
+        raise click.UsageError("--resume requires --journal.")
+    run_profile = RunProfile() if profile or profile_output else None
+    try:
+        encoding = EncodingPolicy(
+            compressor=compression,
+            level=compression_level,
+            shuffle=shuffle,
+            chunk_bytes=output_chunk_size,
+        )
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
 
     def run_fix_command() -> tuple[RunContext, dict[str, object]]:
         context = resolve_run_context(
@@ -348,21 +825,43 @@ def fix_cmd(
             categories=categories,
             identifiers=identifiers,
             output_format=output_format,
+            include=include,
+            exclude=exclude,
+            max_depth=max_depth,
+            manifests=manifests,
+            shard_grouping=shard_grouping,
         )
         run_id = None
         if embed_provenance_metadata and not dry_run:
             run_id = f"woodpecker-{Path.cwd().name}"
-        stats = execute_fix_context(
-            context,
-            dry_run=dry_run,
-            force_apply=force_apply,
-            embed_provenance_metadata=embed_provenance_metadata,
-            provenance_run_id=run_id,
-            strict_io=strict_io,
-        )
-        return context, stats
+        fix_kwargs = {
+            "dry_run": dry_run,
+            "force_apply": force_apply,
+            "embed_provenance_metadata": embed_provenance_metadata,
+            "provenance_run_id": run_id,
+            "strict_io": strict_io,
+            "jobs": jobs,
+            "schedule": schedule,
+            "max_inflight_memory": max_inflight_memory,
+            "chunks": chunks,
+            "cache": resolve_result_cache(cache_dir, enabled=not no_cache),
+            "journal": run_journal_for(journal_path, resume=resume),
+            "profile": run_profile,
+            "keep_backup": keep_backup,
+            "output_dir": output_dir,
+            "writers": writers,
+            "encoding": None if encoding.is_empty else encoding,
+        }
+        if fmt == "jsonl":
+            parts = iter_fix_context(context, **fix_kwargs)
+            # Provenance records the full preview like json and text runs do;
+            # without it the streamed previews need not be kept in memory.
+            previews = _echo_jsonl_previews(parts)
+            return context, merge_fix_stats(previews, keep_preview=provenance)
+        return context, execute_fix_context(context, **fix_kwargs)
 
     context, stats = _with_click_errors(run_fix_command)
+    _report_profile(run_profile, profile_output)
 
     if provenance:
         _with_click_errors(
@@ -373,6 +872,7 @@ def fix_cmd(
                 store_type=store_type,
                 recipe_location=recipe,
                 provenance_path=provenance_path,
+                output_dir=output_dir,
             )
         )
 
@@ -387,7 +887,7 @@ def fix_cmd(
             provenance_path=provenance_path,
         )
     )
-    if fmt == "json" and not dry_run and stats.get("persist_failed", 0) > 0:
+    if fmt in ("json", "jsonl") and not dry_run and stats.get("persist_failed", 0) > 0:
         raise SystemExit(1)
 
 
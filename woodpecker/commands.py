@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Sequence, TypedDict
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Sequence, TypedDict
 
-from woodpecker.io import DataInput, normalize_inputs
-from woodpecker.runner import run_check, run_fix
+from woodpecker.io import DataInput, iter_inputs, normalize_inputs
+from woodpecker.io.encoding import EncodingPolicy, encoding_policy, merge_encoding
+from woodpecker.runner import iter_check, iter_fix, merge_fix_stats
 from woodpecker.selection import select_fixes
 
 if TYPE_CHECKING:
+    from woodpecker.cache import ResultCache
+    from woodpecker.journal import RunJournal
+    from woodpecker.profiling import RunProfile
     from woodpecker.recipes.resolver import RunContext
     from woodpecker.runner import FixRunStats
 
@@ -19,6 +23,17 @@ class RunFixKwargs(TypedDict, total=False):
     embed_provenance_metadata: bool
     provenance_run_id: str
     strict_io: bool
+    chunks: Any
+    jobs: int
+    cache: ResultCache
+    journal: RunJournal
+    keep_backup: bool
+    output_dir: str | Path
+    writers: int
+    encoding: EncodingPolicy
+    profile: RunProfile
+    schedule: str
+    max_inflight_memory: int | str
 
 
 def _resolve_recipe_api_selection(
@@ -28,12 +43,22 @@ def _resolve_recipe_api_selection(
     identifiers: Sequence[str],
     recipe_id: str | None,
     store_type: str,
-) -> tuple[list[DataInput], tuple[str, ...], tuple[str, ...], dict[str, dict[str, Any]]]:
-    from woodpecker.recipes.resolver import resolve_recipe_source, resolve_selection_inputs
+) -> tuple[
+    list[DataInput],
+    tuple[str, ...],
+    tuple[str, ...],
+    dict[str, dict[str, Any]],
+    EncodingPolicy | None,
+]:
+    from woodpecker.recipes.resolver import (
+        recipe_encoding,
+        resolve_recipe_source,
+        resolve_selection_inputs,
+    )
 
     resolved_inputs = inputs if inputs is not None else [Path.cwd()]
     normalized = normalize_inputs(resolved_inputs)
-    _, _, source_identifiers, source_fix_options = resolve_recipe_source(
+    _, recipes, source_identifiers, source_fix_options = resolve_recipe_source(
         inputs=normalized,
         store_type=store_type,
         recipe_location=Path(recipe_path) if recipe_path is not None else None,
@@ -46,10 +71,34 @@ def _resolve_recipe_api_selection(
             source_fix_options=source_fix_options,
         )
     )
-    return normalized, resolved_identifiers, resolved_ordered_identifiers, resolved_fix_options
+    return (
+        normalized,
+        resolved_identifiers,
+        resolved_ordered_identifiers,
+        resolved_fix_options,
+        recipe_encoding(recipes),
+    )
 
 
-def execute_check(
+def _select_direct_fixes(
+    *,
+    dataset: str | None,
+    categories: Sequence[str],
+    identifiers: Sequence[str],
+    fix_options: dict[str, dict[str, Any]] | None,
+    ordered_identifiers: Sequence[str],
+) -> list[Any]:
+    return select_fixes(
+        dataset=dataset,
+        categories=categories,
+        identifiers=identifiers,
+        strict_identifiers=True,
+        fix_options=fix_options,
+        ordered_identifiers=ordered_identifiers,
+    )
+
+
+def iter_execute_check(
     inputs: Any,
     *,
     dataset: str | None = None,
@@ -58,20 +107,70 @@ def execute_check(
     fix_options: dict[str, dict[str, Any]] | None = None,
     ordered_identifiers: Sequence[str] = (),
     strict_io: bool = False,
-) -> list[dict[str, str]]:
-    normalized = normalize_inputs(inputs)
-    fixes = select_fixes(
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> Iterator[dict[str, str]]:
+    normalized = iter_inputs(inputs)
+    fixes = _select_direct_fixes(
         dataset=dataset,
         categories=categories,
         identifiers=identifiers,
-        strict_identifiers=True,
         fix_options=fix_options,
         ordered_identifiers=ordered_identifiers,
     )
-    return run_check(normalized, fixes, strict_io=strict_io)
+    return iter_check(
+        normalized,
+        fixes,
+        strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        cache=cache,
+        profile=profile,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
+    )
 
 
-def execute_fix(
+def execute_check(
+    inputs: Any,
+    *,
+    dataset: str | None = None,
+    categories: Sequence[str] = (),
+    identifiers: Sequence[str] = (),
+    fix_options: dict[str, dict[str, Any]] | None = None,
+    ordered_identifiers: Sequence[str] = (),
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> list[dict[str, str]]:
+    return list(
+        iter_execute_check(
+            inputs,
+            dataset=dataset,
+            categories=categories,
+            identifiers=identifiers,
+            fix_options=fix_options,
+            ordered_identifiers=ordered_identifiers,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            cache=cache,
+            profile=profile,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+        )
+    )
+
+
+def iter_execute_fix(
     inputs: Any,
     *,
     dataset: str | None = None,
@@ -82,22 +181,92 @@ def execute_fix(
     fix_options: dict[str, dict[str, Any]] | None = None,
     ordered_identifiers: Sequence[str] = (),
     strict_io: bool = False,
-) -> "FixRunStats":
-    normalized = normalize_inputs(inputs)
-    fixes = select_fixes(
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> Iterator["FixRunStats"]:
+    normalized = iter_inputs(inputs)
+    fixes = _select_direct_fixes(
         dataset=dataset,
         categories=categories,
         identifiers=identifiers,
-        strict_identifiers=True,
         fix_options=fix_options,
         ordered_identifiers=ordered_identifiers,
     )
-    return run_fix(
+    return iter_fix(
         normalized,
         fixes,
         dry_run=dry_run,
         output_format=output_format,
         strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        cache=cache,
+        profile=profile,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
+        journal=journal,
+        keep_backup=keep_backup,
+        output_dir=output_dir,
+        writers=writers,
+        encoding=encoding,
+    )
+
+
+def execute_fix(
+    inputs: Any,
+    *,
+    dataset: str | None = None,
+    categories: Sequence[str] = (),
+    identifiers: Sequence[str] = (),
+    dry_run: bool = True,
+    output_format: str = "auto",
+    fix_options: dict[str, dict[str, Any]] | None = None,
+    ordered_identifiers: Sequence[str] = (),
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> "FixRunStats":
+    return merge_fix_stats(
+        iter_execute_fix(
+            inputs,
+            dataset=dataset,
+            categories=categories,
+            identifiers=identifiers,
+            dry_run=dry_run,
+            output_format=output_format,
+            fix_options=fix_options,
+            ordered_identifiers=ordered_identifiers,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            cache=cache,
+            profile=profile,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            journal=journal,
+            keep_backup=keep_backup,
+            output_dir=output_dir,
+            writers=writers,
+            encoding=encoding,
+        )
     )
 
 
@@ -111,8 +280,14 @@ def execute_check_recipe(
     recipe_id: str | None = None,
     store_type: str = "json",
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
 ) -> list[dict[str, str]]:
-    normalized, resolved_identifiers, resolved_ordered_identifiers, resolved_fix_options = (
+    normalized, resolved_identifiers, resolved_ordered_identifiers, resolved_fix_options, _ = (
         _resolve_recipe_api_selection(
             recipe_path=recipe_path,
             inputs=inputs,
@@ -130,6 +305,12 @@ def execute_check_recipe(
         fix_options=resolved_fix_options,
         ordered_identifiers=resolved_ordered_identifiers,
         strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        cache=cache,
+        profile=profile,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
     )
 
 
@@ -145,15 +326,30 @@ def execute_fix_recipe(
     recipe_id: str | None = None,
     store_type: str = "json",
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
 ) -> "FixRunStats":
-    normalized, resolved_identifiers, resolved_ordered_identifiers, resolved_fix_options = (
-        _resolve_recipe_api_selection(
-            recipe_path=recipe_path,
-            inputs=inputs,
-            identifiers=identifiers,
-            recipe_id=recipe_id,
-            store_type=store_type,
-        )
+    (
+        normalized,
+        resolved_identifiers,
+        resolved_ordered_identifiers,
+        resolved_fix_options,
+        resolved_encoding,
+    ) = _resolve_recipe_api_selection(
+        recipe_path=recipe_path,
+        inputs=inputs,
+        identifiers=identifiers,
+        recipe_id=recipe_id,
+        store_type=store_type,
     )
 
     return execute_fix(
@@ -166,6 +362,41 @@ def execute_fix_recipe(
         fix_options=resolved_fix_options,
         ordered_identifiers=resolved_ordered_identifiers,
         strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        cache=cache,
+        profile=profile,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
+        journal=journal,
+        keep_backup=keep_backup,
+        output_dir=output_dir,
+        writers=writers,
+        encoding=merge_encoding(resolved_encoding, encoding),
+    )
+
+
+def iter_check_context(
+    context: "RunContext",
+    *,
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> Iterator[dict[str, str]]:
+    return iter_check(
+        context.inputs,
+        context.fixes,
+        strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        cache=cache,
+        profile=profile,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
     )
 
 
@@ -173,8 +404,33 @@ def execute_check_context(
     context: "RunContext",
     *,
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
 ) -> list[dict[str, str]]:
-    return run_check(context.inputs, context.fixes, strict_io=strict_io)
+    return list(
+        iter_check_context(
+            context,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            cache=cache,
+            profile=profile,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+        )
+    )
+
+
+def check_run_stats(cache: ResultCache | None, profile: RunProfile | None = None) -> dict[str, Any]:
+    """Collect cache counters and timings for a CheckResult."""
+    stats: dict[str, Any] = dict(cache.stats()) if cache is not None else {}
+    if profile is not None:
+        stats["timings"] = profile.summary()
+    return stats
 
 
 def build_run_fix_kwargs(
@@ -185,12 +441,45 @@ def build_run_fix_kwargs(
     embed_provenance_metadata: bool,
     provenance_run_id: str | None,
     strict_io: bool,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
 ) -> RunFixKwargs:
     run_fix_kwargs: RunFixKwargs = {
         "dry_run": dry_run,
         "output_format": output_format,
         "strict_io": strict_io,
     }
+    if jobs != 1:
+        run_fix_kwargs["jobs"] = jobs
+    if cache is not None:
+        run_fix_kwargs["cache"] = cache
+    if journal is not None:
+        run_fix_kwargs["journal"] = journal
+    if keep_backup:
+        run_fix_kwargs["keep_backup"] = True
+    if output_dir is not None:
+        run_fix_kwargs["output_dir"] = output_dir
+    if writers:
+        run_fix_kwargs["writers"] = writers
+    if encoding is not None:
+        run_fix_kwargs["encoding"] = encoding_policy(encoding)
+    if profile is not None:
+        run_fix_kwargs["profile"] = profile
+    if schedule != "input":
+        run_fix_kwargs["schedule"] = schedule
+    if max_inflight_memory is not None:
+        run_fix_kwargs["max_inflight_memory"] = max_inflight_memory
+    if chunks is not None:
+        run_fix_kwargs["chunks"] = chunks
     if force_apply:
         run_fix_kwargs["force_apply"] = True
     if embed_provenance_metadata and not dry_run:
@@ -199,7 +488,7 @@ def build_run_fix_kwargs(
     return run_fix_kwargs
 
 
-def execute_fix_context(
+def iter_fix_context(
     context: "RunContext",
     *,
     dry_run: bool,
@@ -207,7 +496,18 @@ def execute_fix_context(
     embed_provenance_metadata: bool,
     provenance_run_id: str | None,
     strict_io: bool = False,
-) -> "FixRunStats":
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> Iterator["FixRunStats"]:
     if force_apply and not context.resolved_identifiers:
         raise ValueError(
             "--force-apply requires explicit fix selection via --select or recipe identifiers."
@@ -219,8 +519,62 @@ def execute_fix_context(
         embed_provenance_metadata=embed_provenance_metadata,
         provenance_run_id=provenance_run_id,
         strict_io=strict_io,
+        chunks=chunks,
+        jobs=jobs,
+        cache=cache,
+        profile=profile,
+        schedule=schedule,
+        max_inflight_memory=max_inflight_memory,
+        journal=journal,
+        keep_backup=keep_backup,
+        output_dir=output_dir,
+        writers=writers,
+        encoding=merge_encoding(context.resolved_encoding, encoding),
+    )
+    return iter_fix(context.inputs, context.fixes, **run_fix_kwargs)
+
+
+def execute_fix_context(
+    context: "RunContext",
+    *,
+    dry_run: bool,
+    force_apply: bool,
+    embed_provenance_metadata: bool,
+    provenance_run_id: str | None,
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> "FixRunStats":
+    return merge_fix_stats(
+        iter_fix_context(
+            context,
+            dry_run=dry_run,
+            force_apply=force_apply,
+            embed_provenance_metadata=embed_provenance_metadata,
+            provenance_run_id=provenance_run_id,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            cache=cache,
+            profile=profile,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            journal=journal,
+            keep_backup=keep_backup,
+            output_dir=output_dir,
+            writers=writers,
+            encoding=encoding,
+        )
     )
-    return run_fix(context.inputs, context.fixes, **run_fix_kwargs)
 
 
 def execute_load_recipes(
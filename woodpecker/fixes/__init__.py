@@ -19,6 +19,7 @@ from .labels import (  # noqa: F401
 from .plugins import load_plugins
 from .registry import (  # noqa: F401
     UNPRIORITIZED,
+    DataAccess,
     FixFunction,
     FixFunctionRegistry,
     register_fix_function,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from typing import Any, ClassVar, Optional
 
 import xarray as xr
@@ -8,6 +9,36 @@ import xarray as xr
 from woodpecker.fixes.labels import LabelRegistry, Labels
 
 
+def _names(field: str, value: Any) -> tuple[str, ...] | None:
+    if value is None:
+        return None
+    if isinstance(value, str) or not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError(f"DataAccess.{field} must be a sequence of names or None")
+    names = tuple(str(item).strip() for item in value)
+    if any(not name for name in names):
+        raise ValueError(f"DataAccess.{field} must contain non-empty names")
+    return names
+
+
+@dataclass(frozen=True)
+class DataAccess:
+    """Parts of a dataset a fix function reads.
+
+    ``attrs`` names global attributes and ``variables`` names data variables or
+    coordinates whose attrs, encodings or values are touched; ``None`` means any.
+    ``encodings`` and ``data`` flag access to variable encodings and array values.
+    """
+
+    attrs: tuple[str, ...] | None = None
+    variables: tuple[str, ...] | None = None
+    encodings: bool = False
+    data: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "attrs", _names("attrs", self.attrs))
+        object.__setattr__(self, "variables", _names("variables", self.variables))
+
+
 class FixFunction:
     """Catalog metadata about a fix function plus check/apply behavior hooks.
 
@@ -26,6 +57,14 @@ class FixFunction:
     priority: ClassVar[int] = -1
     dataset: ClassVar[Optional[str]] = None
     labels: ClassVar[list[str]] = [Labels.RISK_REVIEW_BEFORE_APPLYING]
+    # Whether check()/matches() and dry-run apply() read data variable values.
+    # Fixes that only inspect attrs, encodings and coordinates set this to False
+    # so check runs can open inputs header-only.
+    requires_data: ClassVar[bool] = True
+    # Declared dataset access; None means the fix may touch anything. When
+    # ``reads`` is declared, ``reads.data`` takes precedence over requires_data
+    # and check runs load only ``reads.variables`` plus coordinates.
+    reads: ClassVar[Optional[DataAccess]] = None
     metadata_fields: ClassVar[tuple[str, ...]] = (
         "prefix",
         "suffix",
@@ -3,7 +3,7 @@ from __future__ import annotations
 import xarray as xr
 
 from ..labels import Labels
-from ..registry import FixFunction, FixFunctionRegistry
+from ..registry import DataAccess, FixFunction, FixFunctionRegistry
 from .helpers import get_data_unit, is_celsius_unit, target_temperature_variable
 
 
@@ -39,6 +39,7 @@ class NormalizeTasUnitsToKelvin(FixFunction):
     priority = 30
     dataset = None
     labels = [Labels.RISK_VALUE_TRANSFORMATION]
+    reads = DataAccess(attrs=(), variables=("tas", "temp"))
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return _needs_kelvin_conversion(dataset)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import xarray as xr
 
 from ..labels import Labels
-from ..registry import FixFunction, FixFunctionRegistry
+from ..registry import DataAccess, FixFunction, FixFunctionRegistry
 
 
 def _lat_coord_name(dataset: xr.Dataset) -> str | None:
@@ -60,6 +60,7 @@ class EnsureLatitudeIsIncreasing(FixFunction):
     priority = 33
     dataset = None
     labels = [Labels.RISK_COORDINATE_REORDERING]
+    reads = DataAccess(attrs=(), variables=("lat", "latitude"))
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return _needs_lat_flip(dataset)
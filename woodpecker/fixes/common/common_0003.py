@@ -3,7 +3,7 @@ from __future__ import annotations
 import xarray as xr
 
 from ..labels import Labels
-from ..registry import FixFunction, FixFunctionRegistry
+from ..registry import DataAccess, FixFunction, FixFunctionRegistry
 from .helpers import remove_encoding_key, vars_with_encoding_key
 
 _COORDS = ("time", "lat", "latitude", "lon", "longitude")
@@ -28,6 +28,7 @@ class RemoveCoordinateFillValueEncodings(FixFunction):
     priority = 34
     dataset = None
     labels = [Labels.RISK_METADATA_ONLY]
+    reads = DataAccess(attrs=(), variables=_COORDS, encodings=True)
 
     def matches(self, dataset: xr.Dataset) -> bool:
         return _needs_coord_fillvalue_cleanup(dataset)
@@ -72,6 +72,7 @@ class MergeEquivalentDimensions(FixFunction):
     priority = 32
     dataset = None
     labels = [Labels.RISK_DIMENSION_REMAPPING]
+    requires_data = False
 
     def _dims(self) -> tuple[str, ...]:
         config = getattr(self, "config", {}) or {}
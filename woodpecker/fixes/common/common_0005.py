@@ -8,6 +8,7 @@ import xarray as xr
 
 from ..labels import Labels
 from ..registry import FixFunction, FixFunctionRegistry
+from .helpers import MemoizedTransform
 
 
 def _as_string_tuple(value: Any) -> tuple[str, ...]:
@@ -66,18 +67,11 @@ def _overwrite_dataset_in_place(target: xr.Dataset, source: xr.Dataset) -> None:
     target.encoding.update(source.encoding)
 
 
-def _dataset_changed(before: xr.Dataset, after: xr.Dataset) -> bool:
-    return not before.identical(after)
-
-
-class DatasetTransform(FixFunction):
+class DatasetTransform(MemoizedTransform, FixFunction):
     message = "dataset can be normalized"
 
-    def transform(self, dataset: xr.Dataset) -> xr.Dataset:
-        return dataset
-
     def matches(self, dataset: xr.Dataset) -> bool:
-        return _dataset_changed(dataset, self.transform(dataset))
+        return self._transform_result(dataset)[1]
 
     def check(self, dataset: xr.Dataset) -> list[str]:
         if not self.matches(dataset):
@@ -85,12 +79,13 @@ class DatasetTransform(FixFunction):
         return [self.message]
 
     def apply(self, dataset: xr.Dataset, dry_run: bool = True) -> bool:
-        transformed = self.transform(dataset)
-        if not _dataset_changed(dataset, transformed):
+        transformed, changed = self._transform_result(dataset)
+        if not changed:
             return False
         if dry_run:
             return True
         _overwrite_dataset_in_place(dataset, transformed)
+        self._forget_transform()
         return True
 
 
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import json
+import weakref
+from typing import Any, Callable, Mapping
+
+import numpy as np
 import xarray as xr
 
+from woodpecker.io.patch import values_equal
+
 _CELSIUS_UNITS = {"c", "degc", "degreec", "degreesc", "celsius"}
 
 
@@ -106,3 +113,144 @@ def normalize_compression_settings(
         encoding["shuffle"] = shuffle
         changed = True
     return changed
+
+
+def _attrs_equal(left: Mapping[Any, Any], right: Mapping[Any, Any]) -> bool:
+    if left.keys() != right.keys():
+        return False
+    return all(values_equal(left[key], right[key]) for key in left)
+
+
+def _same_buffer(left: Any, right: Any) -> bool:
+    """Return True when two backing arrays are known to hold the same values."""
+    if left is right:
+        return True
+    if isinstance(left, np.ndarray) and isinstance(right, np.ndarray):
+        return (
+            left.__array_interface__["data"][0] == right.__array_interface__["data"][0]
+            and left.strides == right.strides
+        )
+    left_name = getattr(left, "name", None)
+    if left_name is not None and hasattr(left, "dask") and hasattr(right, "dask"):
+        return left_name == getattr(right, "name", None)
+    return False
+
+
+def _variable_changed(before: xr.Variable, after: xr.Variable) -> bool:
+    if before is after:
+        return False
+    if before.dims != after.dims or before.shape != after.shape:
+        return True
+    if not _attrs_equal(before.attrs, after.attrs):
+        return True
+    if _same_buffer(before._data, after._data):
+        return False
+    return not before.equals(after)
+
+
+def dataset_changed(before: xr.Dataset, after: xr.Dataset) -> bool:
+    """Return True when *after* is not identical to *before*.
+
+    Same result as ``not before.identical(after)``, but names, dims, attrs and
+    backing buffers are compared first; values are compared only for variables
+    whose buffers differ.
+    """
+    if before is after:
+        return False
+    if not _attrs_equal(before.attrs, after.attrs):
+        return True
+    if before.variables.keys() != after.variables.keys():
+        return True
+    if set(before.coords) != set(after.coords) or dict(before.sizes) != dict(after.sizes):
+        return True
+    return any(
+        _variable_changed(variable, after.variables[name])
+        for name, variable in before.variables.items()
+    )
+
+
+def _encodings(dataset: xr.Dataset) -> str:
+    # dataset_changed() ignores encodings like identical(); transforms may not.
+    return repr((dataset.encoding, [variable.encoding for variable in dataset.variables.values()]))
+
+
+class TransformMemo:
+    """Single-entry memo of a transform result and its change flag.
+
+    The entry is reused only for the same dataset object, unchanged since it
+    was computed (checked against a shallow snapshot with
+    :func:`dataset_changed`), and the same fix config. It is held only as long
+    as that dataset lives, so a closed and dropped input does not keep its
+    transformed copy alive. Pickling drops the entry.
+    """
+
+    def __init__(self) -> None:
+        self._entry: tuple[Any, ...] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"_entry": None}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._entry = None
+
+    def get(
+        self,
+        dataset: xr.Dataset,
+        config: Mapping[str, Any] | None,
+        compute: Callable[[], tuple[xr.Dataset, bool]],
+    ) -> tuple[xr.Dataset, bool]:
+        key = json.dumps(config or {}, sort_keys=True, default=str)
+        entry = self._entry
+        if entry is not None:
+            ref, entry_key, snapshot, encodings, transformed, changed = entry
+            if (
+                ref() is dataset
+                and entry_key == key
+                and encodings == _encodings(dataset)
+                and not dataset_changed(snapshot, dataset)
+            ):
+                return transformed, changed
+        transformed, changed = compute()
+        # The shallow snapshot shares buffers with *dataset*, so it costs no data.
+        self._entry = (
+            weakref.ref(dataset, self._drop),
+            key,
+            dataset.copy(deep=False),
+            _encodings(dataset),
+            transformed,
+            changed,
+        )
+        return transformed, changed
+
+    def _drop(self, ref: weakref.ref[xr.Dataset]) -> None:
+        if self._entry is not None and self._entry[0] is ref:
+            self._entry = None
+
+    def clear(self) -> None:
+        self._entry = None
+
+
+class MemoizedTransform:
+    """Mixin for fixes that diff a ``transform(dataset)`` result against the input.
+
+    ``matches()``, ``check()`` and ``apply()`` share one transform per dataset
+    state and fix config through :meth:`_transform_result`.
+    """
+
+    def transform(self, dataset: xr.Dataset) -> xr.Dataset:
+        return dataset
+
+    def _transform_result(self, dataset: xr.Dataset) -> tuple[xr.Dataset, bool]:
+        """Return the transformed dataset and whether it differs, once per dataset state."""
+        memo = self.__dict__.setdefault("_transform_memo", TransformMemo())
+
+        def compute() -> tuple[xr.Dataset, bool]:
+            transformed = self.transform(dataset)
+            return transformed, dataset_changed(dataset, transformed)
+
+        return memo.get(dataset, getattr(self, "config", None), compute)
+
+    def _forget_transform(self) -> None:
+        memo = self.__dict__.get("_transform_memo")
+        if memo is not None:
+            memo.clear()
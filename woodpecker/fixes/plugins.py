@@ -1,13 +1,55 @@
 from __future__ import annotations
 
+import importlib
+import importlib.util
+import json
 import warnings
+from dataclasses import dataclass
 from importlib import metadata
+from pathlib import Path
 from typing import Any, Iterable
 
+from .base import FixFunction
+from .registry import FixFunctionRegistry, ManifestFix
+
 ENTRYPOINT_GROUP = "woodpecker.plugins"
+MANIFEST_FILENAME = "woodpecker-manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
 _PLUGINS_LOADED = False
 
 
+@dataclass(frozen=True)
+class PluginManifest:
+    """Static description of a plugin package: its fixes and bundled recipe files.
+
+    Plugins ship it as ``woodpecker-manifest.json`` next to their package
+    ``__init__.py``. Recipe paths are relative to the package directory.
+    ``version`` is the distribution version the manifest was generated for.
+    """
+
+    package: str
+    root: Path
+    fixes: tuple[ManifestFix, ...]
+    recipes: tuple[str, ...] = ()
+    version: str | None = None
+
+    @classmethod
+    def from_mapping(cls, values: dict[str, Any], root: Path) -> PluginManifest:
+        version = values.get("schema_version")
+        if version != MANIFEST_SCHEMA_VERSION:
+            raise ValueError(f"Unsupported plugin manifest schema_version: {version!r}")
+        return cls(
+            package=str(values.get("package", "")),
+            root=root,
+            fixes=tuple(ManifestFix.from_mapping(item) for item in values.get("fixes", [])),
+            recipes=tuple(str(item) for item in values.get("recipes", [])),
+            version=values.get("version"),
+        )
+
+    def recipe_paths(self) -> list[Path]:
+        return [self.root / item for item in self.recipes]
+
+
 def _iter_plugin_entry_points() -> Iterable[Any]:
     """Return entry points for external woodpecker plugins."""
     entries = metadata.entry_points()
@@ -16,10 +58,135 @@ def _iter_plugin_entry_points() -> Iterable[Any]:
     return entries.get(ENTRYPOINT_GROUP, [])
 
 
+def _entry_point_package(entry: Any) -> str:
+    return str(getattr(entry, "value", "") or "").split(":", 1)[0].strip()
+
+
+def _entry_point_version(entry: Any) -> str | None:
+    return getattr(getattr(entry, "dist", None), "version", None)
+
+
+def plugin_versions() -> dict[str, str]:
+    """Return the installed distribution version of each plugin package."""
+    versions: dict[str, str] = {}
+    for entry in _iter_plugin_entry_points():
+        package = _entry_point_package(entry)
+        version = _entry_point_version(entry)
+        if package and version:
+            versions.setdefault(package, version)
+    return versions
+
+
+def warn_plugin_failure(name: str, exc: Exception, fallback: str | None = None) -> None:
+    message = f"Failed to load woodpecker plugin '{name}': {exc}"
+    warnings.warn(
+        f"{message}. {fallback}" if fallback else message,
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def _package_dir(package: str) -> Path | None:
+    """Return the directory of *package* without importing it (top-level packages)."""
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return Path(next(iter(spec.submodule_search_locations)))
+
+
+def read_plugin_manifest(package: str, version: str | None = None) -> PluginManifest | None:
+    """Return the manifest shipped with *package*, or None when it has none.
+
+    With the installed *version* of the package, a manifest generated for
+    another version is stale and also yields None, so callers fall back to
+    importing the plugin or scanning its files. The package itself is not
+    imported.
+    """
+    root = _package_dir(package)
+    if root is None:
+        return None
+    path = root / MANIFEST_FILENAME
+    if not path.is_file():
+        return None
+    with path.open(encoding="utf-8") as fp:
+        manifest = PluginManifest.from_mapping(json.load(fp), root)
+    if version is not None and manifest.version != version:
+        return None
+    return manifest
+
+
+def build_plugin_manifest(package: str) -> dict[str, Any]:
+    """Import *package* and describe the fixes it registers and its bundled recipes.
+
+    The result is the JSON payload of ``woodpecker-manifest.json``; it lists
+    fixes from modules the package imports on load.
+    """
+    from woodpecker.recipes.loaders import SUPPORTED_EXTENSIONS
+
+    importlib.import_module(package)
+    fixes = []
+    for fix_id in FixFunctionRegistry.registered_ids():
+        declared = FixFunctionRegistry._registry[fix_id]
+        module = declared.module if isinstance(declared, ManifestFix) else declared.__module__
+        if module != package and not module.startswith(f"{package}."):
+            continue
+        try:
+            fix_cls = FixFunctionRegistry.get_fix_function(fix_id)
+        except ValueError:
+            # Entry of an outdated manifest for a fix the package no longer defines.
+            continue
+        entry = {name: getattr(fix_cls, name, None) for name in FixFunction.metadata_fields}
+        entry["object"] = f"{module}:{fix_cls.__qualname__}"
+        entry["requires_data"] = bool(getattr(fix_cls, "requires_data", True))
+        fixes.append(ManifestFix.from_mapping(entry).as_dict())
+
+    root = _package_dir(package)
+    recipe_dir = root / "recipes" if root is not None else None
+    recipes = []
+    if recipe_dir is not None and recipe_dir.is_dir():
+        recipes = [
+            f"recipes/{path.name}"
+            for path in sorted(recipe_dir.iterdir(), key=lambda item: item.name)
+            if path.suffix.lower() in SUPPORTED_EXTENSIONS
+        ]
+    return {
+        "schema_version": MANIFEST_SCHEMA_VERSION,
+        "package": package,
+        "version": plugin_versions().get(package),
+        "fixes": fixes,
+        "recipes": recipes,
+    }
+
+
+def write_plugin_manifest(package: str, path: str | Path | None = None) -> Path:
+    """Write the manifest of *package*, by default next to its ``__init__.py``."""
+    if path is None:
+        root = _package_dir(package)
+        if root is None:
+            raise ValueError(f"Cannot locate plugin package '{package}'")
+        path = root / MANIFEST_FILENAME
+    path = Path(path)
+    payload = build_plugin_manifest(package)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def register_plugin_manifest(manifest: PluginManifest) -> None:
+    """Register the fixes of *manifest*; their modules load on first instantiation."""
+    for entry in manifest.fixes:
+        FixFunctionRegistry.register_manifest_fix(entry)
+
+
 def load_plugins() -> None:
     """Load external plugins once.
 
-    Each entry point may reference either:
+    Plugins whose package ships a ``woodpecker-manifest.json`` for the
+    installed version are registered from the manifest without importing
+    them. A manifest that cannot be read is reported and the plugin is
+    imported instead. Otherwise each entry point may reference either:
     - a module (import side effects register fixes), or
     - a callable loader function (called after load).
     """
@@ -29,13 +196,21 @@ def load_plugins() -> None:
 
     _PLUGINS_LOADED = True
     for entry in _iter_plugin_entry_points():
+        name = getattr(entry, "name", "<unknown>")
         try:
+            package = _entry_point_package(entry)
+            try:
+                manifest = (
+                    read_plugin_manifest(package, _entry_point_version(entry)) if package else None
+                )
+            except Exception as exc:
+                warn_plugin_failure(name, exc, "Importing it instead.")
+                manifest = None
+            if manifest is not None:
+                register_plugin_manifest(manifest)
+                continue
             loaded = entry.load()
             if callable(loaded):
                 loaded()
         except Exception as exc:
-            warnings.warn(
-                f"Failed to load woodpecker plugin '{getattr(entry, 'name', '<unknown>')}': {exc}",
-                RuntimeWarning,
-                stacklevel=2,
-            )
+            warn_plugin_failure(name, exc)
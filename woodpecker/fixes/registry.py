@@ -1,21 +1,211 @@
 from __future__ import annotations
 
+import importlib
 import json
-from typing import Any, Optional, Type
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Type
 
 from woodpecker.fixes.identifiers import IdentifierResolver, IdentifierRules
 from woodpecker.fixes.labels import LabelCategories, LabelRegistry
 
-from .base import FixFunction
+from .base import DataAccess, FixFunction
 
 UNPRIORITIZED = -1
 
+# Fix attributes that discover() filters answer from FixIndex buckets.
+INDEXED_FIELDS = ("dataset", "categories", "labels", "prefix")
+
+_NO_IDS: frozenset[str] = frozenset()
+
+
+def _priority_sort_key(fix: Any) -> tuple[bool, int, str]:
+    priority = int(getattr(fix, "priority", UNPRIORITIZED))
+    prioritized = priority >= 0
+    return (not prioritized, priority if prioritized else 0, getattr(fix, "id", ""))
+
+
+def _matches_filters(fix: Any, filters: Mapping[str, Any]) -> bool:
+    for key, val in filters.items():
+        attr = getattr(fix, key, None)
+        if attr is None:
+            return False
+        if isinstance(attr, list):
+            if isinstance(val, str):
+                if val not in attr:
+                    return False
+            else:
+                if not any(v in attr for v in val):
+                    return False
+        else:
+            if attr != val:
+                return False
+    return True
+
+
+def _filter_key(filters: Mapping[str, Any]) -> tuple[tuple[str, Any], ...]:
+    return tuple(
+        sorted(
+            (str(key), tuple(val) if isinstance(val, (list, set, frozenset)) else val)
+            for key, val in filters.items()
+        )
+    )
+
+
+def _freeze(buckets: dict[Any, set[str]]) -> Mapping[Any, frozenset[str]]:
+    return MappingProxyType({value: frozenset(ids) for value, ids in buckets.items()})
+
+
+@dataclass(frozen=True)
+class FixIndex:
+    """Immutable lookup tables over the registered fix classes.
+
+    Built at *version* of the registry from one instance of every class, or
+    the :class:`ManifestFix` entry of fixes whose module is not imported yet:
+    ``order`` lists fix ids in discovery order (prioritized fixes first, then
+    by id), and for each of :data:`INDEXED_FIELDS` ``members`` maps a value to
+    the ids whose list attribute contains it while ``values`` maps it to the
+    ids whose scalar attribute equals it. Selections are memoized per filter set.
+    """
+
+    version: int
+    source: Mapping[str, Type[Any]]
+    order: tuple[str, ...]
+    datasets: Mapping[str, Optional[str]]
+    members: Mapping[str, Mapping[Any, frozenset[str]]]
+    values: Mapping[str, Mapping[Any, frozenset[str]]]
+    _selections: dict[Any, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(
+        cls,
+        registry: Mapping[str, Type[Any]],
+        version: int,
+        instantiate: Callable[[Type[Any]], Any],
+    ) -> FixIndex:
+        fixes = {fix_id: instantiate(fix_cls) for fix_id, fix_cls in registry.items()}
+        members: dict[str, Mapping[Any, frozenset[str]]] = {}
+        values: dict[str, Mapping[Any, frozenset[str]]] = {}
+        for name in INDEXED_FIELDS:
+            listed: dict[Any, set[str]] = {}
+            scalar: dict[Any, set[str]] = {}
+            for fix_id, fix in fixes.items():
+                attr = getattr(fix, name, None)
+                if isinstance(attr, list):
+                    for value in attr:
+                        listed.setdefault(value, set()).add(fix_id)
+                elif attr is not None:
+                    scalar.setdefault(attr, set()).add(fix_id)
+            members[name] = _freeze(listed)
+            values[name] = _freeze(scalar)
+        return cls(
+            version=version,
+            source=registry,
+            order=tuple(sorted(fixes, key=lambda fix_id: _priority_sort_key(fixes[fix_id]))),
+            datasets=MappingProxyType(
+                {fix_id: getattr(fix, "dataset", None) for fix_id, fix in fixes.items()}
+            ),
+            members=MappingProxyType(members),
+            values=MappingProxyType(values),
+        )
+
+    def is_current(self, registry: Mapping[str, Type[Any]], version: int) -> bool:
+        return self.source is registry and self.version == version
+
+    def select(self, filters: Optional[Mapping[str, Any]] = None) -> tuple[str, ...]:
+        """Return the ids matching *filters* on :data:`INDEXED_FIELDS`, in discovery order."""
+        if not filters:
+            return self.order
+        key = _filter_key(filters)
+        selected = self._selections.get(key)
+        if selected is None:
+            candidates: frozenset[str] | None = None
+            for name, val in filters.items():
+                ids = self._lookup(name, val)
+                candidates = ids if candidates is None else candidates & ids
+            selected = tuple(fix_id for fix_id in self.order if fix_id in (candidates or ()))
+            self._selections[key] = selected
+        return selected
+
+    def _lookup(self, name: str, val: Any) -> frozenset[str]:
+        members = self.members[name]
+        values = self.values[name]
+        if isinstance(val, str):
+            return members.get(val, _NO_IDS) | values.get(val, _NO_IDS)
+        if isinstance(val, (list, tuple, set, frozenset)):
+            return frozenset().union(*(members.get(item, _NO_IDS) for item in val))
+        return values.get(val, _NO_IDS)
+
+
+@dataclass(frozen=True)
+class ManifestFix:
+    """Registry entry for a plugin fix declared in a plugin manifest.
+
+    Carries the catalog metadata of the fix, so discovery, listing and
+    identifier resolution work without importing its module. *object* is the
+    ``"module:Class"`` reference imported the first time the fix is
+    instantiated.
+    """
+
+    id: str
+    object: str
+    name: str
+    prefix: str = ""
+    suffix: str = ""
+    aliases: list[str] = field(default_factory=list)
+    links: list[dict[str, str]] = field(default_factory=list)
+    description: str = ""
+    categories: list[str] = field(default_factory=list)
+    priority: int = UNPRIORITIZED
+    dataset: Optional[str] = None
+    labels: list[str] = field(default_factory=list)
+    requires_data: bool = True
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> ManifestFix:
+        known = {item.name for item in fields(cls)}
+        unknown = sorted(set(values) - known)
+        if unknown:
+            raise ValueError(f"Unknown manifest fix fields: {', '.join(unknown)}")
+        module, _, class_name = str(values.get("object", "")).partition(":")
+        if not module or not class_name:
+            raise ValueError(
+                f"Manifest fix '{values.get('id', '')}' must define 'object' as 'module:Class'"
+            )
+        return cls(**values)
+
+    @property
+    def module(self) -> str:
+        return self.object.split(":", 1)[0]
+
+    @property
+    def class_name(self) -> str:
+        return self.object.split(":", 1)[1]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+    def metadata(self) -> dict[str, Any]:
+        """Return the same metadata payload as ``FixFunction.metadata()``."""
+        payload: dict[str, Any] = {}
+        for name in FixFunction.metadata_fields:
+            value = getattr(self, name, None)
+            payload[name] = list(value) if isinstance(value, list) else value
+        labels = [str(item) for item in self.labels]
+        payload["label_titles"] = [LabelRegistry.title(label) for label in labels]
+        payload["label_metadata"] = [LabelRegistry.metadata(label) for label in labels]
+        return payload
+
 
 class FixFunctionRegistry:
     """In-memory registry for fix function classes."""
 
     _registry: dict[str, Type[Any]] = {}
     _resolver: IdentifierResolver = IdentifierResolver()
+    _version: int = 0
+    _index: Optional[FixIndex] = None
 
     @classmethod
     def _infer_prefix_from_module(cls, fix_cls: Type[Any]) -> str:
@@ -84,6 +274,29 @@ class FixFunctionRegistry:
         fix_cls = cls._registry.get(key)
         if fix_cls is None:
             raise KeyError(f"Unknown fix id: {key}")
+        if isinstance(fix_cls, ManifestFix):
+            return cls._load_manifest_fix(fix_cls)
+        return fix_cls
+
+    @classmethod
+    def _load_manifest_fix(cls, entry: ManifestFix) -> Type[Any]:
+        """Import the module of a manifest fix; importing it registers the fix class."""
+        module = importlib.import_module(entry.module)
+        if isinstance(cls._registry.get(entry.id), ManifestFix):
+            # The module was imported before, e.g. ahead of a registry reset.
+            fix_cls = getattr(module, entry.class_name, None)
+            if fix_cls is None:
+                raise ValueError(
+                    f"Plugin manifest names '{entry.object}' for fix '{entry.id}', "
+                    "but the module does not define it"
+                )
+            cls.register(fix_cls)
+        fix_cls = cls._registry.get(entry.id)
+        if fix_cls is None or isinstance(fix_cls, ManifestFix):
+            raise ValueError(
+                f"Plugin manifest entry for fix '{entry.id}' does not match the fix "
+                f"registered by '{entry.object}'; regenerate the plugin manifest"
+            )
         return fix_cls
 
     @classmethod
@@ -101,6 +314,13 @@ class FixFunctionRegistry:
             ) from exc
         return fix
 
+    @classmethod
+    def _describe(cls, fix_cls: Any) -> Any:
+        """Return *fix_cls* metadata: manifest entries as-is, classes as fresh instances."""
+        if isinstance(fix_cls, ManifestFix):
+            return fix_cls
+        return cls._instantiate_fix(fix_cls)
+
     @classmethod
     def _validate_fix_definition(cls, fix: Any, fix_cls: Type[Any]) -> None:
         name = str(getattr(fix, "name", "") or "").strip()
@@ -132,6 +352,15 @@ class FixFunctionRegistry:
                 f"Fix function {fix_cls.__name__} must define "
                 "'labels' as a list of non-empty strings"
             )
+        if not isinstance(getattr(fix, "requires_data", True), bool):
+            raise ValueError(
+                f"Fix function {fix_cls.__name__} must define 'requires_data' as a bool"
+            )
+        reads = getattr(fix, "reads", None)
+        if reads is not None and not isinstance(reads, DataAccess):
+            raise ValueError(
+                f"Fix function {fix_cls.__name__} must define 'reads' as a DataAccess or None"
+            )
         label_ids = [str(label) for label in labels]
         if not any(
             LabelRegistry.labels_with_category(label_ids, category)
@@ -151,7 +380,12 @@ class FixFunctionRegistry:
         cls._validate_fix_definition(fix, fix_cls)
 
         identifier_set = cls._derive_identifiers(fix_cls)
-        if identifier_set.id in cls._registry:
+        existing = cls._registry.get(identifier_set.id)
+        # A manifest entry is replaced by the class it declares once its module is imported.
+        if existing is not None and not (
+            isinstance(existing, ManifestFix)
+            and existing.module == getattr(fix_cls, "__module__", None)
+        ):
             raise ValueError(f"Duplicate fix id '{identifier_set.id}' (already registered)")
 
         setattr(fix_cls, "prefix", identifier_set.prefix)
@@ -161,44 +395,91 @@ class FixFunctionRegistry:
 
         cls._registry[identifier_set.id] = fix_cls
         cls._resolver.register(identifier_set)
+        cls._version += 1
+        cls._index = None
         return fix_cls
 
+    @classmethod
+    def register_manifest_fix(cls, entry: ManifestFix) -> ManifestFix:
+        """Register a plugin fix from its manifest entry without importing its module."""
+        IdentifierRules.validate_id("fix id", entry.id)
+        prefix, suffix = entry.id.split(".", 1)
+        identifier_set = IdentifierRules.build(
+            prefix=entry.prefix or prefix,
+            suffix=entry.suffix or suffix,
+            aliases=entry.aliases,
+        )
+        if identifier_set.id != entry.id:
+            raise ValueError(f"Manifest fix '{entry.id}' does not match its prefix and suffix")
+        if not entry.name.strip():
+            raise ValueError(f"Manifest fix '{entry.id}' must define a non-empty 'name'")
+        existing = cls._registry.get(entry.id)
+        if existing is not None:
+            if getattr(existing, "__module__", None) == entry.module:
+                return entry
+            raise ValueError(f"Duplicate fix id '{entry.id}' (already registered)")
+
+        entry = replace(
+            entry,
+            prefix=identifier_set.prefix,
+            suffix=identifier_set.suffix,
+            aliases=list(identifier_set.aliases),
+        )
+        cls._registry[entry.id] = entry
+        cls._resolver.register(identifier_set)
+        cls._version += 1
+        cls._index = None
+        return entry
+
     @staticmethod
     def _priority_sort_key(fix: FixFunction) -> tuple[bool, int, str]:
-        priority = int(getattr(fix, "priority", UNPRIORITIZED))
-        prioritized = priority >= 0
-        return (not prioritized, priority if prioritized else 0, getattr(fix, "id", ""))
+        return _priority_sort_key(fix)
+
+    @classmethod
+    def index(cls) -> FixIndex:
+        """Return the index of the registered fixes, rebuilding it after registrations."""
+        index = cls._index
+        if index is None or not index.is_current(cls._registry, cls._version):
+            index = FixIndex.build(cls._registry, cls._version, cls._describe)
+            cls._index = index
+        return index
+
+    @classmethod
+    def discover_ids(cls, filters: Optional[dict[str, Any]] = None) -> tuple[str, ...]:
+        """Return the ids of the fixes matching *filters*, in discovery order.
+
+        Filters on :data:`INDEXED_FIELDS` are index lookups; other attributes
+        are checked on fresh instances of the remaining fixes.
+        """
+        filters = filters or {}
+        indexed = {key: val for key, val in filters.items() if key in INDEXED_FIELDS}
+        ids = cls.index().select(indexed)
+        rest = {key: val for key, val in filters.items() if key not in INDEXED_FIELDS}
+        if not rest:
+            return ids
+        return tuple(fix_id for fix_id in ids if _matches_filters(cls.instantiate(fix_id), rest))
 
     @classmethod
     def discover(cls, filters: Optional[dict[str, Any]] = None) -> list[FixFunction]:
-        fixes = [cls._instantiate_fix(fix_cls) for fix_cls in cls._registry.values()]
+        """Return fresh instances of the fixes matching *filters*, in discovery order."""
+        return [cls.instantiate(fix_id) for fix_id in cls.discover_ids(filters)]
 
-        if not filters:
-            return sorted(fixes, key=cls._priority_sort_key)
+    @classmethod
+    def describe(cls, filters: Optional[dict[str, Any]] = None) -> list[Any]:
+        """Return metadata of the fixes matching *filters*, in discovery order.
 
-        def match(f: FixFunction) -> bool:
-            for key, val in filters.items():
-                attr = getattr(f, key, None)
-                if attr is None:
-                    return False
-                if isinstance(attr, list):
-                    if isinstance(val, str):
-                        if val not in attr:
-                            return False
-                    else:
-                        if not any(v in attr for v in val):
-                            return False
-                else:
-                    if attr != val:
-                        return False
-            return True
-
-        out = [f for f in fixes if match(f)]
-        return sorted(out, key=cls._priority_sort_key)
+        Like :meth:`discover`, but fixes declared in a plugin manifest whose
+        module is not imported yet are returned as their :class:`ManifestFix`
+        entry, so listing fixes imports no plugin code.
+        """
+        return [cls._describe(cls._registry[fix_id]) for fix_id in cls.discover_ids(filters)]
 
     @staticmethod
     def source_label(fix: Any) -> str:
-        module = getattr(type(fix), "__module__", "")
+        if isinstance(fix, ManifestFix):
+            module = fix.module
+        else:
+            module = getattr(type(fix), "__module__", "")
         if module.startswith("woodpecker.fixes."):
             return "core"
 
@@ -207,7 +488,7 @@ class FixFunctionRegistry:
 
     @classmethod
     def to_json(cls, path: str):
-        fixes = cls.discover()
+        fixes = cls.describe()
         data = []
         for f in fixes:
             labels = list(getattr(f, "labels", []) or [])
@@ -238,4 +519,12 @@ def register_fix_function(fix_cls: Type[Any]) -> Type[Any]:
     return FixFunctionRegistry.register(fix_cls)
 
 
-__all__ = ["FixFunction", "FixFunctionRegistry", "UNPRIORITIZED", "register_fix_function"]
+__all__ = [
+    "DataAccess",
+    "FixFunction",
+    "FixFunctionRegistry",
+    "FixIndex",
+    "ManifestFix",
+    "UNPRIORITIZED",
+    "register_fix_function",
+]
@@ -1,6 +1,14 @@
-from .base import DatasetIdentity, DatasetIdentityResolver
+from .base import (
+    AttrsIdentityResolver,
+    DatasetIdentity,
+    DatasetIdentityResolver,
+    NormalizedAttrs,
+)
+from .batch import ColumnAttrs, ColumnVerdict, resolve_dataset_identities
 from .registry import (
+    clear_identity_cache,
     dataset_type_matches_declared,
+    identity_from_metadata,
     register_dataset_identity,
     resolve_dataset_identity,
 )
@@ -26,7 +34,14 @@ del (
 __all__ = [
     "DatasetIdentity",
     "DatasetIdentityResolver",
+    "AttrsIdentityResolver",
+    "NormalizedAttrs",
     "register_dataset_identity",
     "resolve_dataset_identity",
+    "resolve_dataset_identities",
+    "ColumnAttrs",
+    "ColumnVerdict",
     "dataset_type_matches_declared",
+    "identity_from_metadata",
+    "clear_identity_cache",
 ]
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import xarray as xr
 
-from .utils import first_str_attr, project_id_from_dataset_id
+from .utils import NormalizedAttrs, project_id_from_dataset_id
+
+if TYPE_CHECKING:
+    from .batch import ColumnAttrs, ColumnVerdict
 
 
 @dataclass(frozen=True)
@@ -29,7 +32,28 @@ class DatasetIdentityResolver(ABC):
         ...
 
 
-class DefaultDatasetIdentityResolver(DatasetIdentityResolver):
+class AttrsIdentityResolver(DatasetIdentityResolver):
+    """Resolver that classifies a dataset from its global attrs alone.
+
+    The registry evaluates these resolvers against one shared
+    :class:`NormalizedAttrs` view and memoizes their combined result per attrs
+    fingerprint, so implement :meth:`evaluate_attrs` instead of ``evaluate``.
+    """
+
+    def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
+        return self.evaluate_attrs(NormalizedAttrs(dataset.attrs))
+
+    @abstractmethod
+    def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
+        """Return identity if the attrs match this resolver, else None."""
+        ...
+
+    def evaluate_columns(self, attrs: ColumnAttrs) -> ColumnVerdict | None:
+        """Return the per-row verdict over an attrs table, or None to go row by row."""
+        return None
+
+
+class DefaultDatasetIdentityResolver(AttrsIdentityResolver):
     """Generic fallback that always returns a baseline DatasetIdentity.
 
     This is core framework logic, not a dataset-family plugin.
@@ -39,12 +63,9 @@ class DefaultDatasetIdentityResolver(DatasetIdentityResolver):
     dataset_type = ""
     priority = 1000
 
-    def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity:
-        attrs = dataset.attrs
-        dataset_id = first_str_attr(
-            attrs, ("dataset_id", "ds_id", "id", "source_id", "source_name")
-        )
-        explicit_project_id = first_str_attr(attrs, ("project_id",))
+    def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity:
+        dataset_id = attrs.first(("dataset_id", "ds_id", "id", "source_id", "source_name"))
+        explicit_project_id = attrs.first(("project_id",))
         project_id = explicit_project_id or project_id_from_dataset_id(dataset_id)
         return DatasetIdentity(
             dataset_type=None,
@@ -52,5 +73,5 @@ class DefaultDatasetIdentityResolver(DatasetIdentityResolver):
             project_id=project_id,
             confidence=0.0,
             evidence=("fallback:generic-identity",),
-            metadata={"resolver": type(self).__name__, "attrs_seen": sorted(attrs.keys())},
+            metadata={"resolver": type(self).__name__, "attrs_seen": attrs.keys()},
         )
@@ -0,0 +1,211 @@
+"""Classify attribute tables by dataset type without opening datasets.
+
+``resolve_dataset_identities`` takes one row of global attrs per file (e.g. an
+ESGF-style index or a header scan) and runs the registered resolvers over
+whole columns. Built-in resolvers implement
+:meth:`~woodpecker.identity.base.AttrsIdentityResolver.evaluate_columns`;
+other attrs-only resolvers are evaluated row by row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .base import AttrsIdentityResolver, DatasetIdentityResolver
+from .registry import _DEFAULT_CONFIDENCE, _compiled_plan
+from .utils import NormalizedAttrs
+
+_FALLBACK_EVIDENCE = ("fallback:generic-identity",)
+
+
+class ColumnAttrs:
+    """Column-wise counterpart of :class:`NormalizedAttrs` over an attrs table.
+
+    :meth:`first` and :meth:`token` return categorical string Series aligned
+    with the table (``""`` where no key holds a non-blank string). They are
+    memoized, so resolvers share the normalization of each column, and string
+    methods on them only run once per distinct value.
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+        self._first: dict[tuple[str, ...], pd.Series] = {}
+        self._tokens: dict[tuple[str, ...], pd.Series] = {}
+
+    def _stripped(self, key: str) -> np.ndarray | None:
+        column = self.frame.get(key)
+        if column is None:
+            return None
+        # Strip each distinct value once; non-string cells become missing,
+        # like first_str_attr skipping them. Code -1 (missing) takes the last slot.
+        codes, uniques = pd.factorize(column, sort=False)
+        stripped = [
+            value.strip() or np.nan if isinstance(value, str) else np.nan
+            for value in np.asarray(uniques, dtype=object)
+        ]
+        return np.array([*stripped, np.nan], dtype=object)[codes]
+
+    def first(self, keys: tuple[str, ...]) -> pd.Series:
+        """Return the first non-blank string attr of *keys* per row, stripped."""
+        result = self._first.get(keys)
+        if result is None:
+            values = np.full(len(self.frame.index), np.nan, dtype=object)
+            for key in keys:
+                found = self._stripped(key)
+                if found is not None:
+                    missing = pd.isna(values)
+                    values[missing] = found[missing]
+            values[pd.isna(values)] = ""
+            result = self._first[keys] = _categorical(*pd.factorize(values, sort=False), self)
+        return result
+
+    def token(self, keys: tuple[str, ...]) -> pd.Series:
+        """Return :meth:`first` of *keys* per row as lowercased tokens."""
+        result = self._tokens.get(keys)
+        if result is None:
+            first = self.first(keys)
+            codes, uniques = pd.factorize(first.cat.categories.str.lower(), sort=False)
+            result = self._tokens[keys] = _categorical(codes[first.cat.codes], uniques, self)
+        return result
+
+
+def _categorical(codes: np.ndarray, categories: Any, attrs: ColumnAttrs) -> pd.Series:
+    # Unsorted categories: sorting millions of distinct ids would dominate.
+    values = pd.Categorical.from_codes(codes, categories=categories)
+    return pd.Series(values, index=attrs.frame.index)
+
+
+@dataclass(frozen=True)
+class ColumnVerdict:
+    """Per-row outcome of one resolver over an attrs table.
+
+    ``confidence`` is NaN where the resolver does not match. Evidence comes
+    either from ``signals`` (one boolean column per evidence label, in
+    evidence order) or, for row-wise results, from ``evidence`` tuples.
+    """
+
+    confidence: pd.Series
+    signals: pd.DataFrame | None = None
+    evidence: pd.Series | None = None
+
+    def evidence_for(self, rows: pd.Series) -> pd.Series:
+        """Return the evidence tuples of the rows selected by boolean *rows*."""
+        if self.signals is None:
+            assert self.evidence is not None
+            return self.evidence[rows]
+        signals = self.signals[rows]
+        labels = list(signals.columns)
+        # Encode each row's signal set as a bitmask and build one tuple per set.
+        weights = 1 << np.arange(len(labels), dtype=np.int64)
+        codes = pd.Series(signals.to_numpy(dtype=np.int64) @ weights, index=signals.index)
+        lookup = {
+            code: tuple(label for bit, label in enumerate(labels) if code >> bit & 1)
+            for code in codes.unique()
+        }
+        return codes.map(lookup)
+
+
+def any_signal(signals: dict[str, pd.Series]) -> pd.Series:
+    """Return per row whether any of the boolean *signals* is set."""
+    return pd.DataFrame(signals).any(axis=1)
+
+
+def signal_verdict(
+    signals: dict[str, pd.Series], confidence: Any, matched: pd.Series | None = None
+) -> ColumnVerdict:
+    """Build a :class:`ColumnVerdict` from named boolean *signals*.
+
+    Rows match where *matched* is set, or by default where any signal is.
+    """
+    frame = pd.DataFrame(signals)
+    if matched is None:
+        matched = frame.any(axis=1)
+    values = pd.Series(confidence, index=frame.index, dtype=float)
+    return ColumnVerdict(confidence=values.where(matched), signals=frame)
+
+
+def _as_frame(records: Any) -> pd.DataFrame:
+    if isinstance(records, pd.DataFrame):
+        return records
+    to_pandas = getattr(records, "to_pandas", None)
+    if callable(to_pandas):  # pyarrow Table / RecordBatch
+        return to_pandas()
+    return pd.DataFrame(records)
+
+
+def _row_verdict(resolver: AttrsIdentityResolver, frame: pd.DataFrame) -> ColumnVerdict:
+    confidence: list[float] = []
+    evidence: list[tuple[str, ...]] = []
+    for row in frame.to_dict("records"):
+        identity = resolver.evaluate_attrs(NormalizedAttrs(row))
+        if identity is None:
+            confidence.append(np.nan)
+            evidence.append(())
+            continue
+        value = identity.confidence
+        confidence.append(_DEFAULT_CONFIDENCE if value is None else value)
+        evidence.append(identity.evidence)
+    return ColumnVerdict(
+        confidence=pd.Series(confidence, index=frame.index, dtype=float),
+        evidence=pd.Series(evidence, index=frame.index, dtype=object),
+    )
+
+
+def _verdict(
+    resolver: DatasetIdentityResolver, frame: pd.DataFrame, attrs: ColumnAttrs
+) -> ColumnVerdict:
+    if not isinstance(resolver, AttrsIdentityResolver):
+        raise TypeError(
+            f"resolver '{resolver.dataset_type}' inspects the dataset and cannot "
+            "classify attribute tables; derive it from AttrsIdentityResolver"
+        )
+    verdict = resolver.evaluate_columns(attrs)
+    return verdict if verdict is not None else _row_verdict(resolver, frame)
+
+
+def resolve_dataset_identities(records: Any) -> pd.DataFrame:
+    """Classify every row of a global-attrs table by dataset type.
+
+    *records* is a pandas DataFrame, a pyarrow Table (or anything with
+    ``to_pandas()``), a mapping of columns or a list of attr dicts, with one
+    column per global attribute. Returns a DataFrame on the same index with
+    ``dataset_type`` (missing where no resolver matches), ``confidence`` and
+    ``evidence`` columns, equal to what :func:`resolve_dataset_identity`
+    reports for a dataset carrying that row's attrs.
+    """
+    frame = _as_frame(records)
+    attrs = ColumnAttrs(frame)
+    index = frame.index
+
+    best = pd.Series(-np.inf, index=index)
+    owner = pd.Series(-1, index=index)
+    plan = _compiled_plan()
+    verdicts = []
+    for position, (resolver, _, _) in enumerate(plan.steps):
+        verdict = _verdict(resolver, frame, attrs)
+        # Steps are sorted by priority, so only a strictly higher confidence wins.
+        wins = verdict.confidence.gt(best)
+        best = best.mask(wins, verdict.confidence)
+        owner = owner.mask(wins, position)
+        verdicts.append(verdict)
+
+    matched = owner.ge(0)
+    dataset_type = pd.Series(None, index=index, dtype=object)
+    evidence = pd.Series([_FALLBACK_EVIDENCE] * len(index), index=index, dtype=object)
+    for position, ((_, step_type, _), verdict) in enumerate(zip(plan.steps, verdicts)):
+        rows = owner.eq(position)
+        if rows.any():
+            dataset_type[rows] = step_type
+            evidence[rows] = verdict.evidence_for(rows)
+    return pd.DataFrame(
+        {
+            "dataset_type": dataset_type,
+            "confidence": best.where(matched, 0.0),
+            "evidence": evidence,
+        },
+        index=index,
+    )
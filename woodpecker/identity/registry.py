@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Callable, TypeVar
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Mapping, TypeVar
 
 import xarray as xr
 
-from .base import DatasetIdentity, DatasetIdentityResolver, DefaultDatasetIdentityResolver
+from .base import (
+    AttrsIdentityResolver,
+    DatasetIdentity,
+    DatasetIdentityResolver,
+    DefaultDatasetIdentityResolver,
+)
+from .utils import NormalizedAttrs, attrs_fingerprint, project_id_from_dataset_id
 
 RegistrySnapshot = dict[str, DatasetIdentityResolver]
 _RESOLVERS: dict[str, DatasetIdentityResolver] = {}
@@ -13,6 +21,53 @@ _FALLBACK = DefaultDatasetIdentityResolver()
 _ResolverClass = TypeVar("_ResolverClass", bound=type[DatasetIdentityResolver])
 _DEFAULT_PRIORITY = 100
 _DEFAULT_CONFIDENCE = 1.0
+# Distinct attrs fingerprints remembered per compiled plan.
+DEFAULT_IDENTITY_CACHE_ENTRIES = 4096
+
+
+@dataclass
+class _ResolverPlan:
+    """Registered resolvers compiled for repeated resolution.
+
+    Holds the resolvers pre-sorted by priority with their normalized dataset
+    types. When every resolver is an :class:`AttrsIdentityResolver`, results
+    only depend on the attrs fingerprint and are memoized in ``memo``; the
+    plan (and its memo) is dropped whenever the registry changes.
+    """
+
+    steps: tuple[tuple[DatasetIdentityResolver, str | None, int], ...]
+    attrs_only: bool
+    memo: OrderedDict[tuple[Any, ...], DatasetIdentity] = field(default_factory=OrderedDict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @classmethod
+    def compile(cls, resolvers: list[DatasetIdentityResolver]) -> _ResolverPlan:
+        steps = sorted(
+            (
+                (resolver, _normalize_type(resolver.dataset_type), _priority(resolver))
+                for resolver in resolvers
+            ),
+            key=lambda step: step[2],
+        )
+        attrs_only = all(isinstance(resolver, AttrsIdentityResolver) for resolver in resolvers)
+        return cls(steps=tuple(steps), attrs_only=attrs_only)
+
+
+_PLAN: _ResolverPlan | None = None
+
+
+def _compiled_plan() -> _ResolverPlan:
+    global _PLAN
+    plan = _PLAN
+    if plan is None:
+        plan = _PLAN = _ResolverPlan.compile(list(_RESOLVERS.values()))
+    return plan
+
+
+def clear_identity_cache() -> None:
+    """Drop the compiled resolver plan and every memoized identity."""
+    global _PLAN
+    _PLAN = None
 
 
 def snapshot_registry() -> RegistrySnapshot:
@@ -24,6 +79,7 @@ def restore_registry(state: RegistrySnapshot) -> None:
     """Restore registered dataset identity resolvers from a snapshot."""
     _RESOLVERS.clear()
     _RESOLVERS.update(state)
+    clear_identity_cache()
 
 
 def _register(
@@ -37,6 +93,7 @@ def _register(
         raise ValueError(f"resolver already registered for '{key}'")
     resolver.dataset_type = key
     _RESOLVERS[key] = resolver
+    clear_identity_cache()
 
 
 def register_dataset_identity(
@@ -58,10 +115,14 @@ def register_dataset_identity(
     return _decorator
 
 
-def _score(resolver: DatasetIdentityResolver, identity: DatasetIdentity) -> tuple[float, int]:
+def _priority(resolver: DatasetIdentityResolver) -> int:
+    return int(getattr(resolver, "priority", _DEFAULT_PRIORITY))
+
+
+def _score(identity: DatasetIdentity, priority: int) -> tuple[float, int]:
     """Return a (confidence, -priority) tuple for ranking candidate identities."""
     confidence = identity.confidence if identity.confidence is not None else _DEFAULT_CONFIDENCE
-    return confidence, -int(getattr(resolver, "priority", _DEFAULT_PRIORITY))
+    return confidence, -priority
 
 
 def _normalize_type(dataset_type: str | None) -> str | None:
@@ -70,33 +131,37 @@ def _normalize_type(dataset_type: str | None) -> str | None:
     return normalized or None
 
 
-def _best_match(dataset: xr.Dataset) -> DatasetIdentity | None:
-    """Evaluate all registered resolvers and return the highest-scoring match."""
-    resolvers = sorted(
-        _RESOLVERS.values(),
-        key=lambda r: int(getattr(r, "priority", _DEFAULT_PRIORITY)),
-    )
-    candidates: list[tuple[DatasetIdentityResolver, DatasetIdentity]] = []
+def _best_match(
+    plan: _ResolverPlan, dataset: xr.Dataset, attrs: NormalizedAttrs
+) -> DatasetIdentity | None:
+    """Run the compiled resolvers over shared *attrs* and return the highest-scoring match."""
+    best: DatasetIdentity | None = None
+    best_type: str | None = None
+    best_score: tuple[float, int] | None = None
 
-    for resolver in resolvers:
-        identity = resolver.evaluate(dataset)
+    for resolver, dataset_type, priority in plan.steps:
+        if isinstance(resolver, AttrsIdentityResolver):
+            identity = resolver.evaluate_attrs(attrs)
+        else:
+            identity = resolver.evaluate(dataset)
         if identity is None:
             continue
-        normalized_type = _normalize_type(resolver.dataset_type) or _normalize_type(
-            identity.dataset_type
-        )
-        candidates.append(
-            (
-                resolver,
-                replace(identity, dataset_type=normalized_type, metadata=dict(identity.metadata)),
-            )
-        )
+        score = _score(identity, priority)
+        if best_score is None or score > best_score:
+            best, best_score = identity, score
+            best_type = dataset_type or _normalize_type(identity.dataset_type)
 
-    if not candidates:
+    if best is None:
         return None
+    return replace(best, dataset_type=best_type, metadata=dict(best.metadata))
+
 
-    _, best = max(candidates, key=lambda item: _score(*item))
-    return best
+def _classify(plan: _ResolverPlan, dataset: xr.Dataset) -> DatasetIdentity:
+    attrs = NormalizedAttrs(dataset.attrs)
+    result = _best_match(plan, dataset, attrs)
+    if result is not None:
+        return result
+    return _FALLBACK.evaluate_attrs(attrs)
 
 
 def dataset_type_matches_declared(
@@ -113,10 +178,47 @@ def resolve_dataset_identity(dataset: xr.Dataset) -> DatasetIdentity:
     Tries all registered resolvers in priority order, chooses the best
     match by (confidence, -priority), and falls back to the generic
     DefaultDatasetIdentityResolver if no resolver matches.
+
+    While every registered resolver is attrs-only, results are memoized per
+    attrs fingerprint, so datasets with equal global attrs share one
+    (read-only) identity and are classified once per registry state.
     """
-    result = _best_match(dataset)
-    if result is not None:
-        return result
-    fallback = _FALLBACK.evaluate(dataset)
-    assert fallback is not None  # DefaultDatasetIdentityResolver always matches
-    return fallback
+    plan = _compiled_plan()
+    if not plan.attrs_only:
+        return _classify(plan, dataset)
+
+    key = attrs_fingerprint(dataset.attrs)
+    with plan.lock:
+        cached = plan.memo.get(key)
+        if cached is not None:
+            plan.memo.move_to_end(key)
+            return cached
+    identity = _classify(plan, dataset)
+    with plan.lock:
+        plan.memo[key] = identity
+        if len(plan.memo) > DEFAULT_IDENTITY_CACHE_ENTRIES:
+            plan.memo.popitem(last=False)
+    return identity
+
+
+def identity_from_metadata(metadata: Mapping[str, Any]) -> DatasetIdentity | None:
+    """Return the identity declared in input *metadata* (e.g. a manifest entry), or None.
+
+    Only a declared ``dataset_type`` is trusted; ``dataset_id`` and
+    ``project_id`` fill in the rest. Without a type, None is returned and the
+    identity is resolved from the dataset, since an id alone can be ambiguous
+    (e.g. CMIP6 versus CMIP6 decadal).
+    """
+    dataset_type = _normalize_type(metadata.get("dataset_type"))
+    if dataset_type is None:
+        return None
+    dataset_id = str(metadata.get("dataset_id") or "").strip()
+    project_id = str(metadata.get("project_id") or "").strip()
+    return DatasetIdentity(
+        dataset_type=dataset_type,
+        dataset_id=dataset_id,
+        project_id=project_id or project_id_from_dataset_id(dataset_id),
+        confidence=1.0,
+        evidence=("metadata:dataset_type",),
+        metadata={"resolver": "metadata"},
+    )
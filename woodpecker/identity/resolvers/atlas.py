@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import xarray as xr
+import numpy as np
+import pandas as pd
 
-from ..base import DatasetIdentity, DatasetIdentityResolver
-from ..utils import first_str_attr, normalized_token, project_id_from_dataset_id
+from ..base import AttrsIdentityResolver, DatasetIdentity
+from ..batch import ColumnAttrs, ColumnVerdict, signal_verdict
+from ..utils import NormalizedAttrs, project_id_from_dataset_id
 
 
-class AtlasDatasetIdentityResolver(DatasetIdentityResolver):
+class AtlasDatasetIdentityResolver(AttrsIdentityResolver):
     """Metadata-first identity resolver for Atlas datasets.
 
     Detection priority (high → low):
@@ -20,23 +22,21 @@ class AtlasDatasetIdentityResolver(DatasetIdentityResolver):
 
     # -- attr extraction -------------------------------------------------------
 
-    def _extract_attrs(self, dataset: xr.Dataset) -> dict[str, str]:
-        """Normalize all relevant attrs once per evaluate() call."""
-        raw = dataset.attrs
+    def _extract_attrs(self, attrs: NormalizedAttrs) -> dict[str, str]:
+        """Collect the normalized attr tokens this resolver inspects."""
         return {
-            "project_id": normalized_token(first_str_attr(raw, ("project_id",))),
-            "dataset_id": normalized_token(first_str_attr(raw, ("dataset_id", "ds_id"))),
-            "source_name": normalized_token(first_str_attr(raw, ("source_name",))),
+            "project_id": attrs.token(("project_id",)),
+            "dataset_id": attrs.token(("dataset_id", "ds_id")),
+            "source_name": attrs.token(("source_name",)),
         }
 
-    def _resolve_dataset_id(self, dataset: xr.Dataset) -> str:
-        return first_str_attr(
-            dataset.attrs,
+    def _resolve_dataset_id(self, attrs: NormalizedAttrs) -> str:
+        return attrs.first(
             ("ds_id", "dataset_id", "id", "source_id", "source_name"),
         )
 
-    def _resolve_project_id(self, dataset: xr.Dataset, dataset_id: str) -> str:
-        explicit = first_str_attr(dataset.attrs, ("project_id",))
+    def _resolve_project_id(self, attrs: NormalizedAttrs, dataset_id: str) -> str:
+        explicit = attrs.first(("project_id",))
         return explicit or project_id_from_dataset_id(dataset_id)
 
     # -- signal helpers --------------------------------------------------------
@@ -51,9 +51,23 @@ class AtlasDatasetIdentityResolver(DatasetIdentityResolver):
             signals.append("attr:source_name contains atlas")
         return signals
 
+    def _signal_columns(self, tokens: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        """Column-wise :meth:`_signals`, keyed by evidence label."""
+        return {
+            "attr:project_id contains atlas": tokens["project_id"].str.contains(
+                "atlas", regex=False
+            ),
+            "attr:dataset_id contains atlas": tokens["dataset_id"].str.contains(
+                "atlas", regex=False
+            ),
+            "attr:source_name contains atlas": tokens["source_name"].str.contains(
+                "atlas", regex=False
+            ),
+        }
+
     # -- evaluate --------------------------------------------------------------
 
-    def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
+    def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
         """Classify the dataset as Atlas.
 
         Confidence tiers:
@@ -62,8 +76,8 @@ class AtlasDatasetIdentityResolver(DatasetIdentityResolver):
           0.50  — source_name only (weak)
         Returns None if no Atlas signals are detected.
         """
-        attrs = self._extract_attrs(dataset)
-        evidence = tuple(self._signals(attrs))
+        tokens = self._extract_attrs(attrs)
+        evidence = tuple(self._signals(tokens))
 
         if not evidence:
             return None
@@ -75,8 +89,8 @@ class AtlasDatasetIdentityResolver(DatasetIdentityResolver):
         else:
             confidence = 0.50
 
-        dataset_id = self._resolve_dataset_id(dataset)
-        project_id = self._resolve_project_id(dataset, dataset_id)
+        dataset_id = self._resolve_dataset_id(attrs)
+        project_id = self._resolve_project_id(attrs, dataset_id)
 
         return DatasetIdentity(
             dataset_type=self.dataset_type,
@@ -86,3 +100,13 @@ class AtlasDatasetIdentityResolver(DatasetIdentityResolver):
             evidence=evidence,
             metadata={"resolver": type(self).__name__},
         )
+
+    def evaluate_columns(self, attrs: ColumnAttrs) -> ColumnVerdict:
+        """Vectorized :meth:`evaluate_attrs` over an attrs table."""
+        signals = self._signal_columns(self._extract_attrs(attrs))
+        confidence = np.select(
+            [signals["attr:project_id contains atlas"], signals["attr:dataset_id contains atlas"]],
+            [0.90, 0.70],
+            0.50,
+        )
+        return signal_verdict(signals, confidence)
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import re
 
-import xarray as xr
+import numpy as np
+import pandas as pd
 
-from ..base import DatasetIdentity, DatasetIdentityResolver
-from ..utils import first_str_attr, normalized_token, project_id_from_dataset_id
+from ..base import AttrsIdentityResolver, DatasetIdentity
+from ..batch import ColumnAttrs, ColumnVerdict, any_signal, signal_verdict
+from ..utils import NormalizedAttrs, project_id_from_dataset_id
 
 _SUB_EXPERIMENT_RE = re.compile(r"^s\d{4}$")
 
 
-class CMIP6DatasetIdentityResolver(DatasetIdentityResolver):
+class CMIP6DatasetIdentityResolver(AttrsIdentityResolver):
     """Metadata-first identity resolver for non-decadal CMIP6 datasets.
 
     Detection priority (high → low):
@@ -24,27 +26,25 @@ class CMIP6DatasetIdentityResolver(DatasetIdentityResolver):
 
     # -- attr extraction -------------------------------------------------------
 
-    def _extract_attrs(self, dataset: xr.Dataset) -> dict[str, str]:
-        """Normalize all relevant attrs once per evaluate() call."""
-        raw = dataset.attrs
+    def _extract_attrs(self, attrs: NormalizedAttrs) -> dict[str, str]:
+        """Collect the normalized attr tokens this resolver inspects."""
         return {
-            "mip_era": normalized_token(first_str_attr(raw, ("mip_era",))),
-            "project_id": normalized_token(first_str_attr(raw, ("project_id",))),
-            "dataset_id": normalized_token(first_str_attr(raw, ("dataset_id", "ds_id"))),
-            "source_name": normalized_token(first_str_attr(raw, ("source_name",))),
-            "activity_id": normalized_token(first_str_attr(raw, ("activity_id",))),
-            "experiment_id": normalized_token(first_str_attr(raw, ("experiment_id",))),
-            "sub_experiment_id": normalized_token(first_str_attr(raw, ("sub_experiment_id",))),
+            "mip_era": attrs.token(("mip_era",)),
+            "project_id": attrs.token(("project_id",)),
+            "dataset_id": attrs.token(("dataset_id", "ds_id")),
+            "source_name": attrs.token(("source_name",)),
+            "activity_id": attrs.token(("activity_id",)),
+            "experiment_id": attrs.token(("experiment_id",)),
+            "sub_experiment_id": attrs.token(("sub_experiment_id",)),
         }
 
-    def _resolve_dataset_id(self, dataset: xr.Dataset) -> str:
-        return first_str_attr(
-            dataset.attrs,
+    def _resolve_dataset_id(self, attrs: NormalizedAttrs) -> str:
+        return attrs.first(
             ("dataset_id", "ds_id", "id", "source_id", "source_name"),
         )
 
-    def _resolve_project_id(self, dataset: xr.Dataset, dataset_id: str) -> str:
-        explicit = first_str_attr(dataset.attrs, ("project_id",))
+    def _resolve_project_id(self, attrs: NormalizedAttrs, dataset_id: str) -> str:
+        explicit = attrs.first(("project_id",))
         return explicit or project_id_from_dataset_id(dataset_id)
 
     # -- signal helpers (accept pre-extracted attrs dict) ----------------------
@@ -83,9 +83,48 @@ class CMIP6DatasetIdentityResolver(DatasetIdentityResolver):
             return ["attr:source_name contains cmip6 (weak)"]
         return []
 
+    # -- column signal helpers (vectorized counterparts of the above) ----------
+
+    def _cmip6_context_columns(self, tokens: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        return {
+            "attr:mip_era=cmip6": tokens["mip_era"].eq("cmip6"),
+            "attr:project_id contains cmip6": tokens["project_id"].str.contains(
+                "cmip6", regex=False
+            ),
+            "attr:dataset_id contains cmip6": tokens["dataset_id"].str.contains(
+                "cmip6", regex=False
+            ),
+            "attr:source_name contains cmip6": tokens["source_name"].str.contains(
+                "cmip6", regex=False
+            ),
+        }
+
+    def _decadal_columns(self, tokens: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        return {
+            "attr:activity_id=dcpp": tokens["activity_id"].eq("dcpp"),
+            "attr:experiment_id startswith dcpp": tokens["experiment_id"].str.startswith("dcpp"),
+            "attr:sub_experiment_id matches s\\d{4}": tokens["sub_experiment_id"].str.match(
+                _SUB_EXPERIMENT_RE
+            ),
+            "attr:project_id contains decadal": tokens["project_id"].str.contains(
+                "decadal", regex=False
+            ),
+            "attr:dataset_id contains decadal": tokens["dataset_id"].str.contains(
+                "decadal", regex=False
+            ),
+            "attr:source_name contains decadal": tokens["source_name"].str.contains(
+                "decadal", regex=False
+            ),
+        }
+
+    def _source_name_columns(self, tokens: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        sn = tokens["source_name"]
+        weak = sn.str.contains("cmip6", regex=False) & ~sn.str.contains("decadal", regex=False)
+        return {"attr:source_name contains cmip6 (weak)": weak}
+
     # -- evaluate --------------------------------------------------------------
 
-    def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
+    def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
         """Classify the dataset as CMIP6 (non-decadal).
 
         Confidence tiers:
@@ -94,21 +133,21 @@ class CMIP6DatasetIdentityResolver(DatasetIdentityResolver):
           0.35  — only source_name weak signal
         Returns None if any decadal signals are detected.
         """
-        attrs = self._extract_attrs(dataset)
+        tokens = self._extract_attrs(attrs)
 
-        if self._decadal_signals(attrs):
+        if self._decadal_signals(tokens):
             return None
 
-        context = self._cmip6_context_signals(attrs)
-        source = self._source_name_signals(attrs)
+        context = self._cmip6_context_signals(tokens)
+        source = self._source_name_signals(tokens)
         evidence = tuple(context + source)
 
         if not evidence:
             return None
 
         confidence = 0.95 if "attr:mip_era=cmip6" in evidence else (0.6 if context else 0.35)
-        dataset_id = self._resolve_dataset_id(dataset)
-        project_id = self._resolve_project_id(dataset, dataset_id)
+        dataset_id = self._resolve_dataset_id(attrs)
+        project_id = self._resolve_project_id(attrs, dataset_id)
 
         return DatasetIdentity(
             dataset_type=self.dataset_type,
@@ -118,3 +157,13 @@ class CMIP6DatasetIdentityResolver(DatasetIdentityResolver):
             evidence=evidence,
             metadata={"resolver": type(self).__name__, "detection_mode": "metadata-first"},
         )
+
+    def evaluate_columns(self, attrs: ColumnAttrs) -> ColumnVerdict:
+        """Vectorized :meth:`evaluate_attrs` over an attrs table."""
+        tokens = self._extract_attrs(attrs)
+        context = self._cmip6_context_columns(tokens)
+        signals = {**context, **self._source_name_columns(tokens)}
+        has_context = any_signal(context)
+        matched = ~any_signal(self._decadal_columns(tokens)) & any_signal(signals)
+        confidence = np.where(signals["attr:mip_era=cmip6"], 0.95, np.where(has_context, 0.6, 0.35))
+        return signal_verdict(signals, confidence, matched)
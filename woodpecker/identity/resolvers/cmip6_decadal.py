@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import xarray as xr
+import numpy as np
+import pandas as pd
 
 from ..base import DatasetIdentity
+from ..batch import ColumnAttrs, ColumnVerdict, any_signal, signal_verdict
+from ..utils import NormalizedAttrs
 from .cmip6 import CMIP6DatasetIdentityResolver
 
 
@@ -27,12 +30,17 @@ class CMIP6DecadalDatasetIdentityResolver(CMIP6DatasetIdentityResolver):
             return ["attr:source_name contains cmip6 + decadal (weak)"]
         return []
 
-    def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
+    def _source_name_columns(self, tokens: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        sn = tokens["source_name"]
+        weak = sn.str.contains("cmip6", regex=False) & sn.str.contains("decadal", regex=False)
+        return {"attr:source_name contains cmip6 + decadal (weak)": weak}
+
+    def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
         """Classify the dataset as CMIP6 decadal using context + decadal signals."""
-        attrs = self._extract_attrs(dataset)
-        context = self._cmip6_context_signals(attrs)
-        decadal = self._decadal_signals(attrs)
-        source = self._source_name_signals(attrs)
+        tokens = self._extract_attrs(attrs)
+        context = self._cmip6_context_signals(tokens)
+        decadal = self._decadal_signals(tokens)
+        source = self._source_name_signals(tokens)
 
         if not ((context and decadal) or source):
             return None
@@ -45,8 +53,8 @@ class CMIP6DecadalDatasetIdentityResolver(CMIP6DatasetIdentityResolver):
                 confidence = 0.7
         else:
             confidence = 0.4
-        dataset_id = self._resolve_dataset_id(dataset)
-        project_id = self._resolve_project_id(dataset, dataset_id)
+        dataset_id = self._resolve_dataset_id(attrs)
+        project_id = self._resolve_project_id(attrs, dataset_id)
 
         return DatasetIdentity(
             dataset_type=self.dataset_type,
@@ -56,3 +64,16 @@ class CMIP6DecadalDatasetIdentityResolver(CMIP6DatasetIdentityResolver):
             evidence=evidence,
             metadata={"resolver": type(self).__name__, "detection_mode": "metadata-first"},
         )
+
+    def evaluate_columns(self, attrs: ColumnAttrs) -> ColumnVerdict:
+        """Vectorized :meth:`evaluate_attrs` over an attrs table."""
+        tokens = self._extract_attrs(attrs)
+        context = self._cmip6_context_columns(tokens)
+        decadal = self._decadal_columns(tokens)
+        source = self._source_name_columns(tokens)
+        has_decadal = any_signal(decadal)
+        matched = (any_signal(context) & has_decadal) | any_signal(source)
+        confidence = np.where(
+            has_decadal, np.where(decadal["attr:activity_id=dcpp"], 0.98, 0.7), 0.4
+        )
+        return signal_verdict({**context, **decadal, **source}, confidence, matched)
@@ -1,36 +1,36 @@
 from __future__ import annotations
 
-import xarray as xr
+import numpy as np
+import pandas as pd
 
-from ..base import DatasetIdentity, DatasetIdentityResolver
-from ..utils import first_str_attr, normalized_token, project_id_from_dataset_id
+from ..base import AttrsIdentityResolver, DatasetIdentity
+from ..batch import ColumnAttrs, ColumnVerdict, signal_verdict
+from ..utils import NormalizedAttrs, project_id_from_dataset_id
 
 
-class CordexDatasetIdentityResolver(DatasetIdentityResolver):
+class CordexDatasetIdentityResolver(AttrsIdentityResolver):
     """Metadata-first identity resolver for CORDEX datasets."""
 
     dataset_type = "cordex"
     priority = 35
 
-    def _extract_attrs(self, dataset: xr.Dataset) -> dict[str, str]:
-        raw = dataset.attrs
+    def _extract_attrs(self, attrs: NormalizedAttrs) -> dict[str, str]:
         return {
-            "project_id": normalized_token(first_str_attr(raw, ("project_id",))),
-            "dataset_id": normalized_token(first_str_attr(raw, ("dataset_id", "ds_id"))),
-            "source_name": normalized_token(first_str_attr(raw, ("source_name",))),
-            "activity_id": normalized_token(first_str_attr(raw, ("activity_id",))),
-            "domain_id": normalized_token(first_str_attr(raw, ("domain_id",))),
-            "rcm_model_id": normalized_token(first_str_attr(raw, ("rcm_model_id",))),
+            "project_id": attrs.token(("project_id",)),
+            "dataset_id": attrs.token(("dataset_id", "ds_id")),
+            "source_name": attrs.token(("source_name",)),
+            "activity_id": attrs.token(("activity_id",)),
+            "domain_id": attrs.token(("domain_id",)),
+            "rcm_model_id": attrs.token(("rcm_model_id",)),
         }
 
-    def _resolve_dataset_id(self, dataset: xr.Dataset) -> str:
-        return first_str_attr(
-            dataset.attrs,
+    def _resolve_dataset_id(self, attrs: NormalizedAttrs) -> str:
+        return attrs.first(
             ("dataset_id", "ds_id", "id", "source_id", "source_name"),
         )
 
-    def _resolve_project_id(self, dataset: xr.Dataset, dataset_id: str) -> str:
-        explicit = first_str_attr(dataset.attrs, ("project_id",))
+    def _resolve_project_id(self, attrs: NormalizedAttrs, dataset_id: str) -> str:
+        explicit = attrs.first(("project_id",))
         return explicit or project_id_from_dataset_id(dataset_id)
 
     def _signals(self, attrs: dict[str, str]) -> list[str]:
@@ -47,16 +47,30 @@ class CordexDatasetIdentityResolver(DatasetIdentityResolver):
             signals.append("attr:source_name contains cordex")
         return signals
 
-    def evaluate(self, dataset: xr.Dataset) -> DatasetIdentity | None:
-        attrs = self._extract_attrs(dataset)
-        evidence = tuple(self._signals(attrs))
+    def _signal_columns(self, tokens: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        return {
+            "attr:project_id=cordex": tokens["project_id"].eq("cordex"),
+            "attr:activity_id=cordex": tokens["activity_id"].eq("cordex"),
+            "attrs:domain_id+rcm_model_id": tokens["domain_id"].ne("")
+            & tokens["rcm_model_id"].ne(""),
+            "attr:dataset_id contains cordex": tokens["dataset_id"].str.contains(
+                "cordex", regex=False
+            ),
+            "attr:source_name contains cordex": tokens["source_name"].str.contains(
+                "cordex", regex=False
+            ),
+        }
+
+    def evaluate_attrs(self, attrs: NormalizedAttrs) -> DatasetIdentity | None:
+        tokens = self._extract_attrs(attrs)
+        evidence = tuple(self._signals(tokens))
 
         if not evidence:
             return None
 
         confidence = 0.95 if "attr:project_id=cordex" in evidence else 0.65
-        dataset_id = self._resolve_dataset_id(dataset)
-        project_id = self._resolve_project_id(dataset, dataset_id)
+        dataset_id = self._resolve_dataset_id(attrs)
+        project_id = self._resolve_project_id(attrs, dataset_id)
 
         return DatasetIdentity(
             dataset_type=self.dataset_type,
@@ -66,3 +80,8 @@ class CordexDatasetIdentityResolver(DatasetIdentityResolver):
             evidence=evidence,
             metadata={"resolver": type(self).__name__, "detection_mode": "metadata-first"},
         )
+
+    def evaluate_columns(self, attrs: ColumnAttrs) -> ColumnVerdict:
+        signals = self._signal_columns(self._extract_attrs(attrs))
+        confidence = np.where(signals["attr:project_id=cordex"], 0.95, 0.65)
+        return signal_verdict(signals, confidence)
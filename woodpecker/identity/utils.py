@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Mapping
 
 
 def project_id_from_dataset_id(dataset_id: str) -> str:
@@ -9,7 +9,7 @@ def project_id_from_dataset_id(dataset_id: str) -> str:
     return dataset_id.split(".", 1)[0]
 
 
-def first_str_attr(attrs: dict[str, Any], keys: tuple[str, ...]) -> str:
+def first_str_attr(attrs: Mapping[str, Any], keys: tuple[str, ...]) -> str:
     for key in keys:
         value = attrs.get(key)
         if isinstance(value, str) and value.strip():
@@ -19,3 +19,46 @@ def first_str_attr(attrs: dict[str, Any], keys: tuple[str, ...]) -> str:
 
 def normalized_token(value: str | None) -> str:
     return str(value or "").strip().lower()
+
+
+class NormalizedAttrs:
+    """Read-only view of global attrs with memoized string lookups.
+
+    A single view is shared by every resolver in one resolution pass, so each
+    attr lookup is stripped (and lowercased) once however many resolvers ask.
+    Only string values are exposed, which is what makes a resolution depend on
+    nothing but :func:`attrs_fingerprint`.
+    """
+
+    __slots__ = ("_attrs", "_first", "_tokens")
+
+    def __init__(self, attrs: Mapping[str, Any]) -> None:
+        self._attrs = attrs
+        self._first: dict[tuple[str, ...], str] = {}
+        self._tokens: dict[tuple[str, ...], str] = {}
+
+    def keys(self) -> list[str]:
+        return sorted(str(key) for key in self._attrs)
+
+    def first(self, keys: tuple[str, ...]) -> str:
+        """Return the first non-blank string attr of *keys*, stripped."""
+        value = self._first.get(keys)
+        if value is None:
+            value = self._first[keys] = first_str_attr(self._attrs, keys)
+        return value
+
+    def token(self, keys: tuple[str, ...]) -> str:
+        """Return :meth:`first` of *keys* as a lowercased token."""
+        value = self._tokens.get(keys)
+        if value is None:
+            value = self._tokens[keys] = normalized_token(self.first(keys))
+        return value
+
+
+def attrs_fingerprint(attrs: Mapping[str, Any]) -> tuple[tuple[str, str | None], ...]:
+    """Return a hashable key covering everything a :class:`NormalizedAttrs` exposes."""
+    return tuple(
+        sorted(
+            (str(key), value if isinstance(value, str) else None) for key, value in attrs.items()
+        )
+    )
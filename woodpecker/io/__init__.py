@@ -1,15 +1,70 @@
-from .backends.nc import NetCDFInput
-from .backends.zarr import ZarrInput, ZarrOutputAdapter
-from .base import DataInput
-from .normalize import get_output_adapter, normalize_inputs
-from .runtime import get_io_availability
+"""Dataset inputs, output adapters and I/O runtime settings.
+
+Names are imported from their submodules on first access, so importing a
+light submodule such as ``woodpecker.io.runtime`` does not load xarray.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .backends.multifile import MultiFileInput, group_shards
+    from .backends.nc import NetCDFInput
+    from .backends.zarr import ZarrInput, ZarrOutputAdapter
+    from .base import DataInput
+    from .dataset_cache import DatasetCache, dataset_cache_mode
+    from .encoding import EncodingPolicy
+    from .manifest import ManifestInput
+    from .normalize import InputScan, get_output_adapter, iter_inputs, normalize_inputs
+    from .runtime import get_io_availability
+
+_EXPORTS = {
+    "DataInput": ".base",
+    "DatasetCache": ".dataset_cache",
+    "dataset_cache_mode": ".dataset_cache",
+    "EncodingPolicy": ".encoding",
+    "get_io_availability": ".runtime",
+    "get_output_adapter": ".normalize",
+    "group_shards": ".backends.multifile",
+    "InputScan": ".normalize",
+    "iter_inputs": ".normalize",
+    "ManifestInput": ".manifest",
+    "MultiFileInput": ".backends.multifile",
+    "NetCDFInput": ".backends.nc",
+    "normalize_inputs": ".normalize",
+    "ZarrInput": ".backends.zarr",
+    "ZarrOutputAdapter": ".backends.zarr",
+}
 
 __all__ = [
     "DataInput",
+    "DatasetCache",
+    "dataset_cache_mode",
+    "EncodingPolicy",
     "get_io_availability",
     "get_output_adapter",
+    "group_shards",
+    "InputScan",
+    "iter_inputs",
+    "ManifestInput",
+    "MultiFileInput",
     "NetCDFInput",
     "normalize_inputs",
     "ZarrInput",
     "ZarrOutputAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from .runtime import keeps_backup
+
+BACKUP_SUFFIX = ".bak"
+
+
+def backup_path(target: Path) -> Path:
+    return target.with_name(f"{target.name}{BACKUP_SUFFIX}")
+
+
+def _sibling(target: Path, suffix: str) -> Path:
+    # Hidden and unique, in the target directory so the final rename stays on one filesystem.
+    return target.with_name(f".{target.name}.{uuid.uuid4().hex}{suffix}")
+
+
+def _fsync_file(path: Path) -> None:
+    with open(path, "rb") as handle:
+        os.fsync(handle.fileno())
+
+
+def _fsync_directory(path: Path) -> None:
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover - directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:  # pragma: no cover - not supported by every filesystem
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def _fsync_tree(path: Path) -> None:
+    for root, _, files in os.walk(path):
+        for name in files:
+            _fsync_file(Path(root, name))
+        _fsync_directory(Path(root))
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+def link_tree(source: Path, destination: Path) -> None:
+    """Copy the directory *source* to *destination*, hard-linking its files when possible.
+
+    Only suitable for stores whose writers replace files instead of changing
+    them in place, such as Zarr directory stores.
+    """
+
+    def link(src: str, dst: str) -> None:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    shutil.copytree(source, destination, copy_function=link)
+
+
+def replace_file(target: Path, write: Callable[[Path], object]) -> None:
+    """Write a file with *write* into a sibling temp path, then rename it over *target*.
+
+    The temp file is fsynced before the rename, so *target* holds either the old
+    or the new content after a crash. With :func:`~woodpecker.io.runtime.backup_mode`
+    the replaced file is kept as ``<target>.bak`` (a hard link when possible).
+    """
+    temporary = _sibling(target, ".tmp")
+    try:
+        write(temporary)
+        _fsync_file(temporary)
+        if target.exists():
+            shutil.copymode(target, temporary)
+            if keeps_backup():
+                backup = backup_path(target)
+                _remove(backup)
+                try:
+                    os.link(target, backup)
+                except OSError:
+                    shutil.copy2(target, backup)
+        os.replace(temporary, target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    _fsync_directory(target.parent)
+
+
+def replace_directory(target: Path, write: Callable[[Path], object]) -> None:
+    """Write a directory store with *write* into a sibling temp path, then swap it in.
+
+    Directories cannot be renamed over each other atomically, so the old store
+    is first renamed aside; a crash between the two renames leaves it there as
+    ``.<target>.<id>.old`` (or ``<target>.bak`` with backups enabled) rather
+    than half-written.
+    """
+    temporary = _sibling(target, ".tmp")
+    try:
+        write(temporary)
+        _fsync_tree(temporary)
+        if target.exists():
+            shutil.copymode(target, temporary)
+    except BaseException:
+        _remove(temporary)
+        raise
+    if not target.exists():
+        temporary.rename(target)
+        _fsync_directory(target.parent)
+        return
+    keep = keeps_backup()
+    previous = backup_path(target) if keep else _sibling(target, ".old")
+    if keep:
+        _remove(previous)
+    target.rename(previous)
+    temporary.rename(target)
+    _fsync_directory(target.parent)
+    if not keep:
+        shutil.rmtree(previous, ignore_errors=True)
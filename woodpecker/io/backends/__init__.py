@@ -1,8 +1,11 @@
+from .multifile import MultiFileInput, group_shards
 from .nc import NetCDFInput, NetCDFOutputAdapter, netcdf_backend_available
 from .xr import XarrayInput
 from .zarr import ZarrInput, ZarrOutputAdapter, zarr_backend_available
 
 __all__ = [
+    "group_shards",
+    "MultiFileInput",
     "NetCDFInput",
     "NetCDFOutputAdapter",
     "netcdf_backend_available",
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Collection, Iterable
+
+import xarray as xr
+
+from ..base import DataInput, OutputAdapter, select_variables
+from ..patch import attr_changes, remember_source
+from ..runtime import module_available, open_chunks, warn_once, warn_or_raise
+from .nc import NetCDFInput, _fallback_dataset, _write_netcdf, netcdf_backend_available
+
+# CMOR file names end in the covered time range, e.g. ``..._gn_185001-201412.nc``;
+# the part before it names the dataset.
+TIME_RANGE_PATTERN = r"^(.+)_\d{4,}(?:-\d{4,})?\.nc$"
+
+# Named groupings accepted by group_shards() besides regular expressions.
+SHARD_GROUPINGS = {"time-range": TIME_RANGE_PATTERN}
+
+# Per-file metadata (e.g. from a manifest) that does not carry over to a group.
+_SHARD_METADATA = ("size", "checksum")
+
+
+@dataclass
+class _OpenedShards:
+    """The shards behind a loaded multi-file dataset, as read from disk."""
+
+    combined: xr.Dataset
+    baseline: xr.Dataset
+    parts: list[xr.Dataset]
+    bounds: list[tuple[int, int]]
+
+
+def _close_all(parts: list[xr.Dataset]) -> None:
+    for part in parts:
+        part.close()
+
+
+def _rebase_attrs(
+    original: dict[str, Any], before: dict[str, Any], after: dict[str, Any]
+) -> dict[str, Any]:
+    """Apply the change from *before* to *after* onto a shard's *original* attrs."""
+    updated, removed = attr_changes(before, after)
+    rebased = {key: value for key, value in original.items() if key not in removed}
+    rebased.update(updated)
+    return rebased
+
+
+@dataclass
+class MultiFileInput(DataInput):
+    """NetCDF files holding consecutive pieces of one dataset along *concat_dim*.
+
+    The shards are opened lazily and combined into one dataset, so identity
+    resolution and fixes run once for the whole group. Saving splits the
+    result back along *concat_dim* and writes every shard to its own file with
+    its own attrs and encoding; shards a fix did not touch are not rewritten.
+    """
+
+    shards: tuple[Path, ...] = ()
+    concat_dim: str = "time"
+    _opened: _OpenedShards | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.shards = tuple(Path(path) for path in self.shards)
+        if not self.shards:
+            raise ValueError("MultiFileInput requires at least one shard")
+        if self.source_path is None:
+            self.source_path = self.shards[0]
+        if not self.name:
+            self.name = self.shards[0].name
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Opened shards stay with the process that loaded them.
+        return {**self.__dict__, "_opened": None}
+
+    @property
+    def is_available(self) -> bool:
+        return netcdf_backend_available()
+
+    @property
+    def reference(self) -> str:
+        parents = {path.parent for path in self.shards}
+        if len(parents) == 1:
+            return str(parents.pop() / str(self.name))
+        return str(self.name)
+
+    def source_files(self) -> list[Path]:
+        return list(self.shards)
+
+    def load(self) -> xr.Dataset:
+        return self._open()
+
+    def load_header(self) -> xr.Dataset:
+        # Shards are always opened lazily.
+        return self._open()
+
+    def load_subset(self, variables: Collection[str], *, header_only: bool = False) -> xr.Dataset:
+        return self._open(variables=variables)
+
+    def _open(self, *, variables: Collection[str] | None = None) -> xr.Dataset:
+        if not self.is_available:
+            warn_or_raise(
+                f"NetCDF input backend unavailable for '{self.reference}'. Falling back to empty dataset."
+            )
+            return _fallback_dataset(self.source_name)
+        chunks = open_chunks()
+        if chunks is None and module_available("dask"):
+            # One dask chunk per shard keeps every chunk inside a single file.
+            chunks = {}
+        elif chunks is None:
+            warn_once("Multi-file inputs are read eagerly because dask is not installed.")
+        parts: list[xr.Dataset] = []
+        try:
+            for path in self.shards:
+                if chunks is None:
+                    parts.append(xr.open_dataset(path))
+                else:
+                    parts.append(xr.open_dataset(path, chunks=chunks))
+            bounds = self._bounds(parts)
+            combined = xr.combine_nested(
+                parts,
+                concat_dim=self.concat_dim,
+                data_vars="minimal",
+                coords="minimal",
+                compat="override",
+                combine_attrs="override",
+            )
+        except Exception as exc:
+            _close_all(parts)
+            warn_or_raise(
+                f"Failed to read multi-file input '{self.reference}': {exc}. Falling back to empty dataset."
+            )
+            return _fallback_dataset(self.source_name)
+        combined.set_close(lambda: _close_all(parts))
+        combined.attrs.setdefault("source_name", self.source_name)
+        if variables is not None:
+            return select_variables(combined, variables)
+        self._opened = _OpenedShards(combined, combined.copy(deep=False), parts, bounds)
+        return combined
+
+    def _bounds(self, parts: list[xr.Dataset]) -> list[tuple[int, int]]:
+        bounds: list[tuple[int, int]] = []
+        start = 0
+        for path, part in zip(self.shards, parts):
+            if self.concat_dim not in part.sizes:
+                raise ValueError(f"shard '{path}' has no '{self.concat_dim}' dimension")
+            bounds.append((start, start + part.sizes[self.concat_dim]))
+            start += part.sizes[self.concat_dim]
+        return bounds
+
+    def _shard(self, dataset: xr.Dataset, index: int) -> xr.Dataset:
+        """Return the piece of *dataset* stored in shard *index*, with that file's attrs."""
+        opened = self._opened
+        assert opened is not None
+        start, stop = opened.bounds[index]
+        part = dataset.isel({self.concat_dim: slice(start, stop)}).copy(deep=False)
+        original = opened.parts[index]
+        part.attrs = _rebase_attrs(original.attrs, opened.baseline.attrs, dataset.attrs)
+        for name, variable in part.variables.items():
+            if name not in original.variables:
+                continue
+            # Encodings such as time units can differ between shards.
+            variable.encoding = dict(original.variables[name].encoding)
+            if name in opened.baseline.variables:
+                variable.attrs = _rebase_attrs(
+                    original.variables[name].attrs,
+                    opened.baseline.variables[name].attrs,
+                    variable.attrs,
+                )
+        return part
+
+    def save(
+        self,
+        dataset: xr.Dataset,
+        dry_run: bool = True,
+        output_adapter: OutputAdapter | None = None,
+    ) -> bool:
+        if dry_run:
+            return False
+        opened = self._opened
+        if opened is None or opened.combined is not dataset:
+            warn_once(
+                f"Multi-file input '{self.reference}' can only save the dataset it loaded. Skipping write."
+            )
+            return False
+        if not self.is_available:
+            warn_once(f"NetCDF output backend unavailable for '{self.reference}'. Skipping write.")
+            return False
+        if dataset.sizes.get(self.concat_dim) != opened.bounds[-1][1]:
+            warn_once(
+                f"Cannot split '{self.reference}' back into shards: "
+                f"'{self.concat_dim}' changed size. Skipping write."
+            )
+            return False
+        saved = True
+        for index, path in enumerate(self.shards):
+            part = self._shard(dataset, index)
+            if output_adapter is not None:
+                shard_input = NetCDFInput(source_path=path, name=path.name)
+                saved = output_adapter.save(part, shard_input, dry_run=False) and saved
+                continue
+            # The shard file holds the baseline, so unchanged shards are left alone
+            # and metadata-only changes are patched rather than rewritten.
+            remember_source(part, path, baseline=self._shard(opened.baseline, index))
+            # Patching needs this shard's read handle closed.
+            part.set_close(opened.parts[index].close)
+            saved = _write_netcdf(part, path, str(path)) and saved
+        return saved
+
+
+def _shard_key(data_input: NetCDFInput, pattern: re.Pattern[str] | None) -> str | None:
+    path = data_input.source_path
+    if pattern is not None:
+        match = pattern.match(path.name)
+        if match is None:
+            return None
+        return str(path.parent / (match.group(1) if match.groups() else match.group(0)))
+    dataset_id = data_input.metadata.get("dataset_id")
+    if not isinstance(dataset_id, str) or not dataset_id.strip():
+        dataset = data_input.load_header()
+        dataset_id = dataset.attrs.get("dataset_id")
+        dataset.close()
+    if isinstance(dataset_id, str) and dataset_id.strip():
+        return dataset_id.strip()
+    return None
+
+
+def group_shards(
+    inputs: Iterable[DataInput], *, by: str = "dataset_id", concat_dim: str = "time"
+) -> list[DataInput]:
+    """Combine NetCDF inputs that are shards of one dataset into :class:`MultiFileInput`.
+
+    *by* is ``"dataset_id"`` to group files by their ``dataset_id`` attr (or a
+    ``dataset_id`` declared in the input metadata, which avoids opening the
+    file), or a regular expression matched against file names: files in one
+    directory whose first group (or whole match) is equal form a group.
+    ``"time-range"`` stands for :data:`TIME_RANGE_PATTERN`. Shards are ordered
+    by path. Other inputs and files without a key are returned unchanged, in
+    input order.
+    """
+    try:
+        pattern = None if by == "dataset_id" else re.compile(SHARD_GROUPINGS.get(by, by))
+    except re.error as exc:
+        raise ValueError(f"Invalid shard grouping {by!r}: {exc}") from None
+    groups: dict[str, list[NetCDFInput]] = {}
+    ordered: list[DataInput | str] = []
+    for data_input in inputs:
+        key = _shard_key(data_input, pattern) if isinstance(data_input, NetCDFInput) else None
+        if key is None:
+            ordered.append(data_input)
+            continue
+        if key not in groups:
+            groups[key] = []
+            ordered.append(key)
+        groups[key].append(data_input)
+
+    grouped: list[DataInput] = []
+    for item in ordered:
+        if not isinstance(item, str):
+            grouped.append(item)
+            continue
+        members = groups[item]
+        if len(members) == 1:
+            grouped.append(members[0])
+            continue
+        members.sort(key=lambda member: member.source_path)
+        metadata = {
+            key: value for key, value in members[0].metadata.items() if key not in _SHARD_METADATA
+        }
+        grouped.append(
+            MultiFileInput(
+                name=Path(item).name if pattern is not None else item,
+                metadata=metadata,
+                shards=tuple(member.source_path for member in members),
+                concat_dim=concat_dim,
+            )
+        )
+    return grouped
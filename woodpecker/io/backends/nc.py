@@ -3,18 +3,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection
 
 import xarray as xr
 
-from ..base import DataInput, OutputAdapter
-from ..runtime import module_available, warn_once, warn_or_raise
+from ..atomic import replace_file
+from ..base import DataInput, OutputAdapter, select_variables
+from ..encoding import apply_encoding_policy
+from ..patch import remember_source
+from ..runtime import (
+    NETCDF_BACKEND_MODULES,
+    module_available,
+    open_chunks,
+    output_encoding,
+    serialized_io,
+    warn_once,
+    warn_or_raise,
+)
+from .nc_patch import patch_netcdf
 
 _NETCDF_SUFFIXES = {".nc", ".nc4", ".cdf"}
 
 
 def netcdf_backend_available() -> bool:
-    return any(module_available(name) for name in ("netCDF4", "h5netcdf", "scipy"))
+    return any(module_available(name) for name in NETCDF_BACKEND_MODULES)
 
 
 def _fallback_dataset(source_name: str) -> xr.Dataset:
@@ -25,8 +37,22 @@ def _fallback_dataset(source_name: str) -> xr.Dataset:
 
 
 def _write_netcdf(dataset: xr.Dataset, target: Path, reference: str) -> bool:
+    # A changed layout makes the patch below fall back to a rewrite.
+    apply_encoding_policy(dataset, output_encoding(), "netcdf")
     try:
-        dataset.to_netcdf(target)
+        if patch_netcdf(dataset, target):
+            return True
+    except Exception as exc:
+        # The patched copy is discarded and target is left as it was.
+        warn_once(f"Failed to patch NetCDF output '{reference}': {exc}. Rewriting it.")
+
+    def write(path: Path) -> None:
+        with serialized_io():
+            dataset.to_netcdf(path)
+
+    try:
+        # Lazy chunks may still be read from target, which stays intact until the swap.
+        replace_file(target, write)
         return True
     except Exception as exc:
         warn_once(f"Failed to write NetCDF output '{reference}': {exc}.")
@@ -47,17 +73,38 @@ class NetCDFInput(DataInput):
         return netcdf_backend_available()
 
     def load(self) -> xr.Dataset:
+        return self._open(lazy=False)
+
+    def load_header(self) -> xr.Dataset:
+        return self._open(lazy=True)
+
+    def load_subset(self, variables: Collection[str], *, header_only: bool = False) -> xr.Dataset:
+        return self._open(lazy=header_only, variables=variables)
+
+    def _open(self, *, lazy: bool, variables: Collection[str] | None = None) -> xr.Dataset:
         if not self.is_available:
             warn_or_raise(
                 f"NetCDF input backend unavailable for '{self.reference}'. Falling back to empty dataset."
             )
             return _fallback_dataset(self.source_name)
+        chunks = open_chunks()
         try:
-            opened = xr.open_dataset(self.source_path)
-            dataset = opened.load()
-            close = getattr(opened, "close", None)
-            if callable(close):
-                close()
+            if chunks is None:
+                opened = xr.open_dataset(self.source_path)
+            else:
+                opened = xr.open_dataset(self.source_path, chunks=chunks)
+            if variables is not None:
+                opened = select_variables(opened, variables)
+            if lazy or chunks is not None:
+                # Chunked datasets stay dask-backed; the caller closes them.
+                dataset = opened
+            else:
+                dataset = opened.load()
+                close = getattr(opened, "close", None)
+                if callable(close):
+                    close()
+            if variables is None and not lazy and isinstance(dataset, xr.Dataset):
+                remember_source(dataset, self.source_path)
         except Exception as exc:
             warn_or_raise(
                 f"Failed to read NetCDF input '{self.reference}': {exc}. Falling back to empty dataset."
@@ -95,7 +142,7 @@ class NetCDFOutputAdapter(OutputAdapter):
     def target_path(self, data_input: DataInput) -> Path:
         if data_input.source_path is None:
             raise ValueError("NetCDF output requires a path-based input")
-        return data_input.source_path.with_suffix(".nc")
+        return self.place(data_input.source_path.with_suffix(".nc"))
 
     def save(self, dataset: xr.Dataset, data_input: DataInput, dry_run: bool = True) -> bool:
         if dry_run:
@@ -106,6 +153,7 @@ class NetCDFOutputAdapter(OutputAdapter):
             )
             return False
         target = self.target_path(data_input)
+        target.parent.mkdir(parents=True, exist_ok=True)
         return _write_netcdf(dataset, target, str(target))
 
 
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import xarray as xr
+from xarray import conventions
+
+from ..atomic import replace_file
+from ..base import is_chunked
+from ..patch import (
+    AttrChanges,
+    attr_changes,
+    coding_encoding,
+    encoded_header,
+    remember_source,
+    same_values,
+    source_snapshot,
+    storage_changed,
+)
+from ..runtime import module_available, serialized_io
+
+# Attributes netCDF cannot change once a variable has been created.
+_FIXED_ATTRS = {"_FillValue"}
+
+
+def patch_available() -> bool:
+    return module_available("netCDF4") or module_available("h5netcdf")
+
+
+@dataclass
+class NetCDFPatch:
+    """Attribute and value changes that turn the file on disk into a dataset."""
+
+    attrs: AttrChanges = ({}, ())
+    variable_attrs: dict[str, AttrChanges] = field(default_factory=dict)
+    values: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (any(self.attrs) or self.variable_attrs or self.values)
+
+
+def plan_patch(before: xr.Dataset, after: xr.Dataset) -> NetCDFPatch | None:
+    """Return the in-place changes that write *after* over *before*, or None.
+
+    None means the change needs a full rewrite: variables or dimensions were
+    added, removed or resized, a dtype, ``_FillValue`` or storage setting
+    (compression, chunking) changed, or the dataset cannot be encoded.
+    """
+    if dict(before.sizes) != dict(after.sizes):
+        return None
+    if before.encoding.get("unlimited_dims") != after.encoding.get("unlimited_dims"):
+        return None
+    before_variables, before_attrs = conventions.encode_dataset_coordinates(before)
+    after_variables, after_attrs = conventions.encode_dataset_coordinates(after)
+    if before_variables.keys() != after_variables.keys():
+        return None
+
+    patch = NetCDFPatch(attrs=attr_changes(before_attrs, after_attrs))
+    for name, variable in after_variables.items():
+        original = before_variables[name]
+        if variable.dims != original.dims or variable.dtype.kind in "OUS":
+            return None
+        if storage_changed(original, variable):
+            return None
+        encoded_before = encoded_header(original, name)
+        rewrite = coding_encoding(variable) != coding_encoding(original) or not same_values(
+            original, variable
+        )
+        if rewrite:
+            encoded = conventions.encode_cf_variable(variable, name=name)
+        else:
+            encoded = encoded_header(variable, name)
+        if encoded.dtype != encoded_before.dtype:
+            return None
+        changes = attr_changes(encoded_before.attrs, encoded.attrs)
+        if _FIXED_ATTRS.intersection(changes[0]) or _FIXED_ATTRS.intersection(changes[1]):
+            return None
+        if any(changes):
+            patch.variable_attrs[name] = changes
+        if rewrite:
+            patch.values[name] = np.asarray(encoded.values)
+    return patch
+
+
+def _apply_attrs(attrs: Any, changes: AttrChanges) -> None:
+    updated, removed = changes
+    for key in removed:
+        del attrs[key]
+    for key, value in updated.items():
+        attrs[key] = value
+
+
+class _NetCDF4Attrs:
+    """Mapping-style attribute access for a netCDF4 dataset or variable."""
+
+    def __init__(self, target: Any):
+        self.target = target
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.target.setncattr(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.target.delncattr(key)
+
+
+def _write_patch_netcdf4(path: Path, patch: NetCDFPatch) -> None:
+    import netCDF4
+
+    with netCDF4.Dataset(path, "a") as handle:
+        _apply_attrs(_NetCDF4Attrs(handle), patch.attrs)
+        for name, changes in patch.variable_attrs.items():
+            _apply_attrs(_NetCDF4Attrs(handle.variables[name]), changes)
+        for name, values in patch.values.items():
+            variable = handle.variables[name]
+            variable.set_auto_maskandscale(False)
+            variable[...] = values
+
+
+def _write_patch_h5netcdf(path: Path, patch: NetCDFPatch) -> None:
+    import h5netcdf
+
+    with h5netcdf.File(path, "a") as handle:
+        _apply_attrs(handle.attrs, patch.attrs)
+        for name, changes in patch.variable_attrs.items():
+            _apply_attrs(handle.variables[name].attrs, changes)
+        for name, values in patch.values.items():
+            handle.variables[name][...] = values
+
+
+def patch_netcdf(dataset: xr.Dataset, target: Path) -> bool:
+    """Apply a metadata-only change of *dataset* to *target* without re-encoding it.
+
+    Only works when *dataset* was loaded from *target*; then changed attrs are
+    set or deleted and only variables whose values changed are written, so
+    unchanged data blocks are never encoded again. The patch is written to a
+    copy of *target* that replaces it through
+    :func:`~woodpecker.io.atomic.replace_file`, so *target* is never left
+    half-updated. Returns False when the change needs a full rewrite; errors
+    while writing propagate to the caller.
+    """
+    baseline = source_snapshot(dataset, target)
+    if baseline is None or not patch_available():
+        return False
+    try:
+        with serialized_io():
+            patch = plan_patch(baseline, dataset)
+    except Exception:
+        return False
+    if patch is None:
+        return False
+    if not patch.is_empty:
+        if is_chunked(dataset):
+            # Release the read handle on the file that is about to be replaced.
+            with serialized_io():
+                dataset.close()
+        write_patch = _write_patch_netcdf4 if module_available("netCDF4") else _write_patch_h5netcdf
+
+        def write(path: Path) -> None:
+            shutil.copyfile(target, path)
+            with serialized_io():
+                write_patch(path, patch)
+
+        replace_file(target, write)
+    # The file now matches the dataset, so a further save patches from here.
+    remember_source(dataset, target)
+    return True
@@ -3,16 +3,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection
 
 import xarray as xr
 
-from ..base import DataInput, OutputAdapter
-from ..runtime import module_available, warn_once, warn_or_raise
+from ..atomic import replace_directory
+from ..base import DataInput, OutputAdapter, is_chunked, select_variables
+from ..encoding import apply_encoding_policy, dask_chunks_fit
+from ..patch import remember_source
+from ..runtime import (
+    ZARR_BACKEND_MODULES,
+    module_available,
+    open_chunks,
+    output_encoding,
+    serialized_io,
+    warn_once,
+    warn_or_raise,
+)
+from .zarr_patch import patch_zarr
 
 
 def zarr_backend_available() -> bool:
-    return all(module_available(name) for name in ("zarr", "numcodecs"))
+    return all(module_available(name) for name in ZARR_BACKEND_MODULES)
 
 
 def _fallback_dataset(source_name: str) -> xr.Dataset:
@@ -23,8 +35,29 @@ def _fallback_dataset(source_name: str) -> xr.Dataset:
 
 
 def _write_zarr(dataset: xr.Dataset, target: Path, reference: str) -> bool:
+    # A changed layout makes the update below rewrite the affected arrays.
+    apply_encoding_policy(dataset, output_encoding(), "zarr")
     try:
-        dataset.to_zarr(target, mode="w")
+        if patch_zarr(dataset, target):
+            return True
+    except Exception as exc:
+        # The updated copy is discarded and target is left as it was.
+        warn_once(f"Failed to update Zarr output '{reference}': {exc}. Rewriting it.")
+    try:
+        if is_chunked(dataset):
+            # Store chunks follow the dask chunks, which may differ from the source store.
+            dataset = dataset.copy()
+            for variable in dataset.variables.values():
+                if not dask_chunks_fit(variable.chunks, variable.encoding.get("chunks")):
+                    variable.encoding.pop("chunks", None)
+                    variable.encoding.pop("preferred_chunks", None)
+
+        def write(path: Path) -> None:
+            with serialized_io():
+                dataset.to_zarr(path, mode="w")
+
+        # Lazy chunks may still be read from target, which stays intact until the swap.
+        replace_directory(target, write)
         return True
     except Exception as exc:
         warn_once(f"Failed to write Zarr output '{reference}': {exc}.")
@@ -45,17 +78,38 @@ class ZarrInput(DataInput):
         return zarr_backend_available()
 
     def load(self) -> xr.Dataset:
+        return self._open(lazy=False)
+
+    def load_header(self) -> xr.Dataset:
+        return self._open(lazy=True)
+
+    def load_subset(self, variables: Collection[str], *, header_only: bool = False) -> xr.Dataset:
+        return self._open(lazy=header_only, variables=variables)
+
+    def _open(self, *, lazy: bool, variables: Collection[str] | None = None) -> xr.Dataset:
         if not self.is_available:
             warn_or_raise(
                 f"Zarr input backend unavailable for '{self.reference}'. Falling back to empty dataset."
             )
             return _fallback_dataset(self.source_name)
+        chunks = open_chunks()
         try:
-            opened = xr.open_zarr(self.source_path)
-            dataset = opened.load()
-            close = getattr(opened, "close", None)
-            if callable(close):
-                close()
+            if chunks is None:
+                opened = xr.open_zarr(self.source_path)
+            else:
+                opened = xr.open_zarr(self.source_path, chunks=chunks)
+            if variables is not None:
+                opened = select_variables(opened, variables)
+            if lazy or chunks is not None:
+                # Chunked datasets stay dask-backed; the caller closes them.
+                dataset = opened
+            else:
+                dataset = opened.load()
+                close = getattr(opened, "close", None)
+                if callable(close):
+                    close()
+            if variables is None and not lazy and isinstance(dataset, xr.Dataset):
+                remember_source(dataset, self.source_path)
         except Exception as exc:
             warn_or_raise(
                 f"Failed to read Zarr input '{self.reference}': {exc}. Falling back to empty dataset."
@@ -93,7 +147,7 @@ class ZarrOutputAdapter(OutputAdapter):
     def target_path(self, data_input: DataInput) -> Path:
         if data_input.source_path is None:
             raise ValueError("Zarr output requires a path-based input")
-        return data_input.source_path.with_suffix(".zarr")
+        return self.place(data_input.source_path.with_suffix(".zarr"))
 
     def save(self, dataset: xr.Dataset, data_input: DataInput, dry_run: bool = True) -> bool:
         if dry_run:
@@ -104,6 +158,7 @@ class ZarrOutputAdapter(OutputAdapter):
             )
             return False
         target = self.target_path(data_input)
+        target.parent.mkdir(parents=True, exist_ok=True)
         return _write_zarr(dataset, target, str(target))
 
 
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping
+
+import xarray as xr
+from xarray import conventions
+
+from ..atomic import link_tree, replace_directory
+from ..encoding import dask_chunks_fit
+from ..patch import (
+    AttrChanges,
+    attr_changes,
+    coding_encoding,
+    encoded_header,
+    remember_source,
+    same_values,
+    source_snapshot,
+    storage_changed,
+)
+from ..runtime import serialized_io
+
+_STAGING_PREFIX = "__woodpecker_staged_"
+
+
+@dataclass
+class ZarrPatch:
+    """Metadata updates and per-array writes that turn a store into a dataset."""
+
+    attrs: AttrChanges = ({}, ())
+    variable_attrs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    renamed: dict[str, str] = field(default_factory=dict)
+    removed: list[str] = field(default_factory=list)
+    written: dict[str, xr.Variable] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            any(self.attrs) or self.variable_attrs or self.renamed or self.removed or self.written
+        )
+
+
+def _store_attrs(variable: xr.Variable, name: str) -> dict[str, Any]:
+    """Return the ``.zattrs`` xarray writes for *variable*."""
+    attrs = dict(encoded_header(variable, name).attrs)
+    # Zarr keeps the fill value in ``.zarray``, not in the attrs.
+    attrs.pop("_FillValue", None)
+    attrs["_ARRAY_DIMENSIONS"] = list(variable.dims)
+    return attrs
+
+
+def _needs_write(before: xr.Variable, after: xr.Variable, name: str) -> bool:
+    if before.shape != after.shape or storage_changed(before, after):
+        return True
+    if coding_encoding(before) != coding_encoding(after) or not same_values(before, after):
+        return True
+    return encoded_header(before, name).dtype != encoded_header(after, name).dtype
+
+
+def _renamed_from(
+    variable: xr.Variable, name: str, candidates: Mapping[str, xr.Variable]
+) -> str | None:
+    for old_name, original in candidates.items():
+        if not _needs_write(original, variable, name):
+            return old_name
+    return None
+
+
+def plan_patch(before: xr.Dataset, after: xr.Dataset) -> ZarrPatch | None:
+    """Return the store updates that write *after* over *before*, or None.
+
+    Attrs and dimension names are updated in ``.zattrs``, renamed variables are
+    moved, and only new variables or variables whose values, dtype, encoding or
+    chunking changed are written. None means a dimension kept its name but
+    changed size, which needs a full rewrite.
+    """
+    if any(before.sizes[dim] != size for dim, size in after.sizes.items() if dim in before.sizes):
+        return None
+    before_variables, before_attrs = conventions.encode_dataset_coordinates(before)
+    after_variables, after_attrs = conventions.encode_dataset_coordinates(after)
+    unmatched = {
+        name: variable for name, variable in before_variables.items() if name not in after_variables
+    }
+
+    patch = ZarrPatch(attrs=attr_changes(before_attrs, after_attrs))
+    for name, variable in after_variables.items():
+        original_name: str | None = name
+        if name not in before_variables:
+            original_name = _renamed_from(variable, name, unmatched)
+        if original_name is None:
+            patch.written[name] = after.variables[name]
+            continue
+        original = before_variables[original_name]
+        if original_name != name:
+            patch.renamed[original_name] = name
+            del unmatched[original_name]
+        elif _needs_write(original, variable, name):
+            patch.written[name] = after.variables[name]
+            continue
+        stored = _store_attrs(variable, name)
+        if any(attr_changes(_store_attrs(original, original_name), stored)):
+            patch.variable_attrs[name] = stored
+    patch.removed = list(unmatched)
+    for name in patch.written:
+        patch.variable_attrs[name] = _store_attrs(after_variables[name], name)
+    return patch
+
+
+def _stage(target: Path, name: str, variable: xr.Variable) -> None:
+    encoding = {
+        key: value
+        for key, value in variable.encoding.items()
+        if key not in ("coordinates", "preferred_chunks")
+    }
+    if variable.chunks is not None and not dask_chunks_fit(variable.chunks, encoding.get("chunks")):
+        # Store chunks follow the dask chunks, which may differ from the source store.
+        encoding.pop("chunks", None)
+    staged = xr.Variable(variable.dims, variable.data, variable.attrs, encoding)
+    xr.Dataset({_STAGING_PREFIX + name: staged}).to_zarr(target, mode="a", consolidated=False)
+
+
+def _update_attrs(attributes: Any, changes: AttrChanges, current: dict[str, Any]) -> None:
+    updated, removed = changes
+    for key in removed:
+        current.pop(key, None)
+    current.update(updated)
+    attributes.put(current)
+
+
+def _write_patch(target: Path, patch: ZarrPatch) -> None:
+    import zarr
+
+    group = zarr.open_group(str(target), mode="r+")
+    # Appending through xarray replaces the group attrs, so keep the current ones.
+    group_attrs = dict(group.attrs)
+    # Write new arrays under staging names first: lazy values may still read
+    # the arrays they replace.
+    for name, variable in patch.written.items():
+        _stage(target, name, variable)
+
+    for name in patch.removed:
+        del group[name]
+    for old_name, name in patch.renamed.items():
+        group.move(old_name, name)
+    for name in patch.written:
+        if name in group:
+            del group[name]
+        group.move(_STAGING_PREFIX + name, name)
+    _update_attrs(group.attrs, patch.attrs, group_attrs)
+    for name, stored in patch.variable_attrs.items():
+        attributes = group[name].attrs
+        current = dict(attributes)
+        _update_attrs(attributes, attr_changes(current, stored), current)
+    if (target / ".zmetadata").exists():
+        zarr.consolidate_metadata(str(target))
+
+
+def patch_zarr(dataset: xr.Dataset, target: Path) -> bool:
+    """Update the Zarr store *target* to match *dataset* without rewriting it.
+
+    Only works when *dataset* was loaded from *target*. The update runs on a
+    copy of the store whose chunk files are hard links, which replaces
+    *target* through :func:`~woodpecker.io.atomic.replace_directory`; Zarr
+    replaces files instead of changing them, so *target* is never left
+    half-updated. Unchanged arrays are never read or rewritten. Returns False
+    when the change needs a full rewrite; errors while writing propagate to
+    the caller.
+    """
+    baseline = source_snapshot(dataset, target)
+    if baseline is None:
+        return False
+    try:
+        with serialized_io():
+            patch = plan_patch(baseline, dataset)
+    except Exception:
+        return False
+    if patch is None:
+        return False
+    if not patch.is_empty:
+
+        def write(path: Path) -> None:
+            link_tree(target, path)
+            with serialized_io():
+                _write_patch(path, patch)
+
+        replace_directory(target, write)
+    # The store now matches the dataset, so a further save patches from here.
+    remember_source(dataset, target)
+    return True
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection, Iterator
 
 import xarray as xr
 
@@ -19,6 +20,24 @@ class DataInput(ABC):
     @abstractmethod
     def load(self) -> xr.Dataset: ...
 
+    def load_header(self) -> xr.Dataset:
+        """Open the dataset without reading data variable values into memory.
+
+        Attrs, encodings and index coordinates are available; data variables are
+        read lazily on access. The caller must close the returned dataset.
+        Backends without lazy access fall back to ``load()``.
+        """
+        return self.load()
+
+    def load_subset(self, variables: Collection[str], *, header_only: bool = False) -> xr.Dataset:
+        """Open the dataset restricted to *variables* plus all coordinates.
+
+        The default loads everything and drops the rest; file backends select
+        before reading so unselected data variables are never read.
+        """
+        dataset = self.load_header() if header_only else self.load()
+        return select_variables(dataset, variables)
+
     def save(
         self,
         dataset: xr.Dataset,
@@ -30,6 +49,14 @@ class DataInput(ABC):
     def expand(self) -> list[DataInput]:
         return [self]
 
+    def iter_expand(self) -> Iterator[DataInput]:
+        """Yield the inputs of :meth:`expand` one by one; containers stream them as found."""
+        return iter(self.expand())
+
+    def source_files(self) -> list[Path]:
+        """Return the files or stores :meth:`load` reads; empty for in-memory inputs."""
+        return [] if self.source_path is None else [self.source_path]
+
     @property
     def is_available(self) -> bool:
         return True
@@ -49,15 +76,58 @@ class DataInput(ABC):
         return self.source_name
 
 
+def select_variables(dataset: xr.Dataset, variables: Collection[str]) -> xr.Dataset:
+    """Drop data variables not named in *variables*, keeping coords, attrs and the file handle."""
+    keep = set(variables)
+    dropped = [name for name in dataset.data_vars if name not in keep]
+    if not dropped:
+        return dataset
+    subset = dataset.drop_vars(dropped)
+    subset.set_close(dataset.close)
+    return subset
+
+
+def is_chunked(dataset: xr.Dataset) -> bool:
+    """Return True when any variable of *dataset* is backed by a dask array."""
+    return any(variable.chunks is not None for variable in dataset.variables.values())
+
+
 class OutputAdapter(ABC):
-    """Abstract output strategy used to persist transformed datasets."""
+    """Abstract output strategy used to persist transformed datasets.
+
+    Targets sit next to their source unless :meth:`redirect` moves them below
+    an output directory that mirrors the source tree.
+    """
 
     format_name: str = ""
+    output_dir: Path | None = None
+    source_root: Path | None = None
 
     @property
     def is_available(self) -> bool:
         return True
 
+    def redirect(
+        self, output_dir: str | Path, source_root: str | Path | None = None
+    ) -> OutputAdapter:
+        """Write below *output_dir*, mirroring paths relative to *source_root* (default: cwd).
+
+        Sources outside *source_root* keep their full absolute path below *output_dir*.
+        """
+        self.output_dir = Path(output_dir)
+        self.source_root = Path(source_root) if source_root is not None else None
+        return self
+
+    def place(self, path: Path) -> Path:
+        """Map the default target *path* next to a source into :attr:`output_dir`."""
+        if self.output_dir is None:
+            return path
+        absolute = Path(os.path.abspath(path))
+        root = Path(os.path.abspath(self.source_root or Path.cwd()))
+        if absolute.is_relative_to(root):
+            return self.output_dir / absolute.relative_to(root)
+        return self.output_dir / absolute.relative_to(absolute.anchor)
+
     @abstractmethod
     def target_path(self, data_input: DataInput) -> Path: ...
 
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import xarray as xr
+
+from .base import DataInput
+
+# Every cached dataset keeps its file handles open, so the entry count is capped too.
+DEFAULT_DATASET_CACHE_ENTRIES = 64
+
+_DATASET_CACHE: DatasetCache | None = None
+
+
+@dataclass
+class _Entry:
+    stamp: tuple[tuple[str, int, int, int], ...]
+    dataset: xr.Dataset
+    nbytes: int
+
+
+def _stamp(data_input: DataInput) -> tuple[tuple[str, int, int, int], ...] | None:
+    """Return path, inode, size and mtime of the files behind *data_input*, or None."""
+    paths = data_input.source_files()
+    if not paths:
+        return None
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamp.append((str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return tuple(stamp)
+
+
+def _resident_bytes(dataset: xr.Dataset) -> int:
+    """Estimate the memory a header-only dataset holds: index coordinates and attrs."""
+    size = sum(dataset.variables[name].nbytes for name in dataset.xindexes)
+    for attrs in (dataset.attrs, *(variable.attrs for variable in dataset.variables.values())):
+        size += sum(len(str(key)) + len(str(value)) for key, value in attrs.items())
+    return size
+
+
+def _handout(dataset: xr.Dataset) -> xr.Dataset:
+    # A shallow copy has its own attrs and encodings and does not close the
+    # cached file handles, so callers may change metadata and close it freely.
+    return dataset.copy(deep=False)
+
+
+class DatasetCache:
+    """Bounded LRU cache of header-only datasets shared by one run.
+
+    Recipe resolution and header-only checks of the same input then open its
+    files once. Entries are keyed by input and validated against the inode,
+    size and mtime of its files; callers get shallow copies, so metadata edits
+    never reach the cache. Least recently used entries are closed once the
+    estimated size exceeds *max_bytes* or more than *max_entries* are held.
+    Loads that read array values never go through the cache.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = DEFAULT_DATASET_CACHE_ENTRIES) -> None:
+        if max_bytes < 1 or max_entries < 1:
+            raise ValueError("Dataset cache limits must be positive")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(data_input: DataInput) -> tuple[str, str]:
+        return type(data_input).__name__, data_input.reference
+
+    def load_header(self, data_input: DataInput) -> xr.Dataset:
+        """Return ``data_input.load_header()``, reusing a cached open dataset."""
+        stamp = _stamp(data_input)
+        if stamp is None:
+            return data_input.load_header()
+        key = self._key(data_input)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _handout(entry.dataset)
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+        dataset = data_input.load_header()
+        if dataset.attrs.get("_woodpecker_load_failed"):
+            return dataset
+        nbytes = _resident_bytes(dataset)
+        if nbytes > self.max_bytes:
+            return dataset
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(stamp, dataset, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+        return _handout(dataset)
+
+    def invalidate(self, data_input: DataInput) -> None:
+        """Close and forget the cached dataset of *data_input*, e.g. before it is rewritten."""
+        with self._lock:
+            self._drop(self._key(data_input))
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+            entry.dataset.close()
+
+    def _evict(self) -> None:
+        while self._entries and (
+            self._nbytes > self.max_bytes or len(self._entries) > self.max_entries
+        ):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+
+def set_dataset_cache(cache: DatasetCache | None) -> None:
+    global _DATASET_CACHE
+    _DATASET_CACHE = cache
+
+
+def active_dataset_cache() -> DatasetCache | None:
+    """Return the cache of the current run; worker processes never share their parent's."""
+    cache = _DATASET_CACHE
+    if cache is None or cache._pid != os.getpid():
+        return None
+    return cache
+
+
+@contextmanager
+def dataset_cache_mode(max_bytes: int | None, max_entries: int = DEFAULT_DATASET_CACHE_ENTRIES):
+    """Share header-only datasets of up to *max_bytes* between the loads of one run.
+
+    ``None`` or ``0`` runs without a cache. Cached datasets are closed on exit.
+    """
+    previous = _DATASET_CACHE
+    cache = DatasetCache(max_bytes, max_entries) if max_bytes else None
+    set_dataset_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_dataset_cache(previous)
+        if cache is not None:
+            cache.clear()
+
+
+def load_cached_header(data_input: DataInput) -> Any:
+    """Open *data_input* header-only through the active cache, if any.
+
+    The caller closes the returned dataset as usual.
+    """
+    cache = active_dataset_cache()
+    if cache is None:
+        return data_input.load_header()
+    return cache.load_header(data_input)
@@ -1,30 +1,113 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from fnmatch import fnmatch
 from pathlib import Path
+from typing import Iterator, Sequence
 
 import xarray as xr
 
 from .base import DataInput
 from .detect import detect_input
+from .runtime import warn_once
+
+# Directories with these suffixes are datasets (stores), not containers to descend into.
+_STORE_SUFFIXES = {".zarr"}
+
+
+def is_store_directory(path: Path) -> bool:
+    return path.suffix.lower() in _STORE_SUFFIXES
+
+
+def _matches(relative: str, name: str, patterns: Sequence[str]) -> bool:
+    return any(fnmatch(relative, pattern) or fnmatch(name, pattern) for pattern in patterns)
+
+
+def _scan(directory: Path) -> list[tuple[str, bool]]:
+    """Return sorted ``(name, is_directory)`` entries; symlinked directories count as leaves."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted((entry.name, entry.is_dir(follow_symlinks=False)) for entry in entries)
+    except OSError as exc:
+        warn_once(f"Failed to list directory '{directory}': {exc}. Skipping it.")
+        return []
+
+
+def walk_directory(
+    root: Path,
+    *,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    max_depth: int | None = None,
+    workers: int | None = None,
+) -> Iterator[Path]:
+    """Yield files and stores below *root* in sorted path order as they are found.
+
+    Directory listings are read by a thread pool: the subdirectories of each
+    visited directory are scanned ahead while earlier entries are yielded.
+    Stores such as ``.zarr`` directories are yielded as leaves and never
+    descended into. *include* and *exclude* are glob patterns matched against
+    the path relative to *root* or the entry name; excluded directories are
+    pruned. *max_depth* limits how many directory levels are read, with ``1``
+    meaning only the entries of *root* itself.
+    """
+    if max_depth is not None and max_depth < 1:
+        raise ValueError(f"max_depth must be at least 1, got {max_depth}")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def visit(directory: Path, listing: Future, depth: int) -> Iterator[Path]:
+            entries = []
+            for name, is_directory in listing.result():
+                path = directory / name
+                relative = path.relative_to(root).as_posix()
+                if _matches(relative, name, exclude):
+                    continue
+                descend = is_directory and not is_store_directory(path)
+                if descend and max_depth is not None and depth >= max_depth:
+                    continue
+                # Submit subdirectory scans now so they run while siblings are yielded.
+                scan = pool.submit(_scan, path) if descend else None
+                entries.append((path, relative, name, scan))
+            for path, relative, name, scan in entries:
+                if scan is not None:
+                    yield from visit(path, scan, depth + 1)
+                elif not include or _matches(relative, name, include):
+                    yield path
+
+        yield from visit(root, pool.submit(_scan, root), 1)
 
 
 @dataclass
 class DirectoryInput(DataInput):
     source_path: Path
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    max_depth: int | None = None
+    workers: int | None = None
 
     def __post_init__(self) -> None:
         self.source_path = Path(self.source_path)
+        self.include = tuple(self.include)
+        self.exclude = tuple(self.exclude)
         if not self.name:
             self.name = self.source_path.name
 
     def load(self) -> xr.Dataset:
         raise NotImplementedError("DirectoryInput does not load a single dataset; call expand().")
 
-    def expand(self) -> list[DataInput]:
-        inputs: list[DataInput] = []
-        for path in sorted(self.source_path.rglob("*")):
+    def iter_expand(self) -> Iterator[DataInput]:
+        for path in walk_directory(
+            self.source_path,
+            include=self.include,
+            exclude=self.exclude,
+            max_depth=self.max_depth,
+            workers=self.workers,
+        ):
             data_input = detect_input(path)
             if data_input is not None:
-                inputs.append(data_input)
-        return inputs
+                yield data_input
+
+    def expand(self) -> list[DataInput]:
+        return list(self.iter_expand())
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .runtime import warn_once
+
+if TYPE_CHECKING:
+    import xarray as xr
+
+COMPRESSORS = ("none", "zlib", "blosc", "zstd")
+
+# Levels used when a policy names a compressor but no level.
+DEFAULT_LEVELS = {"zlib": 1, "blosc": 5, "zstd": 3}
+_MAX_LEVELS = {"zlib": 9, "blosc": 9, "zstd": 22}
+
+# Compression flags netCDF4 reads into the encoding besides ``zlib``.
+_NETCDF_FILTERS = ("szip", "zstd", "bzip2", "blosc")
+
+
+@dataclass(frozen=True)
+class EncodingPolicy:
+    """Compression and chunk layout for the data variables of rewritten outputs.
+
+    Unset fields keep the layout the dataset came in with. *compressor* is one
+    of :data:`COMPRESSORS`; NetCDF outputs support ``zlib`` only. *chunk_bytes*
+    is the target size of one chunk; chunks span whole trailing dimensions and
+    are split along the leading ones.
+    """
+
+    compressor: str | None = None
+    level: int | None = None
+    shuffle: bool | None = None
+    chunk_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.compressor is not None and self.compressor not in COMPRESSORS:
+            raise ValueError(
+                f"Unknown compressor {self.compressor!r}; expected one of {', '.join(COMPRESSORS)}"
+            )
+        if self.level is not None:
+            # Without a compressor, the level may still be merged onto one (see merged()),
+            # so it is only held to the widest range here.
+            limit = _MAX_LEVELS.get(self.compressor, max(_MAX_LEVELS.values()))
+            if isinstance(self.level, bool) or not 0 <= self.level <= limit:
+                raise ValueError(f"Compression level must be between 0 and {limit}")
+        if self.chunk_bytes is not None and self.chunk_bytes < 1:
+            raise ValueError("Chunk size must be positive")
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any] | None) -> EncodingPolicy:
+        """Build a policy from a recipe ``encoding`` mapping; sizes may be ``"16M"``."""
+        from woodpecker.scheduling import parse_byte_size
+
+        payload = {str(key).replace("-", "_"): value for key, value in (values or {}).items()}
+        known = {item.name for item in fields(cls)}
+        unknown = sorted(set(payload) - known)
+        if unknown:
+            raise ValueError(f"Unknown encoding settings: {', '.join(unknown)}")
+        if payload.get("chunk_bytes") is not None:
+            payload["chunk_bytes"] = parse_byte_size(payload["chunk_bytes"])
+        return cls(**payload)
+
+    @property
+    def is_empty(self) -> bool:
+        return all(getattr(self, item.name) is None for item in fields(self))
+
+    def merged(self, overrides: EncodingPolicy | None) -> EncodingPolicy:
+        """Return this policy with the fields set in *overrides* replaced.
+
+        The merged policy is validated again, so a level is checked against the
+        compressor it ends up with.
+        """
+        if overrides is None:
+            return self
+        changes = {
+            item.name: getattr(overrides, item.name)
+            for item in fields(overrides)
+            if getattr(overrides, item.name) is not None
+        }
+        return replace(self, **changes)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if getattr(self, item.name) is not None
+        }
+
+
+def target_chunks(shape: tuple[int, ...], itemsize: int, chunk_bytes: int) -> tuple[int, ...]:
+    """Return a chunk shape of at most *chunk_bytes*, keeping trailing dimensions whole.
+
+    The leading dimension is split first; a dimension is cut to one element
+    only when the trailing ones alone exceed the target.
+    """
+    chunks = list(shape)
+    for axis in range(len(shape)):
+        trailing = itemsize * math.prod(chunks[axis + 1 :])
+        if trailing * chunks[axis] <= chunk_bytes:
+            break
+        chunks[axis] = max(1, min(shape[axis], chunk_bytes // trailing))
+        if chunks[axis] > 1:
+            break
+    return tuple(max(1, size) for size in chunks)
+
+
+def dask_chunks_fit(dask_chunks: Any, store_chunks: Any) -> bool:
+    """Return True when every dask chunk covers whole store chunks, as Zarr writes require."""
+    if dask_chunks is None or store_chunks is None or len(dask_chunks) != len(store_chunks):
+        return False
+    return all(
+        size % target == 0
+        for sizes, target in zip(dask_chunks, store_chunks)
+        for size in sizes[:-1]
+    )
+
+
+def _encoded_names(dataset: xr.Dataset) -> list[str]:
+    import numpy as np
+
+    return [
+        str(name)
+        for name, variable in dataset.data_vars.items()
+        if variable.ndim and (np.issubdtype(variable.dtype, np.number) or variable.dtype == bool)
+    ]
+
+
+def _apply_netcdf(dataset: xr.Dataset, names: list[str], policy: EncodingPolicy) -> None:
+    from woodpecker.fixes.common.helpers import normalize_compression_settings
+
+    compressor = policy.compressor
+    level = DEFAULT_LEVELS["zlib"] if policy.level is None else policy.level
+    if compressor in ("blosc", "zstd"):
+        warn_once(f"NetCDF outputs do not support {compressor!r} compression; using zlib.")
+        compressor = "zlib"
+        if level > _MAX_LEVELS["zlib"]:
+            warn_once(
+                f"Compression level {level} exceeds the zlib maximum; "
+                f"using {_MAX_LEVELS['zlib']} for NetCDF outputs."
+            )
+            level = _MAX_LEVELS["zlib"]
+    if compressor is not None:
+        normalize_compression_settings(
+            dataset,
+            names,
+            level=0 if compressor == "none" else level,
+            zlib=compressor == "zlib",
+            shuffle=compressor == "zlib" and policy.shuffle is not False,
+        )
+    elif policy.shuffle is not None:
+        for name in names:
+            dataset[name].encoding["shuffle"] = policy.shuffle
+    for name in names:
+        encoding = dataset[name].encoding
+        if compressor is not None:
+            for key in _NETCDF_FILTERS:
+                if encoding.get(key):
+                    encoding[key] = False
+        if policy.chunk_bytes is not None:
+            variable = dataset[name]
+            encoding["chunksizes"] = target_chunks(
+                variable.shape, variable.dtype.itemsize, policy.chunk_bytes
+            )
+        if compressor == "zlib" or policy.chunk_bytes is not None:
+            # Compressed variables must be chunked.
+            encoding["contiguous"] = False
+
+
+def _zarr_compressor(policy: EncodingPolicy, itemsize: int) -> tuple[Any, list[Any] | None]:
+    import numcodecs
+
+    level = policy.level if policy.level is not None else DEFAULT_LEVELS.get(policy.compressor, 0)
+    if policy.compressor == "blosc":
+        shuffle = numcodecs.Blosc.NOSHUFFLE if policy.shuffle is False else numcodecs.Blosc.SHUFFLE
+        return numcodecs.Blosc(cname="zstd", clevel=level, shuffle=shuffle), None
+    filters = [numcodecs.Shuffle(elementsize=itemsize)] if policy.shuffle else None
+    if policy.compressor == "zlib":
+        return numcodecs.Zlib(level=level), filters
+    if policy.compressor == "zstd":
+        return numcodecs.Zstd(level=level), filters
+    return None, filters
+
+
+def _apply_zarr(dataset: xr.Dataset, names: list[str], policy: EncodingPolicy) -> None:
+    for name in names:
+        variable = dataset[name]
+        encoding = variable.encoding
+        if policy.compressor is not None:
+            encoding["compressor"], filters = _zarr_compressor(policy, variable.dtype.itemsize)
+            if policy.shuffle is not None:
+                encoding["filters"] = filters
+        if policy.chunk_bytes is None:
+            continue
+        chunks = target_chunks(variable.shape, variable.dtype.itemsize, policy.chunk_bytes)
+        encoding["chunks"] = chunks
+        encoding.pop("preferred_chunks", None)
+        if variable.chunks is not None and not dask_chunks_fit(variable.chunks, chunks):
+            # Every dask chunk must cover whole store chunks.
+            dataset[name] = variable.chunk(dict(zip(variable.dims, chunks)))
+            dataset[name].encoding = encoding
+
+
+def apply_encoding_policy(
+    dataset: xr.Dataset, policy: EncodingPolicy | None, format_name: str
+) -> None:
+    """Set the encoding of the numeric data variables of *dataset* from *policy*.
+
+    *format_name* is ``"netcdf"`` or ``"zarr"``. Encodings are changed in
+    place, so saves that patch outputs in place rewrite the variables whose
+    layout changed.
+    """
+    if policy is None or policy.is_empty:
+        return
+    names = _encoded_names(dataset)
+    if format_name == "zarr":
+        _apply_zarr(dataset, names, policy)
+    else:
+        _apply_netcdf(dataset, names, policy)
+
+
+def encoding_policy(value: EncodingPolicy | Mapping[str, Any] | None) -> EncodingPolicy | None:
+    """Return *value* as an :class:`EncodingPolicy`; mappings use the recipe keys."""
+    if value is None or isinstance(value, EncodingPolicy):
+        return value
+    if not isinstance(value, Mapping):
+        raise ValueError("Encoding must be an EncodingPolicy or a mapping")
+    return EncodingPolicy.from_mapping(value)
+
+
+def merge_encoding(
+    base: EncodingPolicy | Mapping[str, Any] | None,
+    overrides: EncodingPolicy | Mapping[str, Any] | None,
+) -> EncodingPolicy | None:
+    """Return *base* (e.g. from a recipe) with the fields set in *overrides* replaced."""
+    base_policy = encoding_policy(base)
+    override_policy = encoding_policy(overrides)
+    if base_policy is None:
+        return override_policy
+    return base_policy.merged(override_policy)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import xarray as xr
+
+from .base import DataInput
+from .detect import detect_input
+
+MANIFEST_PREFIX = "@"
+_JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+_PARQUET_SUFFIXES = {".parquet", ".pq"}
+_BATCH_ROWS = 10_000
+
+# Entry fields the runner understands; other fields are kept as plain metadata.
+#   size        on-disk bytes, used for size-aware scheduling instead of stat()
+#   checksum    content digest, used by the result cache instead of hashing the file
+#   dataset_id / project_id / dataset_type
+#               dataset identity, used instead of reading it from the file
+#   recipe_id   recipe to use when recipes are looked up per input
+MANIFEST_FIELDS = ("size", "checksum", "dataset_id", "project_id", "dataset_type", "recipe_id")
+
+
+def is_manifest_reference(value: Any) -> bool:
+    """Return True for ``"@path"`` strings naming a manifest file."""
+    return isinstance(value, str) and value.startswith(MANIFEST_PREFIX) and len(value) > 1
+
+
+def manifest_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in _JSONL_SUFFIXES:
+        return "jsonl"
+    if suffix in _PARQUET_SUFFIXES:
+        return "parquet"
+    return "text"
+
+
+def _iter_text(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    with path.open(encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            entry = line.strip()
+            if entry and not entry.startswith("#"):
+                yield number, {"path": entry}
+
+
+def _iter_jsonl(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    with path.open(encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{number}: invalid JSON in manifest: {exc}") from exc
+            yield number, {"path": record} if isinstance(record, str) else record
+
+
+def _import_parquet() -> Any:
+    try:
+        import pyarrow.parquet as parquet
+    except ImportError as exc:  # pragma: no cover - exercised in environments without pyarrow
+        raise RuntimeError(
+            "Parquet manifests require optional dependency 'pyarrow'. Install with: pip install pyarrow (or pip install 'woodpecker[full]')"
+        ) from exc
+    return parquet
+
+
+def _iter_parquet(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    parquet = _import_parquet()
+    number = 0
+    for batch in parquet.ParquetFile(path).iter_batches(batch_size=_BATCH_ROWS):
+        for record in batch.to_pylist():
+            number += 1
+            yield number, record
+
+
+_READERS = {"text": _iter_text, "jsonl": _iter_jsonl, "parquet": _iter_parquet}
+
+
+def _entry_metadata(record: dict[str, Any]) -> dict[str, Any]:
+    metadata = {
+        key: value for key, value in record.items() if key != "path" and value not in (None, "")
+    }
+    if "size" in metadata:
+        try:
+            metadata["size"] = int(metadata["size"])
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid 'size' in manifest: {metadata['size']!r}") from None
+    return metadata
+
+
+@dataclass
+class ManifestInput(DataInput):
+    """A file listing the inputs of a run, read entry by entry.
+
+    Text manifests hold one path per line (blank lines and ``#`` comments are
+    skipped). JSON-lines and Parquet manifests hold one record per input with
+    a ``path`` field plus optional metadata (see ``MANIFEST_FIELDS``), which is
+    attached to the input as :attr:`DataInput.metadata`. Relative paths are
+    resolved against the manifest's directory.
+    """
+
+    source_path: Path
+    format: str | None = None
+
+    def __post_init__(self) -> None:
+        self.source_path = Path(self.source_path)
+        if self.format is None:
+            self.format = manifest_format(self.source_path)
+        if self.format not in _READERS:
+            raise ValueError(f"Unsupported manifest format: {self.format}")
+        if not self.name:
+            self.name = self.source_path.name
+
+    def load(self) -> xr.Dataset:
+        raise NotImplementedError("ManifestInput does not load a single dataset; call expand().")
+
+    def iter_expand(self) -> Iterator[DataInput]:
+        base = self.source_path.parent
+        for number, record in _READERS[self.format](self.source_path):
+            location = record.get("path") if isinstance(record, dict) else None
+            if not isinstance(location, str) or not location:
+                raise ValueError(f"{self.source_path}:{number}: manifest entry has no 'path'")
+            path = base / location
+            data_input = detect_input(path)
+            if data_input is None:
+                raise ValueError(f"{self.source_path}:{number}: Unsupported path input: {path}")
+            try:
+                data_input.metadata.update(_entry_metadata(record))
+            except ValueError as exc:
+                raise ValueError(f"{self.source_path}:{number}: {exc}") from exc
+            yield data_input
+
+    def expand(self) -> list[DataInput]:
+        return list(self.iter_expand())
@@ -1,61 +1,183 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Iterable, Iterator, List, Sequence
 
-from .base import DataInput
+from .base import DataInput, OutputAdapter
 from .detect import detect_input, is_pathlike, is_xarray_object, resolve_output_adapter
-from .directory import DirectoryInput
+from .directory import DirectoryInput, is_store_directory
+from .manifest import ManifestInput, is_manifest_reference
 from .runtime import warn_once
 
 # Canonical format-name aliases resolved before registry lookup.
 _FORMAT_ALIASES: dict[str, str] = {"nc": "netcdf"}
 
 
-def get_output_adapter(output_format: str | None = None):
+class SourceFormatOutputAdapter(OutputAdapter):
+    """``auto`` output below an output directory: every input keeps its own format."""
+
+    format_name = "auto"
+
+    def _adapter(self, data_input: DataInput) -> OutputAdapter:
+        source = data_input.source_path
+        if source is None:
+            raise ValueError("Redirected output requires a path-based input")
+        format_name = "zarr" if source.suffix.lower() == ".zarr" else "netcdf"
+        adapter = resolve_output_adapter(format_name)
+        if adapter is None:
+            raise ValueError(f"Unsupported output format: {format_name}")
+        return adapter.redirect(self.output_dir or Path.cwd(), self.source_root)
+
+    def target_path(self, data_input: DataInput) -> Path:
+        return self._adapter(data_input).target_path(data_input)
+
+    def save(self, dataset: Any, data_input: DataInput, dry_run: bool = True) -> bool:
+        return self._adapter(data_input).save(dataset, data_input, dry_run=dry_run)
+
+
+def get_output_adapter(
+    output_format: str | None = None,
+    output_dir: str | Path | None = None,
+    source_root: str | Path | None = None,
+):
+    """Return the adapter for *output_format*, or None to save back to the source.
+
+    With *output_dir*, targets are placed below it in a tree mirroring the
+    sources relative to *source_root* (default: the working directory), and
+    ``auto`` keeps each input's format.
+    """
     if output_format in (None, "", "auto"):
-        return None
+        if output_dir is None:
+            return None
+        return SourceFormatOutputAdapter().redirect(output_dir, source_root)
     canonical = _FORMAT_ALIASES.get(output_format.lower(), output_format.lower())
     adapter = resolve_output_adapter(canonical)
     if adapter is None:
         raise ValueError(f"Unsupported output format: {output_format}")
     if not adapter.is_available:
         warn_once(f"{output_format!r} output format requested but backend is not available.")
+    if output_dir is not None:
+        adapter.redirect(output_dir, source_root)
     return adapter
 
 
 def _is_directory_container(path: Path) -> bool:
     # Keep .zarr directories routed to backend detection as stores.
-    return path.is_dir() and path.suffix.lower() != ".zarr"
+    return path.is_dir() and not is_store_directory(path)
 
 
-def _normalize_one(value: Any) -> list[DataInput]:
+def _iter_one(
+    value: Any,
+    *,
+    include: Sequence[str],
+    exclude: Sequence[str],
+    max_depth: int | None,
+) -> Iterator[DataInput]:
     if isinstance(value, DataInput):
-        return value.expand()
+        yield from value.iter_expand()
+        return
+
+    if is_manifest_reference(value):
+        yield from ManifestInput(source_path=Path(value[1:])).iter_expand()
+        return
 
     if is_pathlike(value):
         path = Path(value)
         if _is_directory_container(path):
-            return DirectoryInput(source_path=path, name=path.name).expand()
+            yield from DirectoryInput(
+                source_path=path,
+                name=path.name,
+                include=tuple(include),
+                exclude=tuple(exclude),
+                max_depth=max_depth,
+            ).iter_expand()
+            return
         data_input = detect_input(path)
         if data_input is None:
             raise ValueError(f"Unsupported path input: {path}")
-        return [data_input]
+        yield data_input
+        return
 
     data_input = detect_input(value)
     if data_input is None:
         raise TypeError(f"Unsupported input type: {type(value)!r}")
-    return [data_input]
+    yield data_input
+
 
+def iter_inputs(
+    inputs: Any,
+    *,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    max_depth: int | None = None,
+) -> Iterator[DataInput]:
+    """Yield normalized inputs lazily; directories are walked while inputs are consumed.
 
-def normalize_inputs(inputs: Any) -> List[DataInput]:
+    ``"@path"`` strings name a manifest file (see
+    :class:`woodpecker.io.manifest.ManifestInput`) whose entries are read as
+    they are consumed.
+
+    *include*, *exclude* and *max_depth* apply to directories given as paths
+    (see :func:`woodpecker.io.directory.walk_directory`).
+    """
+    options = {"include": include, "exclude": exclude, "max_depth": max_depth}
     if is_pathlike(inputs) or is_xarray_object(inputs) or isinstance(inputs, DataInput):
-        return _normalize_one(inputs)
+        yield from _iter_one(inputs, **options)
+        return
 
     if isinstance(inputs, Iterable):
-        normalized: List[DataInput] = []
         for item in inputs:
-            normalized.extend(_normalize_one(item))
-        return normalized
+            yield from _iter_one(item, **options)
+        return
+
+    yield from _iter_one(inputs, **options)
+
+
+def normalize_inputs(
+    inputs: Any,
+    *,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    max_depth: int | None = None,
+) -> List[DataInput]:
+    return list(iter_inputs(inputs, include=include, exclude=exclude, max_depth=max_depth))
+
+
+class InputScan:
+    """Lazy, re-iterable view of the inputs selected by *targets*.
+
+    Every iteration walks the targets (directories, manifests) again instead
+    of holding all inputs in memory; ``count`` is the number of inputs the
+    latest iteration has yielded so far. With *shard_grouping*, shards are
+    combined by :func:`woodpecker.io.backends.multifile.group_shards`, which
+    collects the inputs of each iteration.
+    """
+
+    def __init__(
+        self,
+        targets: Any,
+        *,
+        include: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        max_depth: int | None = None,
+        shard_grouping: str | None = None,
+    ) -> None:
+        self.targets = targets
+        self.include = include
+        self.exclude = exclude
+        self.max_depth = max_depth
+        self.shard_grouping = shard_grouping
+        self.count = 0
+
+    def __iter__(self) -> Iterator[DataInput]:
+        self.count = 0
+        items: Iterable[DataInput] = iter_inputs(
+            self.targets, include=self.include, exclude=self.exclude, max_depth=self.max_depth
+        )
+        if self.shard_grouping:
+            from .backends.multifile import group_shards
 
-    return _normalize_one(inputs)
+            items = group_shards(items, by=self.shard_grouping)
+        for data_input in items:
+            self.count += 1
+            yield data_input
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import weakref
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+import xarray as xr
+from xarray import conventions
+
+# Encoding keys that never reach the file or are re-derived on write.
+TRANSIENT_ENCODING = {"source", "original_shape", "preferred_chunks", "coordinates"}
+# Encoding keys that change how values are stored; the values are re-encoded.
+CODING_ENCODING = {
+    "_FillValue",
+    "missing_value",
+    "scale_factor",
+    "add_offset",
+    "units",
+    "calendar",
+    "dtype",
+    "_Unsigned",
+}
+
+AttrChanges = tuple[dict[str, Any], tuple[str, ...]]
+
+# Datasets as read from disk, keyed by id() of the loaded dataset. Entries hold
+# references to the loaded arrays only and are dropped with the dataset.
+_SOURCES: dict[int, tuple[Path, xr.Dataset]] = {}
+
+
+def remember_source(dataset: xr.Dataset, path: Path, baseline: xr.Dataset | None = None) -> None:
+    """Record *dataset* as the on-disk state of *path* so a later save can patch it.
+
+    Pass *baseline* when the file holds another state than *dataset*, e.g. a
+    shard of a dataset that fixes have already changed.
+    """
+    key = id(dataset)
+    _SOURCES[key] = (Path(path), (dataset if baseline is None else baseline).copy(deep=False))
+    weakref.finalize(dataset, _SOURCES.pop, key, None)
+
+
+def source_snapshot(dataset: xr.Dataset, target: Path) -> xr.Dataset | None:
+    """Return *dataset* as it was read from *target*, or None if it came from elsewhere."""
+    entry = _SOURCES.get(id(dataset))
+    if entry is None or not target.exists():
+        return None
+    source, snapshot = entry
+    if source.resolve() != target.resolve():
+        return None
+    return snapshot
+
+
+def values_equal(left: Any, right: Any) -> bool:
+    """Compare attr values like xarray's ``equivalent``: NaN equals NaN."""
+    if isinstance(left, np.ndarray) or isinstance(right, np.ndarray):
+        try:
+            return bool(np.array_equal(np.asarray(left), np.asarray(right), equal_nan=True))
+        except TypeError:  # equal_nan is not defined for strings or objects
+            return bool(np.array_equal(np.asarray(left), np.asarray(right)))
+    try:
+        return bool(left == right) or (left != left and right != right)
+    except ValueError:
+        return bool(np.array_equal(np.asarray(left), np.asarray(right)))
+
+
+def attr_changes(before: Mapping[str, Any], after: Mapping[str, Any]) -> AttrChanges:
+    """Return attrs to set and attr names to delete to turn *before* into *after*."""
+    updated = {
+        key: value
+        for key, value in after.items()
+        if key not in before or not values_equal(before[key], value)
+    }
+    removed = tuple(key for key in before if key not in after)
+    return updated, removed
+
+
+def same_values(before: xr.Variable, after: xr.Variable) -> bool:
+    """Return True when *after* holds the values of *before*, without reading lazy data."""
+    if before._data is after._data:
+        return True
+    name = getattr(before._data, "name", None)
+    if name is not None and hasattr(before._data, "dask"):
+        return name == getattr(after._data, "name", None)
+    if before.shape != after.shape or not before._in_memory or not after._in_memory:
+        return False
+    # Compare values only; a renamed dimension keeps the data.
+    return before.to_base_variable().equals(xr.Variable(before.dims, after.data))
+
+
+def encoded_header(variable: xr.Variable, name: str) -> xr.Variable:
+    """Encode the first element of *variable* to get its on-disk dtype and attrs."""
+    head = variable[tuple(slice(0, 1) for _ in variable.dims)]
+    return conventions.encode_cf_variable(head, name=name)
+
+
+def storage_encoding(variable: xr.Variable) -> dict[str, Any]:
+    """Return the layout settings (compression, chunking, ...) of *variable*."""
+    return {
+        key: value
+        for key, value in variable.encoding.items()
+        if key not in TRANSIENT_ENCODING and key not in CODING_ENCODING
+    }
+
+
+def coding_encoding(variable: xr.Variable) -> dict[str, Any]:
+    return {key: value for key, value in variable.encoding.items() if key in CODING_ENCODING}
+
+
+def storage_changed(before: xr.Variable, after: xr.Variable) -> bool:
+    """Return True when *after* asks for a different layout than *before* has.
+
+    Settings absent from the encoding of *after* (e.g. after a rebuild) keep the
+    existing layout.
+    """
+    storage = storage_encoding(before)
+    return any(
+        key not in storage or not values_equal(storage[key], value)
+        for key, value in storage_encoding(after).items()
+    )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import importlib.util
+import threading
 import warnings
 from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Mapping
 
 _WARNED_MESSAGES: set[str] = set()
-_STRICT_IO = False
+# I/O modes are context-local: background writer threads set their own modes
+# while the run sets the same modes for the next inputs.
+_STRICT_IO: ContextVar[bool] = ContextVar("woodpecker_strict_io", default=False)
+_CHUNKS: ContextVar[Any] = ContextVar("woodpecker_chunks", default=None)
+_KEEP_BACKUP: ContextVar[bool] = ContextVar("woodpecker_keep_backup", default=False)
+_ENCODING: ContextVar[Any] = ContextVar("woodpecker_encoding", default=None)
+_IO_LOCK = threading.RLock()
 
 
 def warn_once(message: str) -> None:
@@ -15,41 +24,133 @@ def warn_once(message: str) -> None:
     warnings.warn(message, stacklevel=2)
 
 
+@contextmanager
+def _mode(variable: ContextVar[Any], value: Any):
+    token = variable.set(value)
+    try:
+        yield
+    finally:
+        variable.reset(token)
+
+
 def set_strict_io(strict: bool) -> None:
-    global _STRICT_IO
-    _STRICT_IO = bool(strict)
+    _STRICT_IO.set(bool(strict))
 
 
 def is_strict_io() -> bool:
-    return _STRICT_IO
+    return _STRICT_IO.get()
 
 
-@contextmanager
 def strict_io_mode(strict: bool):
-    previous = is_strict_io()
-    set_strict_io(strict)
-    try:
+    return _mode(_STRICT_IO, bool(strict))
+
+
+def set_keep_backup(keep: bool) -> None:
+    _KEEP_BACKUP.set(bool(keep))
+
+
+def keeps_backup() -> bool:
+    return _KEEP_BACKUP.get()
+
+
+def backup_mode(keep: bool):
+    """Keep the file or store replaced by an output write next to it as ``<name>.bak``."""
+    return _mode(_KEEP_BACKUP, bool(keep))
+
+
+def set_output_encoding(policy: Any) -> None:
+    _ENCODING.set(policy)
+
+
+def output_encoding() -> Any:
+    return _ENCODING.get()
+
+
+def encoding_mode(policy: Any):
+    """Apply the ``EncodingPolicy`` *policy* to outputs written inside the block."""
+    return _mode(_ENCODING, policy)
+
+
+@contextmanager
+def serialized_io():
+    """Hold the process-wide lock for reading or encoding datasets through their backends.
+
+    netCDF-C and HDF5 are not thread-safe, so background writers and the run
+    take turns while opening, reading, encoding, and closing datasets. File
+    syncs, renames and backups run outside the lock.
+    """
+    with _IO_LOCK:
         yield
-    finally:
-        set_strict_io(previous)
+
+
+def normalize_chunks(chunks: Any) -> Any:
+    """Validate a chunk spec: None, ``"auto"``, an int, a dim mapping, or ``"time=12,lat=auto"``."""
+    if chunks is None or chunks == "auto":
+        return chunks
+    if isinstance(chunks, bool):
+        raise ValueError(f"Invalid chunks: {chunks!r}")
+    if isinstance(chunks, int):
+        return chunks
+    if isinstance(chunks, Mapping):
+        return {str(dim): normalize_chunks(size) for dim, size in chunks.items()}
+    text = str(chunks).strip()
+    if "=" not in text:
+        try:
+            return int(text)
+        except ValueError:
+            raise ValueError(f"Invalid chunks: {chunks!r}") from None
+    mapping: dict[str, Any] = {}
+    for item in text.split(","):
+        dim, _, size = item.partition("=")
+        if not dim.strip() or not size.strip():
+            raise ValueError(f"Invalid chunks: {chunks!r}")
+        mapping[dim.strip()] = normalize_chunks(size.strip())
+    return mapping
+
+
+def set_chunks(chunks: Any) -> None:
+    _CHUNKS.set(normalize_chunks(chunks))
+
+
+def get_chunks() -> Any:
+    return _CHUNKS.get()
+
+
+def chunked_io_mode(chunks: Any):
+    """Open file inputs as dask arrays with *chunks* instead of loading them eagerly."""
+    return _mode(_CHUNKS, normalize_chunks(chunks))
+
+
+def open_chunks() -> Any:
+    """Return the active chunk spec for backends, or None when dask is unavailable."""
+    chunks = get_chunks()
+    if chunks is None:
+        return None
+    if not module_available("dask"):
+        warn_once("Chunked loading requested but dask is not installed; loading eagerly.")
+        return None
+    return chunks
 
 
 def warn_or_raise(message: str, exc_type: type[Exception] = RuntimeError) -> None:
-    if _STRICT_IO:
+    if is_strict_io():
         raise exc_type(message)
     warn_once(message)
 
 
+# Either NetCDF engine is enough; Zarr needs both modules.
+NETCDF_BACKEND_MODULES = ("netCDF4", "h5netcdf", "scipy")
+ZARR_BACKEND_MODULES = ("zarr", "numcodecs")
+
+
 def module_available(module_name: str) -> bool:
     return importlib.util.find_spec(module_name) is not None
 
 
 def get_io_availability() -> dict[str, bool]:
-    from .backends.nc import netcdf_backend_available
-    from .backends.zarr import zarr_backend_available
-
-    netcdf_available = netcdf_backend_available()
-    zarr_available = zarr_backend_available()
+    # Checked by module name so the report does not import xarray or the backends.
+    netcdf_available = any(module_available(name) for name in NETCDF_BACKEND_MODULES)
+    zarr_available = all(module_available(name) for name in ZARR_BACKEND_MODULES)
     return {
         "xarray_input": True,
         "netcdf_input": netcdf_available,
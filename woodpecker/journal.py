@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from woodpecker.runner import FixRunStats
+
+JOURNAL_VERSION = 1
+
+
+class RunJournal:
+    """Append-only JSON-lines checkpoint of per-input fix results.
+
+    The first line describes the run (selected fixes and options). Each further
+    line records one processed input with its status, applied fix ids, output
+    target and stats. With ``resume=True`` an existing journal is reopened and
+    inputs recorded as completed are skipped by ``run_fix``.
+    """
+
+    def __init__(self, path: str | Path, *, resume: bool = False):
+        self.path = Path(path)
+        self.resume = resume
+
+    def _read(self) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        header: dict[str, Any] | None = None
+        entries: list[dict[str, Any]] = []
+        with self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A run killed mid-write can leave a truncated last line.
+                    continue
+                if record.get("record") == "run":
+                    header = record
+                elif record.get("record") == "input":
+                    entries.append(record)
+        return header, entries
+
+    def _append(self, record: Mapping[str, Any], *, mode: str = "a") -> None:
+        with self.path.open(mode, encoding="utf-8") as handle:
+            handle.write(json.dumps(record, sort_keys=True, default=str) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def open(self, run: Mapping[str, Any]) -> dict[str, FixRunStats]:
+        """Start or resume the journal for *run* and return stats of completed inputs."""
+        # Round-trip through JSON so the comparison sees what the header stores.
+        run = json.loads(json.dumps(run, sort_keys=True, default=str))
+        if self.resume and self.path.exists():
+            header, entries = self._read()
+            if header is not None and header.get("run") != run:
+                raise ValueError(
+                    f"Journal '{self.path}' was written for a different run; "
+                    "use the same fixes and options or start a new journal."
+                )
+            if header is None:
+                self._append({"record": "run", "version": JOURNAL_VERSION, "run": run})
+            return {
+                entry["input"]: entry["stats"]
+                for entry in entries
+                if entry.get("status") == "completed"
+            }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._append({"record": "run", "version": JOURNAL_VERSION, "run": run}, mode="w")
+        return {}
+
+    def record(self, reference: str, stats: FixRunStats, *, output: str | None) -> None:
+        """Append the result for one input."""
+        self._append(
+            {
+                "record": "input",
+                "input": reference,
+                "status": "failed" if stats["persist_failed"] else "completed",
+                "applied_fix_ids": [
+                    item["fix_id"] for item in stats["preview"] if item.get("changed")
+                ],
+                "output": output,
+                "stats": stats,
+            }
+        )
+
+
+def run_journal_for(journal: str | Path | None, *, resume: bool = False) -> RunJournal | None:
+    """Return a journal for an API ``journal=`` argument, or None when unset."""
+    if journal is None:
+        if resume:
+            raise ValueError("resume=True requires a journal path")
+        return None
+    return RunJournal(journal, resume=resume)
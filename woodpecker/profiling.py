@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TypedDict
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+PHASES = ("load", "identity", "matches", "check", "apply", "save", "close")
+
+
+class TimingEvent(TypedDict):
+    """One timed phase for one input (and fix, for per-fix phases)."""
+
+    input: str
+    phase: str
+    fix_id: str | None
+    wall: float
+    cpu: float
+    peak_rss_delta: int
+
+
+def _peak_rss() -> int:
+    """Return this process' peak resident set size in bytes, or 0 if unknown."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+class PhaseTimer:
+    """Record wall time, CPU time and peak RSS growth of phases for one input.
+
+    CPU time is process-wide by default, so it includes threads the phase
+    starts (e.g. dask workers). With *per_thread*, it is the CPU time of the
+    thread running the phase, which keeps concurrent writer threads from
+    counting each other's work. Peak RSS is always process-wide.
+    """
+
+    def __init__(self, reference: str, *, per_thread: bool = False):
+        self.reference = reference
+        self.events: list[TimingEvent] = []
+        self._cpu_time = time.thread_time if per_thread else time.process_time
+
+    @contextmanager
+    def phase(self, phase: str, fix_id: str | None = None) -> Iterator[None]:
+        wall = time.perf_counter()
+        cpu = self._cpu_time()
+        rss = _peak_rss()
+        try:
+            yield
+        finally:
+            self.events.append(
+                {
+                    "input": self.reference,
+                    "phase": phase,
+                    "fix_id": fix_id,
+                    "wall": time.perf_counter() - wall,
+                    "cpu": self._cpu_time() - cpu,
+                    "peak_rss_delta": _peak_rss() - rss,
+                }
+            )
+
+
+def timed(
+    timer: PhaseTimer | None, phase: str, fix_id: str | None = None
+) -> AbstractContextManager[None]:
+    """Time *phase* with *timer*, or do nothing when profiling is off."""
+    return nullcontext() if timer is None else timer.phase(phase, fix_id=fix_id)
+
+
+def _totals() -> dict[str, Any]:
+    return {"count": 0, "wall": 0.0, "cpu": 0.0, "peak_rss_delta": 0}
+
+
+def _add(totals: dict[str, Any], event: TimingEvent) -> None:
+    totals["count"] += 1
+    totals["wall"] += event["wall"]
+    totals["cpu"] += event["cpu"]
+    totals["peak_rss_delta"] += event["peak_rss_delta"]
+
+
+def summarize_timings(events: Iterable[TimingEvent]) -> dict[str, Any]:
+    """Aggregate timing events into per-phase, per-fix and per-input totals.
+
+    The raw events are kept under ``events`` so summaries can be merged and
+    exported.
+    """
+    events = list(events)
+    phases: dict[str, dict[str, Any]] = {}
+    fixes: dict[str, dict[str, Any]] = {}
+    inputs: dict[str, dict[str, Any]] = {}
+    for event in events:
+        _add(phases.setdefault(event["phase"], _totals()), event)
+        if event["fix_id"]:
+            _add(fixes.setdefault(event["fix_id"], _totals()), event)
+        _add(inputs.setdefault(event["input"], _totals()), event)
+    ordered = {phase: phases[phase] for phase in PHASES if phase in phases}
+    ordered.update({phase: totals for phase, totals in phases.items() if phase not in ordered})
+    return {"phases": ordered, "fixes": fixes, "inputs": inputs, "events": events}
+
+
+class RunProfile:
+    """Collect timing events from a run as its per-input results are consumed."""
+
+    def __init__(self) -> None:
+        self.events: list[TimingEvent] = []
+
+    def record(self, events: Iterable[TimingEvent]) -> None:
+        self.events.extend(events)
+
+    def summary(self) -> dict[str, Any]:
+        return summarize_timings(self.events)
+
+
+def write_timing_events(path: str | Path, events: Iterable[TimingEvent]) -> Path:
+    """Write raw timing events to *path* as a JSON array."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(list(events), indent=2), encoding="utf-8")
+    return target
@@ -44,6 +44,7 @@ def build_prov_document(
     output_format: str,
     recipe: str | None = None,
     run_id: str | None = None,
+    output_dir: Path | None = None,
 ) -> dict[str, Any]:
     run_id = run_id or f"woodpecker-run-{uuid.uuid4()}"
     generated_at = utc_now_iso()
@@ -83,7 +84,7 @@ def build_prov_document(
             providers.append({"name": package, "version": plugin_versions[package]})
             seen_providers.add(package)
 
-    output_adapter = get_output_adapter(output_format)
+    output_adapter = get_output_adapter(output_format, output_dir=output_dir)
 
     doc = ProvDocument()
     doc.set_default_namespace("urn:woodpecker:")
@@ -152,6 +153,7 @@ def write_fix_provenance(
     store_type: str,
     recipe_location: Path | None,
     provenance_path: Path,
+    output_dir: Path | None = None,
 ) -> None:
     """Write a provenance document for a check/fix run context."""
 
@@ -165,5 +167,6 @@ def write_fix_provenance(
         mode="dry-run" if dry_run else "write",
         output_format=context.resolved_output_format,
         recipe=provenance_source,
+        output_dir=output_dir,
     )
     write_prov_document(document, provenance_path)
@@ -2,10 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Mapping, Sequence
 
 import woodpecker.fixes  # noqa: F401  # registers built-in fixes
-from woodpecker.commands import execute_check, execute_check_recipe, execute_fix, execute_fix_recipe
+from woodpecker.cache import result_cache_for
+from woodpecker.commands import (
+    check_run_stats,
+    execute_check,
+    execute_check_recipe,
+    execute_fix,
+    execute_fix_recipe,
+)
+from woodpecker.io.encoding import EncodingPolicy, merge_encoding
+from woodpecker.journal import run_journal_for
+from woodpecker.profiling import RunProfile
 from woodpecker.recipes.models import Recipe
 from woodpecker.results import CheckResult, FixResult
 from woodpecker.stores.helpers import create_recipe_store
@@ -88,46 +98,59 @@ def check(
     categories: Sequence[str] = (),
     fixes: str | Sequence[str] | None = None,
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool = False,
 ) -> CheckResult:
     """Check inputs using fixes selected from a recipe."""
+    cache = result_cache_for(cache_dir)
+    run_profile = RunProfile() if profile else None
     if isinstance(recipe, Recipe):
         resolved_identifiers, ordered_identifiers, fix_options = _resolve_recipe_selection(
             recipe,
             fixes,
         )
-        return CheckResult(
-            findings=tuple(
-                execute_check(
-                    inputs,
-                    dataset=dataset,
-                    categories=categories,
-                    identifiers=resolved_identifiers,
-                    fix_options=fix_options,
-                    ordered_identifiers=ordered_identifiers,
-                    strict_io=strict_io,
-                )
-            )
+        findings = execute_check(
+            inputs,
+            dataset=dataset,
+            categories=categories,
+            identifiers=resolved_identifiers,
+            fix_options=fix_options,
+            ordered_identifiers=ordered_identifiers,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            cache=cache,
+            profile=run_profile,
         )
-
-    recipe_location, resolved_recipe_id, resolved_store_type = _resolve_recipe_source(
-        recipe,
-        recipe_id=recipe_id,
-        store_type=store_type,
-    )
-    return CheckResult(
-        findings=tuple(
-            execute_check_recipe(
-                recipe_location,
-                inputs=inputs,
-                dataset=dataset,
-                categories=categories,
-                identifiers=_normalize_fixes(fixes),
-                recipe_id=resolved_recipe_id,
-                store_type=resolved_store_type,
-                strict_io=strict_io,
-            )
+    else:
+        recipe_location, resolved_recipe_id, resolved_store_type = _resolve_recipe_source(
+            recipe,
+            recipe_id=recipe_id,
+            store_type=store_type,
         )
-    )
+        findings = execute_check_recipe(
+            recipe_location,
+            inputs=inputs,
+            dataset=dataset,
+            categories=categories,
+            identifiers=_normalize_fixes(fixes),
+            recipe_id=resolved_recipe_id,
+            store_type=resolved_store_type,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            cache=cache,
+            profile=run_profile,
+        )
+    return CheckResult(findings=tuple(findings), stats=check_run_stats(cache, run_profile))
 
 
 def fix(
@@ -142,8 +165,23 @@ def fix(
     dry_run: bool = True,
     output_format: str = "auto",
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    cache_dir: str | Path | None = None,
+    profile: bool = False,
+    journal: str | Path | None = None,
+    resume: bool = False,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
 ) -> FixResult:
     """Apply fixes selected from a recipe."""
+    cache = result_cache_for(cache_dir)
+    run_profile = RunProfile() if profile else None
+    run_journal = run_journal_for(journal, resume=resume)
     if isinstance(recipe, Recipe):
         resolved_identifiers, ordered_identifiers, fix_options = _resolve_recipe_selection(
             recipe,
@@ -160,6 +198,17 @@ def fix(
                 fix_options=fix_options,
                 ordered_identifiers=ordered_identifiers,
                 strict_io=strict_io,
+                chunks=chunks,
+                jobs=jobs,
+                schedule=schedule,
+                max_inflight_memory=max_inflight_memory,
+                cache=cache,
+                profile=run_profile,
+                journal=run_journal,
+                keep_backup=keep_backup,
+                output_dir=output_dir,
+                writers=writers,
+                encoding=merge_encoding(recipe.encoding_policy(), encoding),
             )
         )
 
@@ -180,5 +229,16 @@ def fix(
             recipe_id=resolved_recipe_id,
             store_type=resolved_store_type,
             strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            cache=cache,
+            profile=run_profile,
+            journal=run_journal,
+            keep_backup=keep_backup,
+            output_dir=output_dir,
+            writers=writers,
+            encoding=encoding,
         )
     )
@@ -5,8 +5,6 @@ from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Mapping
 
-import yaml
-
 from .models import DatasetMatcher, FixRef, Link, Recipe, RecipeDocument
 
 
@@ -70,6 +68,7 @@ class RecipeBuilder:
     _match: DatasetMatcherBuilder | DatasetMatcher | Mapping[str, Any] | None = None
     _steps: tuple[FixStepBuilder | FixRef | str | Mapping[str, Any], ...] = ()
     links: tuple[Link | Mapping[str, Any], ...] = ()
+    _encoding: Mapping[str, Any] = field(default_factory=dict)
 
     def match(
         self,
@@ -93,6 +92,10 @@ class RecipeBuilder:
     def link(self, rel: str, href: str, title: str | None = None) -> RecipeBuilder:
         return replace(self, links=self.links + (Link(rel=rel, href=href, title=title),))
 
+    def encoding(self, **settings: Any) -> RecipeBuilder:
+        """Set the output encoding, e.g. ``encoding(compressor="zlib", chunk_bytes="16M")``."""
+        return replace(self, _encoding={**self._encoding, **settings})
+
     def to_model(self) -> Recipe:
         payload: dict[str, Any] = {
             "id": self.id,
@@ -100,6 +103,7 @@ class RecipeBuilder:
             "description": self.description,
             "steps": [self._step_model(step) for step in self._steps],
             "links": list(_coerce_links(self.links)),
+            "encoding": dict(self._encoding),
         }
         if self._match is not None:
             payload["match"] = self._match_model(self._match)
@@ -119,6 +123,8 @@ class RecipeBuilder:
         return _write_optional(path, text)
 
     def to_yaml(self, path: str | Path | None = None, *, schema_version: int = 1) -> str:
+        import yaml
+
         text = yaml.safe_dump(
             self.to_document_payload(schema_version=schema_version),
             sort_keys=False,
@@ -167,6 +173,8 @@ class RecipeDocumentBuilder:
         return _write_optional(path, text)
 
     def to_yaml(self, path: str | Path | None = None) -> str:
+        import yaml
+
         text = yaml.safe_dump(self.to_payload(), sort_keys=False)
         return _write_optional(path, text)
 
@@ -7,6 +7,12 @@ from importlib.resources import as_file, files
 from pathlib import Path
 from typing import Iterable
 
+from woodpecker.fixes.plugins import (
+    PluginManifest,
+    plugin_versions,
+    read_plugin_manifest,
+    warn_plugin_failure,
+)
 from woodpecker.recipes.models import Recipe, RecipeDocument
 from woodpecker.stores.catalog import RecipeCatalog
 from woodpecker.stores.json_store import JsonRecipeStore
@@ -118,7 +124,16 @@ class RecipeLoader:
 
     def _load_package_documents(self, packages: Iterable[str]) -> list[RecipeDocumentSource]:
         sources: list[RecipeDocumentSource] = []
+        versions = plugin_versions()
         for package in packages:
+            try:
+                manifest = read_plugin_manifest(package, versions.get(package))
+            except Exception as exc:
+                warn_plugin_failure(package, exc, "Scanning its recipe directory instead.")
+                manifest = None
+            if manifest is not None:
+                sources.extend(self._load_manifest_documents(manifest))
+                continue
             try:
                 recipe_dir = files(package).joinpath(self.resource_dir)
                 if not recipe_dir.is_dir():
@@ -140,6 +155,19 @@ class RecipeLoader:
                 )
         return sources
 
+    def _load_manifest_documents(self, manifest: PluginManifest) -> list[RecipeDocumentSource]:
+        """Load the recipe files listed by a plugin manifest without importing the plugin."""
+        sources: list[RecipeDocumentSource] = []
+        prefix = f"{self.resource_dir}/"
+        for name, path in zip(manifest.recipes, manifest.recipe_paths()):
+            if not name.startswith(prefix) or not _is_supported_recipe_file(path):
+                continue
+            recipes = tuple(JsonRecipeStore(path).list_recipes())
+            sources.append(
+                RecipeDocumentSource(label=f"package:{manifest.package}/{name}", recipes=recipes)
+            )
+        return sources
+
 
 def load_recipe(path: str | Path) -> Recipe:
     recipes = RecipeLoader().load_document(path).recipes
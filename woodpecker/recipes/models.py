@@ -13,6 +13,7 @@ from pydantic import (
 )
 
 from woodpecker.fixes.identifiers import IdentifierRules, IdentifierSet
+from woodpecker.io.encoding import EncodingPolicy
 
 
 def _string_or_empty(value: object) -> str:
@@ -163,6 +164,7 @@ class Recipe(BaseModel):
     match: DatasetMatcher | None = None
     steps: list[FixRef] = Field(default_factory=list)
     links: list[Link] = Field(default_factory=list)
+    encoding: dict[str, Any] = Field(default_factory=dict)
     runtime_metadata: RecipeRuntimeMetadata | None = Field(default=None, repr=False, exclude=True)
 
     @field_validator("description", mode="before")
@@ -236,6 +238,12 @@ class Recipe(BaseModel):
     def _coerce_links(cls, v: object) -> list[Any]:
         return _list_or_empty(v, label="Recipe.links")
 
+    @field_validator("encoding", mode="before")
+    @classmethod
+    def _validate_encoding(cls, v: object) -> dict[str, Any]:
+        encoding = _dict_or_empty(v, label="Recipe.encoding")
+        return EncodingPolicy.from_mapping(encoding).as_dict()
+
     @model_validator(mode="after")
     def _scope_fix_refs(self) -> Recipe:
         """Scope local fix refs to this recipe prefix."""
@@ -280,6 +288,10 @@ class Recipe(BaseModel):
         options = {self.resolve_fix_identifier(ref): dict(ref.options) for ref in self.steps}
         return identifiers, options
 
+    def encoding_policy(self) -> EncodingPolicy | None:
+        """Return the output encoding this recipe asks for, or None."""
+        return EncodingPolicy.from_mapping(self.encoding) if self.encoding else None
+
     def runtime_metadata_dump(self) -> dict[str, Any] | None:
         """Return optional runtime metadata for provenance/output contexts."""
         if self.runtime_metadata is None:
@@ -5,7 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Literal, Sequence
 
-from woodpecker.io import DataInput, normalize_inputs
+from woodpecker.io import DataInput, InputScan, ManifestInput
+from woodpecker.io.dataset_cache import load_cached_header
+from woodpecker.io.encoding import EncodingPolicy
 from woodpecker.recipes.models import Recipe
 from woodpecker.selection import select_fixes
 from woodpecker.stores.base import RecipeStore
@@ -22,7 +24,7 @@ class RunContext:
     - with no recipe/store source, direct registry selection is used
     """
 
-    inputs: list[DataInput]
+    inputs: InputScan
     fixes: list[Any]
     selected_recipes: list[Recipe]
     resolved_dataset: str | None
@@ -31,6 +33,7 @@ class RunContext:
     resolved_fix_options: dict[str, dict[str, Any]]
     resolved_output_format: str
     source: Literal["direct", "store"]
+    resolved_encoding: EncodingPolicy | None = None
 
 
 def normalize_ordered_identifiers(identifiers: Sequence[str]) -> tuple[str, ...]:
@@ -81,10 +84,20 @@ def _finalize_matching_recipes(
     return matches
 
 
-def _iter_store_matches(inputs: Sequence[DataInput], store: RecipeStore) -> list[Recipe]:
+def _iter_store_matches(inputs: Iterable[DataInput], store: RecipeStore) -> list[Recipe]:
     out: list[Recipe] = []
+    declared_recipes: dict[str, Recipe] = {}
     for data_input in inputs:
-        dataset = data_input.load()
+        declared = str(data_input.metadata.get("recipe_id") or "").strip()
+        if declared:
+            # The recipe was named up front (e.g. in a manifest), so the input is not opened.
+            if declared not in declared_recipes:
+                declared_recipes[declared] = store.get_recipe(declared)
+                out.append(declared_recipes[declared])
+            continue
+        # Matching reads metadata only; with a run-wide dataset cache the header
+        # opened here is reused when the input is checked or fixed.
+        dataset = load_cached_header(data_input)
         try:
             out.extend(store.lookup(dataset, path=data_input.reference))
         finally:
@@ -97,7 +110,7 @@ def _iter_store_matches(inputs: Sequence[DataInput], store: RecipeStore) -> list
 def select_matching_store_recipes(
     *,
     store: RecipeStore,
-    inputs: Sequence[DataInput],
+    inputs: Iterable[DataInput],
     recipe_id: str | None,
 ) -> list[Recipe]:
     return _finalize_matching_recipes(
@@ -119,7 +132,7 @@ def _store_recipe_result(
 def _resolve_store_recipe(
     *,
     store: RecipeStore,
-    inputs: Sequence[DataInput],
+    inputs: Iterable[DataInput],
     recipe_id: str | None,
     empty_message: str,
 ) -> tuple[Literal["store"], list[Recipe], tuple[str, ...], dict[str, dict[str, Any]]]:
@@ -134,7 +147,7 @@ def _resolve_store_recipe(
 
 def resolve_recipe_source(
     *,
-    inputs: Sequence[DataInput],
+    inputs: Iterable[DataInput],
     store_type: str,
     recipe_location: Path | None,
     recipe_id: str | None,
@@ -175,6 +188,11 @@ def resolve_recipe_source(
     )
 
 
+def recipe_encoding(recipes: Sequence[Recipe]) -> EncodingPolicy | None:
+    """Return the output encoding of the selected recipe, if it sets one."""
+    return recipes[0].encoding_policy() if recipes else None
+
+
 def resolve_target_paths(paths: tuple[Path, ...]) -> list[Path]:
     if paths:
         return list(paths)
@@ -204,9 +222,21 @@ def resolve_run_context(
     categories: tuple[str, ...],
     identifiers: tuple[str, ...],
     output_format: str,
+    include: tuple[str, ...] = (),
+    exclude: tuple[str, ...] = (),
+    max_depth: int | None = None,
+    manifests: tuple[Path, ...] = (),
+    shard_grouping: str | None = None,
 ) -> RunContext:
-    target_paths = resolve_target_paths(paths)
-    inputs = normalize_inputs(target_paths)
+    target_paths: list[Any] = resolve_target_paths(paths) if paths or not manifests else []
+    target_paths.extend(ManifestInput(source_path=path) for path in manifests)
+    inputs = InputScan(
+        target_paths,
+        include=include,
+        exclude=exclude,
+        max_depth=max_depth,
+        shard_grouping=shard_grouping,
+    )
 
     source, selected_recipes, source_identifiers, source_fix_options = resolve_recipe_source(
         inputs=inputs,
@@ -245,6 +275,7 @@ def resolve_run_context(
         resolved_fix_options=resolved_fix_options,
         resolved_output_format=resolved_output_format,
         source=source,
+        resolved_encoding=recipe_encoding(selected_recipes),
     )
 
 
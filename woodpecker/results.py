@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Mapping
 
 
@@ -9,6 +9,7 @@ class CheckResult:
     """Structured result returned by ``woodpecker.check()``."""
 
     findings: tuple[Mapping[str, str], ...]
+    stats: Mapping[str, Any] = field(default_factory=dict)
 
     def __bool__(self) -> bool:
         return self.count > 0
@@ -33,6 +34,12 @@ class CheckResult:
     def fix_ids(self) -> tuple[str, ...]:
         return tuple(finding.get("fix_id", "") for finding in self.findings)
 
+    @property
+    def timings(self) -> Mapping[str, Any]:
+        """Timing totals and events recorded when the check was profiled."""
+
+        return self.stats.get("timings", {})
+
 
 @dataclass(frozen=True)
 class FixResult:
@@ -81,6 +88,20 @@ class FixResult:
     def failed(self) -> int:
         return self.stats.get("persist_failed", 0)
 
+    @property
+    def cache_hits(self) -> int:
+        return self.stats.get("cache_hits", 0)
+
+    @property
+    def cache_misses(self) -> int:
+        return self.stats.get("cache_misses", 0)
+
+    @property
+    def timings(self) -> Mapping[str, Any]:
+        """Timing totals and events recorded when the fix run was profiled."""
+
+        return self.stats.get("timings", {})
+
     @property
     def preview(self) -> tuple[Mapping[str, Any], ...]:
         """Per-input fix applications reported by dry-run/write execution."""
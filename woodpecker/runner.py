@@ -1,17 +1,60 @@
 from __future__ import annotations
 
+import contextvars
 import json
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Iterable, TypedDict
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypedDict,
+    TypeVar,
+)
 
+from woodpecker.cache import ResultCache
+from woodpecker.fixes.base import DataAccess
 from woodpecker.fixes.labels import LabelRegistry
-from woodpecker.identity import dataset_type_matches_declared, resolve_dataset_identity
+from woodpecker.identity import (
+    DatasetIdentity,
+    dataset_type_matches_declared,
+    identity_from_metadata,
+    resolve_dataset_identity,
+)
 from woodpecker.io import DataInput, get_output_adapter
-from woodpecker.io.runtime import strict_io_mode
+from woodpecker.io.base import OutputAdapter, select_variables
+from woodpecker.io.dataset_cache import active_dataset_cache
+from woodpecker.io.encoding import EncodingPolicy, encoding_policy
+from woodpecker.io.runtime import (
+    backup_mode,
+    chunked_io_mode,
+    encoding_mode,
+    normalize_chunks,
+    serialized_io,
+    strict_io_mode,
+)
+from woodpecker.journal import RunJournal
+from woodpecker.profiling import PhaseTimer, RunProfile, summarize_timings, timed
+from woodpecker.scheduling import input_size, parse_byte_size, validate_schedule
 
 if TYPE_CHECKING:
     from woodpecker.recipes.models import Recipe
 
+T = TypeVar("T")
+_PENDING_PER_JOB = 4
+
 
 class FixPreview(TypedDict):
     """Per-input fix application preview emitted by run_fix."""
@@ -25,52 +68,819 @@ class FixPreview(TypedDict):
     changed: bool
 
 
-class FixRunStats(TypedDict):
-    """Structured stats emitted by run_fix."""
+class _ProfiledFixRunStats(TypedDict, total=False):
+    timings: dict[str, Any]
+
+
+class FixRunStats(_ProfiledFixRunStats):
+    """Structured stats emitted by run_fix; ``timings`` is only set for profiled runs."""
 
     attempted: int
     changed: int
     persist_attempted: int
     persisted: int
     persist_failed: int
+    cache_hits: int
+    cache_misses: int
     preview: list[FixPreview]
 
 
+def _validate_jobs(jobs: int) -> int:
+    if not isinstance(jobs, int) or isinstance(jobs, bool) or jobs < 1:
+        raise ValueError(f"jobs must be a positive integer, got {jobs!r}")
+    return jobs
+
+
+def _validate_writers(writers: int) -> int:
+    if not isinstance(writers, int) or isinstance(writers, bool) or writers < 0:
+        raise ValueError(f"writers must be a non-negative integer, got {writers!r}")
+    return writers
+
+
+def _scheduling(schedule: str, max_inflight_memory: int | str | None) -> dict[str, Any]:
+    return {
+        "schedule": validate_schedule(schedule),
+        "max_inflight_memory": parse_byte_size(max_inflight_memory),
+    }
+
+
+def _map_inputs(
+    worker: Callable[[DataInput], T],
+    inputs: Iterable[DataInput],
+    *,
+    jobs: int,
+    precomputed: Callable[[DataInput], T | None] | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | None = None,
+) -> Iterator[T]:
+    """Run *worker* per input and yield results in input order.
+
+    With ``jobs > 1`` path-based inputs are fanned out to a process pool, keeping
+    at most a few submissions per worker in flight so results stream instead of
+    piling up. In-memory inputs stay in this process so in-place fixes still
+    mutate the caller's dataset. Inputs for which *precomputed* returns a result
+    are not run at all. A size-aware *schedule* or *max_inflight_memory* switches
+    to :func:`_map_inputs_by_size`.
+    """
+    if jobs == 1:
+        for data_input in inputs:
+            result = precomputed(data_input) if precomputed is not None else None
+            yield worker(data_input) if result is None else result
+        return
+    if schedule != "input" or max_inflight_memory is not None:
+        yield from _map_inputs_by_size(
+            worker,
+            inputs,
+            jobs=jobs,
+            precomputed=precomputed,
+            largest_first=schedule == "largest-first",
+            max_inflight_memory=max_inflight_memory,
+        )
+        return
+
+    max_pending = jobs * _PENDING_PER_JOB
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: deque[Future[T] | DataInput] = deque()
+        for data_input in inputs:
+            result = precomputed(data_input) if precomputed is not None else None
+            if result is not None:
+                done: Future[T] = Future()
+                done.set_result(result)
+                pending.append(done)
+            elif data_input.source_path is None:
+                pending.append(data_input)
+            else:
+                pending.append(executor.submit(worker, data_input))
+            while len(pending) > max_pending:
+                yield _resolve_pending(worker, pending.popleft())
+        while pending:
+            yield _resolve_pending(worker, pending.popleft())
+
+
+def _map_inputs_by_size(
+    worker: Callable[[DataInput], T],
+    inputs: Iterable[DataInput],
+    *,
+    jobs: int,
+    precomputed: Callable[[DataInput], T | None] | None,
+    largest_first: bool,
+    max_inflight_memory: int | None,
+) -> Iterator[T]:
+    """Pool variant of _map_inputs that schedules path-based inputs by on-disk size.
+
+    All inputs are collected up front. With *largest_first*, the biggest inputs
+    are submitted first so they do not dominate the tail of the run. The summed
+    size of submitted but unfinished inputs stays within *max_inflight_memory*,
+    except that one input is always allowed to run on its own. Results are
+    buffered and still yielded in input order.
+    """
+    items = list(inputs)
+    local: dict[int, T | None] = {}
+    sizes: dict[int, int] = {}
+    for index, data_input in enumerate(items):
+        result = precomputed(data_input) if precomputed is not None else None
+        if result is not None or data_input.source_path is None:
+            local[index] = result
+        else:
+            sizes[index] = input_size(data_input)
+    queue = deque(sorted(sizes, key=lambda index: -sizes[index]) if largest_first else sizes)
+
+    max_pending = jobs * _PENDING_PER_JOB
+    results: dict[int, T] = {}
+    running: dict[Future[T], int] = {}
+    inflight = 0
+    next_index = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        while next_index < len(items):
+            while queue and len(running) < max_pending:
+                size = sizes[queue[0]]
+                if (
+                    running
+                    and max_inflight_memory is not None
+                    and inflight + size > max_inflight_memory
+                ):
+                    break
+                index = queue.popleft()
+                running[executor.submit(worker, items[index])] = index
+                inflight += size
+            if next_index in local:
+                result = local.pop(next_index)
+                yield worker(items[next_index]) if result is None else result
+                next_index += 1
+                continue
+            if next_index not in results:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    inflight -= sizes[index]
+                    results[index] = future.result()
+                continue
+            yield results.pop(next_index)
+            next_index += 1
+
+
+def _resolve_pending(worker: Callable[[DataInput], T], item: Future[T] | DataInput) -> T:
+    return item.result() if isinstance(item, Future) else worker(item)
+
+
+def _close_dataset(dataset: Any) -> None:
+    close = getattr(dataset, "close", None)
+    if callable(close):
+        close()
+
+
+def _cache_keys(
+    cache: ResultCache | None, data_input: DataInput, fixes: tuple[Any, ...], kind: str
+) -> list[str] | None:
+    if cache is None:
+        return None
+    fingerprint = cache.fingerprint(data_input)
+    if fingerprint is None:
+        return None
+    return [cache.key(fingerprint, kind, fix) for fix in fixes]
+
+
+def _cached_entries(cache: ResultCache | None, keys: list[str] | None, count: int) -> list[Any]:
+    if cache is None or keys is None:
+        return [None] * count
+    return [cache.get(key) for key in keys]
+
+
+def _requires_data(fix: Any) -> bool:
+    reads = getattr(fix, "reads", None)
+    if isinstance(reads, DataAccess):
+        return reads.data
+    return bool(getattr(fix, "requires_data", True))
+
+
+def _read_variables(fixes: Iterable[Any]) -> set[str] | None:
+    """Return the variables declared as read by *fixes*, or None if any may read all."""
+    names: set[str] = set()
+    for fix in fixes:
+        reads = getattr(fix, "reads", None)
+        if not isinstance(reads, DataAccess) or reads.variables is None:
+            return None
+        names.update(reads.variables)
+    return names
+
+
+def _load_input(data_input: DataInput, fixes: Iterable[Any], *, partial: bool) -> Any:
+    """Load *data_input* for *fixes*.
+
+    With ``partial`` (check and dry-run fix), the input is opened header-only when
+    no fix reads array values, and only declared read variables are loaded.
+    Header-only loads go through the active dataset cache; other loads drop
+    the input's cached handles first, since they may be followed by a write.
+    """
+    cache = active_dataset_cache()
+    if not partial:
+        if cache is not None:
+            cache.invalidate(data_input)
+        return data_input.load()
+    fixes = list(fixes)
+    header_only = not any(_requires_data(fix) for fix in fixes)
+    variables = _read_variables(fixes)
+    if header_only and cache is not None:
+        dataset = cache.load_header(data_input)
+        return dataset if variables is None else select_variables(dataset, variables)
+    if variables is not None:
+        return data_input.load_subset(variables, header_only=header_only)
+    return data_input.load_header() if header_only else data_input.load()
+
+
+def _declared_fixes(fixes: Iterable[Any], identity: DatasetIdentity | None) -> list[Any]:
+    """Drop *fixes* declared for another dataset type than the input's declared *identity*."""
+    if identity is None:
+        return list(fixes)
+    return [
+        fix
+        for fix in fixes
+        if dataset_type_matches_declared(getattr(fix, "dataset", None), identity.dataset_type)
+    ]
+
+
+def _load_for_fixes(
+    data_input: DataInput,
+    fixes: list[Any],
+    declared: DatasetIdentity | None,
+    *,
+    partial: bool,
+    timer: PhaseTimer | None,
+) -> tuple[Any, DatasetIdentity]:
+    """Load *data_input* and resolve its identity, using identity declared in its metadata.
+
+    When the declared identity rules out every fix, the input is not opened
+    and the returned dataset is None.
+    """
+    if declared is not None and not fixes:
+        return None, declared
+    with timed(timer, "load"):
+        dataset = _load_input(data_input, fixes, partial=partial)
+    if declared is not None:
+        return dataset, declared
+    with timed(timer, "identity"):
+        return dataset, resolve_dataset_identity(dataset)
+
+
+def _is_cacheable(dataset: Any) -> bool:
+    attrs = getattr(dataset, "attrs", {}) or {}
+    return not attrs.get("_woodpecker_load_failed")
+
+
+def _check_messages(
+    dataset: Any, dataset_type: str | None, fix: Any, timer: PhaseTimer | None = None
+) -> list[Any]:
+    if not dataset_type_matches_declared(getattr(fix, "dataset", None), dataset_type):
+        return []
+    fix_id = getattr(fix, "id", "")
+    with timed(timer, "matches", fix_id):
+        matched = fix.matches(dataset)
+    if not matched:
+        return []
+    with timed(timer, "check", fix_id):
+        return list(fix.check(dataset))
+
+
+def _finding(data_input: DataInput, fix: Any, message: Any) -> dict[str, str]:
+    labels = _fix_labels(fix)
+    return {
+        "path": data_input.reference,
+        "fix_id": getattr(fix, "id", ""),
+        "name": fix.name,
+        "labels": labels,
+        "label_titles": [LabelRegistry.title(label) for label in labels],
+        "label_metadata": [LabelRegistry.metadata(label) for label in labels],
+        "message": message,
+    }
+
+
+def _check_input(
+    data_input: DataInput,
+    *,
+    fixes: tuple[Any, ...],
+    strict_io: bool,
+    chunks: Any = None,
+    cache: ResultCache | None = None,
+    profile: bool = False,
+) -> tuple[list[dict[str, str]], bool | None, list[Any]]:
+    """Check one input and report whether it was served from *cache*.
+
+    The second item is None when the input was not eligible for caching; the
+    third holds timing events when *profile* is set.
+    """
+    timer = PhaseTimer(data_input.reference) if profile else None
+    keys = _cache_keys(cache, data_input, fixes, "check")
+    entries = _cached_entries(cache, keys, len(fixes))
+    if keys is not None and all(entry is not None for entry in entries):
+        findings = [
+            _finding(data_input, fix, message)
+            for fix, entry in zip(fixes, entries)
+            for message in entry["messages"]
+        ]
+        return findings, True, []
+
+    findings: list[dict[str, str]] = []
+    declared = identity_from_metadata(data_input.metadata)
+    pending = _declared_fixes(
+        [fix for fix, entry in zip(fixes, entries) if entry is None], declared
+    )
+    with strict_io_mode(strict_io), chunked_io_mode(chunks):
+        dataset, identity = _load_for_fixes(
+            data_input, pending, declared, partial=True, timer=timer
+        )
+        store = cache is not None and keys is not None and _is_cacheable(dataset)
+        for index, fix in enumerate(fixes):
+            entry = entries[index]
+            if entry is None:
+                entry = {"messages": _check_messages(dataset, identity.dataset_type, fix, timer)}
+                if store:
+                    cache.put(keys[index], entry)
+            findings.extend(_finding(data_input, fix, message) for message in entry["messages"])
+        with timed(timer, "close"):
+            _close_dataset(dataset)
+    events = timer.events if timer is not None else []
+    return findings, None if keys is None else False, events
+
+
+def _record_check_results(
+    results: Iterator[tuple[list[dict[str, str]], bool | None, list[Any]]],
+    cache: ResultCache | None,
+    profile: RunProfile | None,
+) -> Iterator[dict[str, str]]:
+    for findings, cache_hit, events in results:
+        if cache is not None and cache_hit is not None:
+            cache.record(hit=cache_hit)
+        if profile is not None:
+            profile.record(events)
+        yield from findings
+
+
+def iter_check(
+    inputs: Iterable[DataInput],
+    fixes: Iterable[Any],
+    *,
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+) -> Iterator[dict[str, str]]:
+    """Yield check findings input by input as they are produced.
+
+    When *cache* is given, inputs whose results are all cached are answered
+    without loading them, and its hit/miss counters are updated as results
+    are consumed. Timing events are recorded into *profile* the same way.
+    With ``jobs > 1``, ``schedule="largest-first"`` submits the biggest inputs
+    first and *max_inflight_memory* (bytes, or a size such as ``"8G"``) caps
+    the on-disk size of inputs in flight. *chunks* (e.g. ``"auto"``) opens file
+    inputs as dask arrays instead of loading them into memory.
+    """
+    worker = partial(
+        _check_input,
+        fixes=tuple(fixes),
+        strict_io=strict_io,
+        chunks=normalize_chunks(chunks),
+        cache=cache,
+        profile=profile is not None,
+    )
+    scheduling = _scheduling(schedule, max_inflight_memory)
+    results = _map_inputs(worker, inputs, jobs=_validate_jobs(jobs), **scheduling)
+    return _record_check_results(results, cache, profile)
+
+
 def run_check(
     inputs: Iterable[DataInput],
     fixes: Iterable[Any],
     *,
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
 ) -> list[dict[str, str]]:
-    findings: list[dict[str, str]] = []
-    with strict_io_mode(strict_io):
+    return list(
+        iter_check(
+            inputs,
+            fixes,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            cache=cache,
+            profile=profile,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+        )
+    )
+
+
+def _empty_fix_stats() -> FixRunStats:
+    return {
+        "attempted": 0,
+        "changed": 0,
+        "persist_attempted": 0,
+        "persisted": 0,
+        "persist_failed": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "preview": [],
+    }
+
+
+_FIX_COUNTER_KEYS = (
+    "attempted",
+    "changed",
+    "persist_attempted",
+    "persisted",
+    "persist_failed",
+    "cache_hits",
+    "cache_misses",
+)
+
+
+def merge_fix_stats(parts: Iterable[FixRunStats], *, keep_preview: bool = True) -> FixRunStats:
+    """Sum per-input stats from iter_fix into one FixRunStats.
+
+    Pass ``keep_preview=False`` to keep only the counters when previews have
+    already been consumed, e.g. while streaming them.
+    """
+    total = _empty_fix_stats()
+    events: list[Any] = []
+    profiled = False
+    for part in parts:
+        for key in _FIX_COUNTER_KEYS:
+            total[key] += part.get(key, 0)
+        if keep_preview:
+            total["preview"].extend(part["preview"])
+        if "timings" in part:
+            profiled = True
+            events.extend(part["timings"].get("events", ()))
+    if profiled:
+        total["timings"] = summarize_timings(events)
+    return total
+
+
+def _record_fix_outcome(
+    stats: FixRunStats, data_input: DataInput, fix: Any, attempted: bool, changed: bool
+) -> None:
+    if attempted:
+        stats["attempted"] += 1
+        labels = _fix_labels(fix)
+        stats["preview"].append(
+            {
+                "path": data_input.reference,
+                "fix_id": getattr(fix, "id", ""),
+                "name": getattr(fix, "name", ""),
+                "labels": labels,
+                "label_titles": [LabelRegistry.title(label) for label in labels],
+                "label_metadata": [LabelRegistry.metadata(label) for label in labels],
+                "changed": changed,
+            }
+        )
+    if changed:
+        stats["changed"] += 1
+
+
+def _fix_input(
+    data_input: DataInput,
+    *,
+    fixes: tuple[Any, ...],
+    dry_run: bool,
+    force_apply: bool,
+    output_adapter: OutputAdapter | None,
+    embed_provenance_metadata: bool,
+    provenance_run_id: str | None,
+    strict_io: bool,
+    chunks: Any = None,
+    cache: ResultCache | None = None,
+    profile: bool = False,
+    keep_backup: bool = False,
+    encoding: EncodingPolicy | None = None,
+    writer: ThreadPoolExecutor | None = None,
+) -> FixRunStats | Future[FixRunStats]:
+    """Fix one input; with a *writer* pool, its save runs there and a Future is returned."""
+    stats = _empty_fix_stats()
+    # Saves overlap with the next inputs on writer threads, so CPU time is per thread.
+    timer = PhaseTimer(data_input.reference, per_thread=writer is not None) if profile else None
+    if timer is not None:
+        stats["timings"] = summarize_timings(timer.events)
+    kind = "fix-dry-run-forced" if force_apply else "fix-dry-run"
+    keys = _cache_keys(cache, data_input, fixes, kind) if dry_run else None
+    entries = _cached_entries(cache, keys, len(fixes))
+    if keys is not None and all(entry is not None for entry in entries):
+        for fix, entry in zip(fixes, entries):
+            _record_fix_outcome(stats, data_input, fix, entry["attempted"], entry["changed"])
+        stats["cache_hits"] += 1
+        return stats
+    if keys is not None:
+        stats["cache_misses"] += 1
+
+    declared = identity_from_metadata(data_input.metadata)
+    pending = _declared_fixes(
+        [fix for fix, entry in zip(fixes, entries) if entry is None], declared
+    )
+    # Background writers may be encoding earlier inputs through the same libraries.
+    with (
+        strict_io_mode(strict_io),
+        chunked_io_mode(chunks),
+        backup_mode(keep_backup),
+        serialized_io(),
+    ):
+        dataset, identity = _load_for_fixes(
+            data_input, pending, declared, partial=dry_run, timer=timer
+        )
+        store = cache is not None and keys is not None and _is_cacheable(dataset)
+        dataset_changed = False
+        applied_fix_ids: list[str] = []
+        for index, fix in enumerate(fixes):
+            fix_id = getattr(fix, "id", "")
+            entry = entries[index]
+            if entry is None:
+                attempted_fix, changed_fix = apply_configured_fix(
+                    dataset,
+                    fix,
+                    dataset_type=identity.dataset_type,
+                    dry_run=dry_run,
+                    force_apply=force_apply,
+                    fix_id=fix_id,
+                    timer=timer,
+                )
+                if store:
+                    cache.put(keys[index], {"attempted": attempted_fix, "changed": changed_fix})
+            else:
+                attempted_fix, changed_fix = entry["attempted"], entry["changed"]
+            _record_fix_outcome(stats, data_input, fix, attempted_fix, changed_fix)
+            if changed_fix:
+                dataset_changed = True
+                applied_fix_ids.append(fix_id)
+        save = dataset_changed and not dry_run
+        if save and embed_provenance_metadata:
+            dataset.attrs["woodpecker_provenance"] = json.dumps(
+                {
+                    "run_id": provenance_run_id or "",
+                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "source": data_input.reference,
+                    "applied_fix_ids": applied_fix_ids,
+                },
+                sort_keys=True,
+            )
+    finish = partial(
+        _finish_fix,
+        data_input,
+        dataset,
+        stats,
+        save=save,
+        output_adapter=output_adapter,
+        timer=timer,
+        strict_io=strict_io,
+        chunks=chunks,
+        keep_backup=keep_backup,
+        encoding=encoding,
+    )
+    if save and writer is not None:
+        # The writer task runs in a copy of this context, so it never shares I/O modes.
+        return writer.submit(contextvars.copy_context().run, finish)
+    return finish()
+
+
+def _finish_fix(
+    data_input: DataInput,
+    dataset: Any,
+    stats: FixRunStats,
+    *,
+    save: bool,
+    output_adapter: OutputAdapter | None,
+    timer: PhaseTimer | None,
+    strict_io: bool,
+    chunks: Any,
+    keep_backup: bool,
+    encoding: EncodingPolicy | None = None,
+) -> FixRunStats:
+    """Save a fixed dataset if *save* is set, close it, and complete its *stats*."""
+    with (
+        strict_io_mode(strict_io),
+        chunked_io_mode(chunks),
+        backup_mode(keep_backup),
+        encoding_mode(encoding),
+    ):
+        if save:
+            stats["persist_attempted"] += 1
+            with timed(timer, "save"):
+                saved = data_input.save(dataset, dry_run=False, output_adapter=output_adapter)
+            if saved:
+                stats["persisted"] += 1
+            else:
+                stats["persist_failed"] += 1
+        with timed(timer, "close"), serialized_io():
+            _close_dataset(dataset)
+    if timer is not None:
+        stats["timings"] = summarize_timings(timer.events)
+    return stats
+
+
+def _iter_written(
+    results: Iterator[FixRunStats | Future[FixRunStats]],
+    writer: ThreadPoolExecutor | None,
+    lookahead: int,
+) -> Iterator[FixRunStats]:
+    """Yield fix stats in input order while up to *lookahead* saves run in *writer*.
+
+    The pool is shut down once the results are exhausted or abandoned, after
+    the saves already submitted have finished.
+    """
+    if writer is None:
+        yield from results  # type: ignore[misc]
+        return
+    pending: deque[FixRunStats | Future[FixRunStats]] = deque()
+    try:
+        for result in results:
+            pending.append(result)
+            while len(pending) > lookahead:
+                yield _written(pending.popleft())
+        while pending:
+            yield _written(pending.popleft())
+    finally:
+        writer.shutdown(wait=True)
+
+
+def _written(result: FixRunStats | Future[FixRunStats]) -> FixRunStats:
+    return result.result() if isinstance(result, Future) else result
+
+
+def iter_fix(
+    inputs: Iterable[DataInput],
+    fixes: Iterable[Any],
+    dry_run: bool = True,
+    force_apply: bool = False,
+    output_format: str = "auto",
+    embed_provenance_metadata: bool = False,
+    provenance_run_id: str | None = None,
+    strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
+) -> Iterator[FixRunStats]:
+    """Yield one FixRunStats per input as soon as that input is processed.
+
+    *cache* is only consulted for dry runs; applied fixes always load the input.
+    With a *journal*, every processed input is recorded as it completes, and
+    inputs already completed in a resumed journal yield their recorded stats
+    instead of being run again. With a *profile*, each input's stats carry
+    ``timings`` and their events are also recorded into *profile*.
+    *schedule*, *max_inflight_memory* and *chunks* work as in :func:`iter_check`;
+    chunked writes stream to disk chunk by chunk. Rewritten outputs replace
+    their target atomically; *keep_backup* keeps the replaced file or store
+    next to it with a ``.bak`` suffix.
+
+    With *output_dir*, fixed inputs are written below it in a tree mirroring
+    their paths relative to the working directory instead of next to them.
+    With ``writers > 0`` and ``jobs == 1``, saves run in a pool of that many
+    threads while the next inputs are loaded and fixed; at most *writers*
+    fixed datasets wait to be written, and stats still come in input order.
+    *encoding* (an :class:`~woodpecker.io.encoding.EncodingPolicy` or its
+    mapping form) sets the compression and chunking of rewritten outputs.
+    """
+    fixes = tuple(fixes)
+    output_adapter = get_output_adapter(output_format, output_dir=output_dir)
+    writers = _validate_writers(writers)
+    jobs = _validate_jobs(jobs)
+    # Worker processes already overlap loading and writing across inputs.
+    writer = (
+        ThreadPoolExecutor(max_workers=writers, thread_name_prefix="woodpecker-writer")
+        if writers and jobs == 1 and not dry_run
+        else None
+    )
+    chunks = normalize_chunks(chunks)
+    policy = encoding_policy(encoding)
+    worker = partial(
+        _fix_input,
+        fixes=fixes,
+        dry_run=dry_run,
+        force_apply=force_apply,
+        output_adapter=output_adapter,
+        embed_provenance_metadata=embed_provenance_metadata,
+        provenance_run_id=provenance_run_id,
+        strict_io=strict_io,
+        chunks=chunks,
+        cache=cache,
+        profile=profile is not None,
+        keep_backup=keep_backup,
+        encoding=policy,
+        writer=writer,
+    )
+    scheduling = _scheduling(schedule, max_inflight_memory)
+    dataset_cache = active_dataset_cache()
+    if dataset_cache is not None and jobs > 1 and not dry_run:
+        # Workers rewrite inputs this process may still hold open.
+        dataset_cache.clear()
+    if journal is None:
+        results = _map_inputs(worker, inputs, jobs=jobs, **scheduling)
+        return _record_fix_timings(_iter_written(results, writer, writers), profile)
+
+    completed = journal.open(
+        {
+            "fixes": [
+                {"id": getattr(fix, "id", ""), "config": getattr(fix, "config", {}) or {}}
+                for fix in fixes
+            ],
+            "dry_run": dry_run,
+            "force_apply": force_apply,
+            "output_format": output_format,
+            # Where and how outputs are written, so a resume cannot skip
+            # inputs whose outputs went to another directory or layout.
+            "output_dir": None if output_dir is None else str(Path(output_dir).resolve()),
+            "encoding": None if policy is None else policy.as_dict(),
+            "chunks": chunks,
+        }
+    )
+
+    def resumed(data_input: DataInput) -> FixRunStats | None:
+        if data_input.source_path is None:
+            return None
+        return completed.get(data_input.reference)
+
+    results = _iter_journaled(
+        worker,
+        inputs,
+        jobs=jobs,
+        scheduling=scheduling,
+        journal=journal,
+        resumed=resumed,
+        output_target=partial(_output_target, dry_run=dry_run, output_adapter=output_adapter),
+        writer=writer,
+        lookahead=writers,
+    )
+    return _record_fix_timings(results, profile)
+
+
+def _record_fix_timings(
+    results: Iterator[FixRunStats], profile: RunProfile | None
+) -> Iterator[FixRunStats]:
+    if profile is None:
+        return results
+    return _iter_recording_timings(results, profile)
+
+
+def _iter_recording_timings(
+    results: Iterator[FixRunStats], profile: RunProfile
+) -> Iterator[FixRunStats]:
+    for stats in results:
+        profile.record(stats.get("timings", {}).get("events", ()))
+        yield stats
+
+
+def _output_target(
+    data_input: DataInput,
+    stats: FixRunStats,
+    *,
+    dry_run: bool,
+    output_adapter: OutputAdapter | None,
+) -> str | None:
+    if dry_run or not stats["persisted"]:
+        return None
+    if output_adapter is not None:
+        return str(output_adapter.target_path(data_input))
+    return data_input.reference
+
+
+def _iter_journaled(
+    worker: Callable[[DataInput], FixRunStats],
+    inputs: Iterable[DataInput],
+    *,
+    jobs: int,
+    scheduling: dict[str, Any],
+    journal: RunJournal,
+    resumed: Callable[[DataInput], FixRunStats | None],
+    output_target: Callable[[DataInput, FixRunStats], str | None],
+    writer: ThreadPoolExecutor | None = None,
+    lookahead: int = 0,
+) -> Iterator[FixRunStats]:
+    # _map_inputs pulls each input before yielding its result, so the queue
+    # pairs every result with the input it belongs to.
+    seen: deque[DataInput] = deque()
+
+    def tracked() -> Iterator[DataInput]:
         for data_input in inputs:
-            dataset = data_input.load()
-            identity = resolve_dataset_identity(dataset)
-            for fix in fixes:
-                if not dataset_type_matches_declared(
-                    getattr(fix, "dataset", None), identity.dataset_type
-                ):
-                    continue
-                if not fix.matches(dataset):
-                    continue
-                for message in fix.check(dataset):
-                    labels = _fix_labels(fix)
-                    findings.append(
-                        {
-                            "path": data_input.reference,
-                            "fix_id": getattr(fix, "id", ""),
-                            "name": fix.name,
-                            "labels": labels,
-                            "label_titles": [LabelRegistry.title(label) for label in labels],
-                            "label_metadata": [LabelRegistry.metadata(label) for label in labels],
-                            "message": message,
-                        }
-                    )
-            close = getattr(dataset, "close", None)
-            if callable(close):
-                close()
-    return findings
+            seen.append(data_input)
+            yield data_input
+
+    results = _map_inputs(worker, tracked(), jobs=jobs, precomputed=resumed, **scheduling)
+    for stats in _iter_written(results, writer, lookahead):
+        data_input = seen.popleft()
+        if resumed(data_input) is None:
+            journal.record(data_input.reference, stats, output=output_target(data_input, stats))
+        yield stats
 
 
 def run_fix(
@@ -82,75 +892,41 @@ def run_fix(
     embed_provenance_metadata: bool = False,
     provenance_run_id: str | None = None,
     strict_io: bool = False,
+    chunks: Any = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    journal: RunJournal | None = None,
+    profile: RunProfile | None = None,
+    schedule: str = "input",
+    max_inflight_memory: int | str | None = None,
+    keep_backup: bool = False,
+    output_dir: str | Path | None = None,
+    writers: int = 0,
+    encoding: EncodingPolicy | Mapping[str, Any] | None = None,
 ) -> FixRunStats:
-    changed = 0
-    attempted = 0
-    persist_attempted = 0
-    persisted = 0
-    persist_failed = 0
-    preview: list[FixPreview] = []
-    output_adapter = get_output_adapter(output_format)
-    with strict_io_mode(strict_io):
-        for data_input in inputs:
-            dataset = data_input.load()
-            identity = resolve_dataset_identity(dataset)
-            dataset_changed = False
-            applied_fix_ids: list[str] = []
-            for fix in fixes:
-                fix_id = getattr(fix, "id", "")
-                attempted_fix, changed_fix = apply_configured_fix(
-                    dataset,
-                    fix,
-                    dataset_type=identity.dataset_type,
-                    dry_run=dry_run,
-                    force_apply=force_apply,
-                    fix_id=fix_id,
-                )
-                if attempted_fix:
-                    attempted += 1
-                    labels = _fix_labels(fix)
-                    preview.append(
-                        {
-                            "path": data_input.reference,
-                            "fix_id": fix_id,
-                            "name": getattr(fix, "name", ""),
-                            "labels": labels,
-                            "label_titles": [LabelRegistry.title(label) for label in labels],
-                            "label_metadata": [LabelRegistry.metadata(label) for label in labels],
-                            "changed": changed_fix,
-                        }
-                    )
-                if changed_fix:
-                    changed += 1
-                    dataset_changed = True
-                    applied_fix_ids.append(fix_id)
-            if dataset_changed and not dry_run:
-                if embed_provenance_metadata:
-                    dataset.attrs["woodpecker_provenance"] = json.dumps(
-                        {
-                            "run_id": provenance_run_id or "",
-                            "generated_at": datetime.now(timezone.utc).isoformat(),
-                            "source": data_input.reference,
-                            "applied_fix_ids": applied_fix_ids,
-                        },
-                        sort_keys=True,
-                    )
-                persist_attempted += 1
-                if data_input.save(dataset, dry_run=False, output_adapter=output_adapter):
-                    persisted += 1
-                else:
-                    persist_failed += 1
-            close = getattr(dataset, "close", None)
-            if callable(close):
-                close()
-    return {
-        "attempted": attempted,
-        "changed": changed,
-        "persist_attempted": persist_attempted,
-        "persisted": persisted,
-        "persist_failed": persist_failed,
-        "preview": preview,
-    }
+    return merge_fix_stats(
+        iter_fix(
+            inputs,
+            fixes,
+            dry_run=dry_run,
+            force_apply=force_apply,
+            output_format=output_format,
+            embed_provenance_metadata=embed_provenance_metadata,
+            provenance_run_id=provenance_run_id,
+            strict_io=strict_io,
+            chunks=chunks,
+            jobs=jobs,
+            cache=cache,
+            journal=journal,
+            profile=profile,
+            schedule=schedule,
+            max_inflight_memory=max_inflight_memory,
+            keep_backup=keep_backup,
+            output_dir=output_dir,
+            writers=writers,
+            encoding=encoding,
+        )
+    )
 
 
 def apply_configured_fix(
@@ -161,17 +937,22 @@ def apply_configured_fix(
     dry_run: bool,
     force_apply: bool,
     fix_id: str,
+    timer: PhaseTimer | None = None,
 ) -> tuple[bool, bool]:
     if not dataset_type_matches_declared(getattr(fix, "dataset", None), dataset_type):
         return False, False
 
-    if not force_apply and not fix.matches(dataset):
-        return False, False
+    if not force_apply:
+        with timed(timer, "matches", fix_id):
+            matched = fix.matches(dataset)
+        if not matched:
+            return False, False
 
     if not hasattr(fix, "apply"):
         raise TypeError(f"Fix function '{fix_id}' does not implement apply()")
 
-    return True, bool(fix.apply(dataset, dry_run=dry_run))
+    with timed(timer, "apply", fix_id):
+        return True, bool(fix.apply(dataset, dry_run=dry_run))
 
 
 def _fix_labels(fix: Any) -> list[str]:
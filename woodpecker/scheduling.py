@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from woodpecker.io import DataInput
+
+
+SCHEDULES = ("input", "largest-first")
+
+_SIZE_UNITS = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$", re.IGNORECASE)
+
+
+def validate_schedule(schedule: str) -> str:
+    if schedule not in SCHEDULES:
+        choices = ", ".join(SCHEDULES)
+        raise ValueError(f"schedule must be one of {choices}, got {schedule!r}")
+    return schedule
+
+
+def parse_byte_size(value: int | str | None) -> int | None:
+    """Parse a byte count such as ``1073741824``, ``512M`` or ``8GiB`` (binary units)."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid byte size: {value!r}")
+    if isinstance(value, int):
+        size = value
+    else:
+        match = _SIZE_PATTERN.match(str(value))
+        if match is None:
+            raise ValueError(f"Invalid byte size: {value!r}")
+        number, unit = match.groups()
+        size = int(float(number) * _SIZE_UNITS[unit.upper()])
+    if size < 1:
+        raise ValueError(f"Byte size must be positive, got {value!r}")
+    return size
+
+
+def input_size(data_input: DataInput) -> int:
+    """Return the on-disk size of *data_input* in bytes; 0 for in-memory inputs.
+
+    Directory stores such as Zarr are sized by the sum of their chunk and
+    metadata files, multi-file inputs by the sum of their shards. A ``size``
+    declared in the input metadata (e.g. by a manifest) is used without
+    touching the file system.
+    """
+    declared = data_input.metadata.get("size")
+    if isinstance(declared, int) and declared >= 0:
+        return declared
+    return sum(_path_size(path) for path in data_input.source_files())
+
+
+def _path_size(path: Path) -> int:
+    try:
+        if not path.is_dir():
+            return path.stat().st_size
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                total += os.stat(os.path.join(root, name)).st_size
+        return total
+    except OSError:
+        return 0
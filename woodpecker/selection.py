@@ -79,7 +79,8 @@ def select_fixes(
     if categories:
         filters["categories"] = list(categories) if len(categories) > 1 else categories[0]
 
-    fixes = FixFunctionRegistry.discover(filters=filters or None)
+    # Only the selected fixes are instantiated; filtering is an index lookup.
+    available = FixFunctionRegistry.discover_ids(filters=filters or None)
     selected_identifiers = _normalize_identifiers(identifiers)
     normalized_ordered_identifiers = _normalize_ordered_identifiers(ordered_identifiers)
     normalized_fix_options = _normalize_fix_options(fix_options)
@@ -100,18 +101,28 @@ def select_fixes(
     )
 
     if resolved_ordered_identifiers:
-        by_id = {getattr(fix, "id", ""): fix for fix in fixes}
-        missing = [item for item in resolved_ordered_identifiers if item not in by_id]
+        available_ids = set(available)
+        missing = [item for item in resolved_ordered_identifiers if item not in available_ids]
         if strict_identifiers and missing:
             raise ValueError(
                 "Selected fix identifier(s) not available with current dataset/category filters: "
                 + ", ".join(missing)
             )
-        selected = [by_id[item] for item in resolved_ordered_identifiers if item in by_id]
+        # Repeated identifiers share one instance, as with a lookup by id.
+        instances = {
+            item: FixFunctionRegistry.instantiate(item)
+            for item in resolved_ordered_identifiers
+            if item in available_ids
+        }
+        selected = [instances[item] for item in resolved_ordered_identifiers if item in instances]
     elif not resolved_selected_identifiers:
-        selected = fixes
+        selected = [FixFunctionRegistry.instantiate(item) for item in available]
     else:
-        selected = [fix for fix in fixes if getattr(fix, "id", "") in resolved_selected_identifiers]
+        selected = [
+            FixFunctionRegistry.instantiate(item)
+            for item in available
+            if item in resolved_selected_identifiers
+        ]
 
     if normalized_fix_options:
         for index, fix in enumerate(selected):
@@ -27,18 +27,19 @@ class AutoRecipeStore(RecipeStore):
         )
 
     def list_recipes(self) -> list[Recipe]:
-        return [self._recipe_from_fix(fix) for fix in FixFunctionRegistry.discover()]
+        return [self._recipe_from_fix(fix) for fix in FixFunctionRegistry.describe()]
 
     def lookup(self, dataset: Any, path: str | None = None) -> list[Recipe]:
         _ = path
         identity = resolve_dataset_identity(dataset)
+        index = FixFunctionRegistry.index()
         recipes: list[Recipe] = []
 
-        for fix in FixFunctionRegistry.discover():
-            if not dataset_type_matches_declared(
-                getattr(fix, "dataset", None), identity.dataset_type
-            ):
+        for fix_id in index.order:
+            # Fixes for other dataset types are skipped without being instantiated.
+            if not dataset_type_matches_declared(index.datasets[fix_id], identity.dataset_type):
                 continue
+            fix = FixFunctionRegistry.instantiate(fix_id)
             if not fix.matches(dataset):
                 continue
             recipes.append(self._recipe_from_fix(fix))
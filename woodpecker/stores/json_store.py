@@ -4,8 +4,6 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from ..recipes.matcher import recipe_matches_dataset
 from ..recipes.models import Recipe
 from .base import RecipeStore
@@ -17,6 +15,8 @@ class JsonRecipeStore(RecipeStore):
         self.path = Path(path)
         suffix = self.path.suffix.lower()
         if suffix in {".yaml", ".yml"}:
+            import yaml
+
             self._format_label = "YAML"
             self._loads = lambda text: yaml.safe_load(text) if text.strip() else []
             self._dumps = lambda payload: yaml.safe_dump(
@@ -104,6 +104,12 @@ def format_fixes(fixes: list[object], fmt: str) -> str:
     return "\n".join(lines)
 
 
+def format_jsonl_record(record: str, payload: Mapping[str, Any]) -> str:
+    """Format one streamed record as a single JSON line tagged with its record type."""
+
+    return json.dumps({"record": record, **payload})
+
+
 def format_findings(findings: list[dict[str, str]], fmt: str) -> str:
     """Format check findings for CLI output."""
 
@@ -115,6 +121,54 @@ def format_findings(findings: list[dict[str, str]], fmt: str) -> str:
     )
 
 
+def format_cache_stats(stats: Mapping[str, Any]) -> str:
+    """Format result-cache counters, or return an empty string when unused."""
+
+    hits = stats.get("cache_hits", 0)
+    misses = stats.get("cache_misses", 0)
+    if not hits and not misses:
+        return ""
+    return f"Result cache: {hits} hit(s), {misses} miss(es)."
+
+
+def _timing_rows(title: str, totals: Mapping[str, Mapping[str, Any]]) -> list[str]:
+    width = max([len(title), *(len(str(name)) for name in totals)])
+    lines = [
+        f"{title:<{width}}  {'count':>6}  {'wall s':>9}  {'cpu s':>9}  {'peak rss MiB':>12}",
+    ]
+    for name, item in totals.items():
+        lines.append(
+            f"{name:<{width}}  {item['count']:>6}  {item['wall']:>9.3f}  {item['cpu']:>9.3f}  "
+            f"{item['peak_rss_delta'] / 2**20:>12.1f}"
+        )
+    return lines
+
+
+def format_timings(timings: Mapping[str, Any], *, top: int = 10) -> str:
+    """Format a profiled run's timing totals as plain-text tables.
+
+    Phases are listed in run order; fixes and inputs are limited to the *top*
+    slowest by wall time.
+    """
+
+    phases = timings.get("phases") or {}
+    if not phases:
+        return ""
+
+    def slowest(key: str) -> dict[str, Mapping[str, Any]]:
+        items = sorted((timings.get(key) or {}).items(), key=lambda item: -item[1]["wall"])
+        return dict(items[:top])
+
+    lines = ["Profile:", *_timing_rows("phase", phases)]
+    fixes = slowest("fixes")
+    if fixes:
+        lines.extend(["", *_timing_rows("fix", fixes)])
+    inputs = slowest("inputs")
+    if inputs:
+        lines.extend(["", *_timing_rows("input", inputs)])
+    return "\n".join(lines)
+
+
 def format_fix_stats(
     stats: Mapping[str, Any],
     *,
@@ -125,16 +179,28 @@ def format_fix_stats(
     provenance: bool,
     provenance_path: Path,
 ) -> str:
-    """Format fix execution stats for CLI output."""
-
-    if fmt == "json":
-        payload = {
-            "mode": "dry-run" if dry_run else "write",
-            "force_apply": force_apply,
-            "output_format": resolved_output_format,
-            "provenance": str(provenance_path) if provenance else None,
-            **stats,
+    """Format fix execution stats for CLI output.
+
+    ``jsonl`` renders only the trailing summary record; previews are expected to
+    have been streamed already.
+    """
+
+    payload = {
+        "mode": "dry-run" if dry_run else "write",
+        "force_apply": force_apply,
+        "output_format": resolved_output_format,
+        "provenance": str(provenance_path) if provenance else None,
+        **stats,
+    }
+    if "timings" in stats:
+        # Raw events are exported separately; keep the summary compact.
+        payload["timings"] = {
+            key: value for key, value in stats["timings"].items() if key != "events"
         }
+    if fmt == "jsonl":
+        payload.pop("preview", None)
+        return format_jsonl_record("summary", payload)
+    if fmt == "json":
         return json.dumps(payload, indent=2)
 
     mode = "dry-run" if dry_run else "write"
@@ -149,6 +215,9 @@ def format_fix_stats(
         f"Fix run complete ({mode}): {stats['attempted']} fix applications attempted, "
         f"{stats['changed']} files changed."
     ]
+    cache_line = format_cache_stats(stats)
+    if cache_line:
+        lines.append(cache_line)
     if preview:
         lines.append("Preview:")
         for item in preview: